@@ -0,0 +1,191 @@
+from __future__ import annotations
+import argparse
+from collections.abc import Callable, Iterable
+from functools import reduce
+import gc
+from itertools import chain, filterfalse, islice
+import json
+import operator
+import platform
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from pyfluent.iterator import FluentIterator
+
+SIZES = {
+    'tiny': 3,
+    'small': 100,
+    'medium': 10000,
+    'large': 1000000,
+}
+
+
+def _noop(item: Any) -> None:
+    pass
+
+
+def _is_odd(item: int) -> bool:
+    return item % 2 == 1
+
+
+def _double(item: int) -> int:
+    return item * 2
+
+
+def _etl_fluent(data: List[int]) -> List[Any]:
+    return (FluentIterator(data)
+            .map(_double)
+            .filter(_is_odd)
+            .map(str)
+            .peek(_noop)
+            .filterfalse(operator.not_)
+            .map(len)
+            .enumerate()
+            .skip(1)
+            .collect())
+
+
+def _etl_raw(data: List[int]) -> List[Any]:
+    items = map(_double, data)
+    items = filter(_is_odd, items)
+    items = map(str, items)
+    items = (item for item in items if _noop(item) is None)
+    items = filterfalse(operator.not_, items)
+    items = map(len, items)
+    return list(islice(enumerate(items), 1, None))
+
+
+class Case(NamedTuple):
+    name: str
+    fluent: Callable[[Any], Any]
+    raw: Callable[[Any], Any]
+    nested: bool = False
+
+
+CASES = [
+    Case('collect', lambda data: FluentIterator(data).collect(), list),
+    Case('map', lambda data: FluentIterator(data).map(_double).collect(), lambda data: list(map(_double, data))),
+    Case('filter', lambda data: FluentIterator(data).filter(_is_odd).collect(),
+         lambda data: list(filter(_is_odd, data))),
+    Case('filterfalse', lambda data: FluentIterator(data).filterfalse(_is_odd).collect(),
+         lambda data: list(filterfalse(_is_odd, data))),
+    Case('peek', lambda data: FluentIterator(data).peek(_noop).collect(),
+         lambda data: [item for item in data if _noop(item) is None]),
+    Case('flatten', lambda data: FluentIterator(data).flatten().collect(),
+         lambda data: list(chain.from_iterable(data)), nested=True),
+    Case('enumerate', lambda data: FluentIterator(data).enumerate().collect(), lambda data: list(enumerate(data))),
+    Case('skip', lambda data: FluentIterator(data).skip(10).collect(), lambda data: list(islice(data, 10, None))),
+    Case('prepend', lambda data: FluentIterator(data).prepend([0]).collect(), lambda data: list(chain([0], data))),
+    Case('append', lambda data: FluentIterator(data).append([0]).collect(), lambda data: list(chain(data, [0]))),
+    Case('reduce', lambda data: FluentIterator(data).reduce(operator.add, 0),
+         lambda data: reduce(operator.add, data, 0)),
+    Case('allMatch', lambda data: FluentIterator(data).allMatch(bool), lambda data: all(map(bool, data))),
+    Case('first', lambda data: FluentIterator(data).map(_double).first(), lambda data: next(map(_double, data))),
+    Case('map_filter_chain', lambda data: FluentIterator(data).map(_double).filter(_is_odd).map(str).collect(),
+         lambda data: list(map(str, filter(_is_odd, map(_double, data))))),
+    Case('etl_chain', _etl_fluent, _etl_raw),
+]
+
+
+def _data(size: int, nested: bool) -> List[Any]:
+    if nested:
+        return [[item, item] for item in range(size // 2)]
+    return list(range(1, size + 1))
+
+
+def _timing(function: Callable[[Any], Any], data: Any, repeat: int) -> float:
+    timer = timeit.Timer(lambda: function(data))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+def _peak_memory(function: Callable[[Any], Any], data: Any) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function(data)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(sizes: Iterable[str], cases: Iterable[Case], repeat: int) -> Dict[str, Any]:
+    results = []
+    for size_name in sizes:
+        for case in cases:
+            data = _data(SIZES[size_name], case.nested)
+            fluent = _timing(case.fluent, data, repeat)
+            raw = _timing(case.raw, data, repeat)
+            results.append({
+                'case': case.name,
+                'size': size_name,
+                'items': SIZES[size_name],
+                'fluent_seconds': fluent,
+                'raw_seconds': raw,
+                'overhead': fluent / raw if raw else None,
+                'fluent_peak_bytes': _peak_memory(case.fluent, data),
+                'raw_peak_bytes': _peak_memory(case.raw, data),
+            })
+            print('%-20s %-7s fluent=%.3es raw=%.3es overhead=x%.2f' %
+                  (case.name, size_name, fluent, raw, results[-1]['overhead'] or 0), file=sys.stderr)
+    return {
+        'revision': _revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[str]:
+    previous = {(result['case'], result['size']): result for result in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        old = previous.get((result['case'], result['size']))
+        if old is None:
+            continue
+        ratio = result['fluent_seconds'] / old['fluent_seconds']
+        if ratio > 1 + threshold:
+            regressions.append('%s[%s]: %.3es -> %.3es (x%.2f)' %
+                               (result['case'], result['size'], old['fluent_seconds'], result['fluent_seconds'],
+                                ratio))
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark FluentIterator against raw itertools code.')
+    parser.add_argument('--sizes', nargs='+', choices=list(SIZES), default=list(SIZES))
+    parser.add_argument('--cases', nargs='+', choices=[case.name for case in CASES])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='write JSON results to this file')
+    parser.add_argument('--compare', help='JSON results of a previous run to compare against')
+    parser.add_argument('--threshold', type=float, default=0.1, help='allowed slowdown before failing, 0.1 = 10%%')
+    args = parser.parse_args(argv)
+
+    cases = [case for case in CASES if not args.cases or case.name in args.cases]
+    current = run(args.sizes, cases, args.repeat)
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(current, output, indent=2)
+    else:
+        json.dump(current, sys.stdout, indent=2)
+    if args.compare:
+        with open(args.compare) as baseline:
+            regressions = compare(json.load(baseline), current, args.threshold)
+        for regression in regressions:
+            print('REGRESSION %s' % regression, file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,232 @@
+from __future__ import annotations
+from collections.abc import Callable, Hashable, Iterator, Mapping
+from copy import copy
+import pickle
+import tempfile
+from typing import IO, Any, Dict, List, Optional, Tuple
+
+
+def _identity(item: Any) -> Any:
+    return item
+
+
+class Aggregator(object):
+
+    def __init__(self, value: Optional[Callable[[Any], Any]] = None) -> None:
+        super().__init__()
+        self.value = value or _identity
+
+    def create(self) -> Any:
+        raise NotImplementedError()
+
+    def add(self, accumulator: Any, item: Any) -> Any:
+        raise NotImplementedError()
+
+    def merge(self, left: Any, right: Any) -> Any:
+        raise NotImplementedError()
+
+    def result(self, accumulator: Any) -> Any:
+        return accumulator
+
+
+class Count(Aggregator):
+
+    def create(self) -> int:
+        return 0
+
+    def add(self, accumulator: int, item: Any) -> int:
+        return accumulator + 1
+
+    def merge(self, left: int, right: int) -> int:
+        return left + right
+
+
+class Sum(Aggregator):
+
+    def create(self) -> Any:
+        return 0
+
+    def add(self, accumulator: Any, item: Any) -> Any:
+        return accumulator + self.value(item)
+
+    def merge(self, left: Any, right: Any) -> Any:
+        return left + right
+
+
+class Min(Aggregator):
+
+    def create(self) -> Any:
+        return None
+
+    def add(self, accumulator: Any, item: Any) -> Any:
+        value = self.value(item)
+        return value if accumulator is None or value < accumulator else accumulator
+
+    def merge(self, left: Any, right: Any) -> Any:
+        if left is None:
+            return right
+        if right is None:
+            return left
+        return min(left, right)
+
+
+class Max(Aggregator):
+
+    def create(self) -> Any:
+        return None
+
+    def add(self, accumulator: Any, item: Any) -> Any:
+        value = self.value(item)
+        return value if accumulator is None or value > accumulator else accumulator
+
+    def merge(self, left: Any, right: Any) -> Any:
+        if left is None:
+            return right
+        if right is None:
+            return left
+        return max(left, right)
+
+
+class Mean(Aggregator):
+
+    def create(self) -> Tuple[Any, int]:
+        return (0, 0)
+
+    def add(self, accumulator: Tuple[Any, int], item: Any) -> Tuple[Any, int]:
+        return (accumulator[0] + self.value(item), accumulator[1] + 1)
+
+    def merge(self, left: Tuple[Any, int], right: Tuple[Any, int]) -> Tuple[Any, int]:
+        return (left[0] + right[0], left[1] + right[1])
+
+    def result(self, accumulator: Tuple[Any, int]) -> Optional[float]:
+        return accumulator[0] / accumulator[1] if accumulator[1] else None
+
+
+class Reduce(Aggregator):
+
+    def __init__(self,
+                 function: Callable[[Any, Any], Any],
+                 initializer: Any = None,
+                 combiner: Optional[Callable[[Any, Any], Any]] = None,
+                 value: Optional[Callable[[Any], Any]] = None) -> None:
+        super().__init__(value)
+        self.function = function
+        self.initializer = initializer
+        self.combiner = combiner or function
+
+    def create(self) -> Any:
+        return copy(self.initializer)
+
+    def add(self, accumulator: Any, item: Any) -> Any:
+        return self.function(accumulator, self.value(item))
+
+    def merge(self, left: Any, right: Any) -> Any:
+        return self.combiner(left, right)
+
+
+class Fields(Aggregator):
+
+    def __init__(self, aggregators: Mapping[str, Aggregator]) -> None:
+        super().__init__()
+        self.names = list(aggregators)
+        self.aggregators = [aggregators[name] for name in self.names]
+
+    def create(self) -> List[Any]:
+        return [aggregator.create() for aggregator in self.aggregators]
+
+    def add(self, accumulator: List[Any], item: Any) -> List[Any]:
+        for index, aggregator in enumerate(self.aggregators):
+            accumulator[index] = aggregator.add(accumulator[index], item)
+        return accumulator
+
+    def merge(self, left: List[Any], right: List[Any]) -> List[Any]:
+        return [aggregator.merge(*pair) for aggregator, pair in zip(self.aggregators, zip(left, right))]
+
+    def result(self, accumulator: List[Any]) -> Dict[str, Any]:
+        return {
+            name: aggregator.result(value)
+            for name, aggregator, value in zip(self.names, self.aggregators, accumulator)
+        }
+
+
+AGGREGATORS = {
+    'count': Count,
+    'sum': Sum,
+    'min': Min,
+    'max': Max,
+    'mean': Mean,
+}
+
+
+def fields(aggregators: Mapping[str, Any]) -> Fields:
+    result: Dict[str, Aggregator] = {}
+    for name, aggregator in aggregators.items():
+        if isinstance(aggregator, Aggregator):
+            result[name] = aggregator
+        elif name in AGGREGATORS:
+            result[name] = AGGREGATORS[name](aggregator)
+        else:
+            raise TypeError('Expected Aggregator for %r or one of: %s' % (name, ', '.join(AGGREGATORS)))
+    return Fields(result)
+
+
+class _Spill(object):
+
+    def __init__(self, partitions: int) -> None:
+        self._files: List[IO[bytes]] = [tempfile.TemporaryFile() for _ in range(partitions)]
+
+    def write(self, table: Dict[Hashable, Any]) -> None:
+        for key, accumulator in table.items():
+            pickle.dump((key, accumulator), self._files[hash(key) % len(self._files)], pickle.HIGHEST_PROTOCOL)
+        table.clear()
+
+    def partitions(self) -> Iterator[Iterator[Tuple[Hashable, Any]]]:
+        for spill in self._files:
+            yield self._read(spill)
+
+    def _read(self, spill: IO[bytes]) -> Iterator[Tuple[Hashable, Any]]:
+        spill.seek(0)
+        while True:
+            try:
+                yield pickle.load(spill)
+            except EOFError:
+                return
+
+    def close(self) -> None:
+        for spill in self._files:
+            spill.close()
+
+
+def group_by(key: Callable[[Any], Hashable],
+             aggregator: Aggregator,
+             max_keys: Optional[int],
+             iterator: Iterator[Any],
+             partitions: int = 16) -> Dict[Hashable, Any]:
+    if max_keys is not None and max_keys < 1:
+        raise ValueError('Maximal number of keys must be positive, got %r' % max_keys)
+    table: Dict[Hashable, Any] = {}
+    spill: Optional[_Spill] = None
+    create, add = aggregator.create, aggregator.add
+    try:
+        for item in iterator:
+            group = key(item)
+            accumulator = table.get(group, table)
+            if accumulator is table:
+                if max_keys is not None and len(table) >= max_keys:
+                    spill = spill or _Spill(partitions)
+                    spill.write(table)
+                accumulator = create()
+            table[group] = add(accumulator, item)
+        if spill is None:
+            return {group: aggregator.result(accumulator) for group, accumulator in table.items()}
+        spill.write(table)
+        result: Dict[Hashable, Any] = {}
+        for partition in spill.partitions():
+            merged: Dict[Hashable, Any] = {}
+            for group, accumulator in partition:
+                merged[group] = aggregator.merge(merged[group], accumulator) if group in merged else accumulator
+            result.update((group, aggregator.result(accumulator)) for group, accumulator in merged.items())
+        return result
+    finally:
+        if spill is not None:
+            spill.close()
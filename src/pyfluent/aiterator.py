@@ -0,0 +1,213 @@
+from __future__ import annotations
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+from inspect import isawaitable
+from typing import Any, Deque, Generic, List, Optional, Set, Tuple, TypeVar, Union
+
+I = TypeVar('I')
+O = TypeVar('O')
+
+Source = Union[AsyncIterable[I], Iterable[I]]
+
+
+async def _resolve(value: Union[Awaitable[O], O]) -> O:
+    if isawaitable(value):
+        return await value
+    return value
+
+
+async def _from_iterable(iterable: Iterable[I]) -> AsyncIterator[I]:
+    for item in iterable:
+        yield item
+
+
+def _aiter(source: Source[I]) -> AsyncIterator[I]:
+    if isinstance(source, AsyncIterable):
+        return source.__aiter__()
+    return _from_iterable(source)
+
+
+async def _peek(predicate: Callable[[I], Any], source: AsyncIterable[I]) -> AsyncIterator[I]:
+    async for item in source:
+        await _resolve(predicate(item))
+        yield item
+
+
+async def _map(predicate: Callable[[I], Any], source: AsyncIterable[I]) -> AsyncIterator[Any]:
+    async for item in source:
+        yield await _resolve(predicate(item))
+
+
+async def _filter(predicate: Callable[[I], Any], expected: bool, source: AsyncIterable[I]) -> AsyncIterator[I]:
+    async for item in source:
+        if bool(await _resolve(predicate(item))) is expected:
+            yield item
+
+
+async def _flatten(source: AsyncIterable[Any]) -> AsyncIterator[Any]:
+    async for item in source:
+        async for subitem in _aiter(item):
+            yield subitem
+
+
+async def _enumerate(source: AsyncIterable[I]) -> AsyncIterator[Tuple[int, I]]:
+    index = 0
+    async for item in source:
+        yield (index, item)
+        index += 1
+
+
+async def _skip(num: int, source: AsyncIterable[I]) -> AsyncIterator[I]:
+    async for item in source:
+        if num:
+            num -= 1
+            continue
+        yield item
+
+
+async def _chain(*sources: Source[I]) -> AsyncIterator[I]:
+    for source in sources:
+        async for item in _aiter(source):
+            yield item
+
+
+async def _amap(predicate: Callable[[I], Awaitable[O]], concurrency: int, ordered: bool,
+                source: AsyncIterable[I]) -> AsyncIterator[O]:
+    iterator = source.__aiter__()
+    exhausted = False
+
+    async def fill(size: int) -> Optional[asyncio.Task]:
+        nonlocal exhausted
+        if exhausted or size >= concurrency:
+            return None
+        try:
+            item = await iterator.__anext__()
+        except StopAsyncIteration:
+            exhausted = True
+            return None
+        return asyncio.ensure_future(_resolve(predicate(item)))
+
+    if ordered:
+        queue: Deque[asyncio.Task] = deque()
+        try:
+            while True:
+                task = await fill(len(queue))
+                if task is not None:
+                    queue.append(task)
+                    continue
+                if not queue:
+                    return
+                yield await queue.popleft()
+        finally:
+            for task in queue:
+                task.cancel()
+    else:
+        pending: Set[asyncio.Task] = set()
+        try:
+            while True:
+                task = await fill(len(pending))
+                if task is not None:
+                    pending.add(task)
+                    continue
+                if not pending:
+                    return
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+class AsyncFluentIterator(Generic[I], AsyncIterator):
+
+    def __init__(self, iterator: Source[I]) -> None:
+        super().__init__()
+        self._source = iterator
+        self._built: Optional[AsyncIterator[I]] = None
+
+    @property
+    def _iterator(self) -> AsyncIterator[I]:
+        if self._built is None:
+            self._built = _aiter(self._source)
+        return self._built
+
+    def peek(self, predicate: Callable[[I], Any]) -> AsyncFluentIterator[I]:
+        return AsyncFluentIterator(_peek(predicate, self))
+
+    def map(self, predicate: Callable[[I], Any]) -> AsyncFluentIterator[Any]:
+        return AsyncFluentIterator(_map(predicate, self))
+
+    def amap(self,
+             predicate: Callable[[I], Awaitable[O]],
+             concurrency: int = 1,
+             ordered: bool = True) -> AsyncFluentIterator[O]:
+        if concurrency < 1:
+            raise ValueError('Concurrency must be positive, got %r' % concurrency)
+        return AsyncFluentIterator(_amap(predicate, concurrency, ordered, self))
+
+    def filter(self, predicate: Callable[[I], Any]) -> AsyncFluentIterator[I]:
+        return AsyncFluentIterator(_filter(predicate, True, self))
+
+    def filterfalse(self, predicate: Callable[[I], Any]) -> AsyncFluentIterator[I]:
+        return AsyncFluentIterator(_filter(predicate, False, self))
+
+    def flatten(self) -> AsyncFluentIterator[Any]:
+        return AsyncFluentIterator(_flatten(self))
+
+    def enumerate(self) -> AsyncFluentIterator[Tuple[int, I]]:
+        return AsyncFluentIterator(_enumerate(self))
+
+    def skip(self, num: int) -> AsyncFluentIterator[I]:
+        if num < 0:
+            raise ValueError('Number of items to skip must be non-negative, got %r' % num)
+        return AsyncFluentIterator(_skip(num, self))
+
+    def prepend(self, item: Union[Source[I], I]) -> AsyncFluentIterator[I]:
+        if not isinstance(item, (Iterable, AsyncIterable)):
+            item = [item]
+        return AsyncFluentIterator(_chain(item, self))
+
+    def append(self, item: Union[Source[I], I]) -> AsyncFluentIterator[I]:
+        if not isinstance(item, (Iterable, AsyncIterable)):
+            item = [item]
+        return AsyncFluentIterator(_chain(self, item))
+
+    async def allMatch(self, predicate: Callable[[I], Any]) -> bool:
+        async for item in self:
+            if not await _resolve(predicate(item)):
+                return False
+        return True
+
+    async def anyMatch(self, predicate: Callable[[I], Any]) -> bool:
+        async for item in self:
+            if await _resolve(predicate(item)):
+                return True
+        return False
+
+    async def noneMatch(self, predicate: Callable[[I], Any]) -> bool:
+        return not await self.anyMatch(predicate)
+
+    async def first(self) -> Optional[I]:
+        async for item in self:
+            return item
+        return None
+
+    async def reduce(self, predicate: Callable[[O, I], Any], initializer: Optional[O] = None) -> Optional[O]:
+        accumulator = initializer
+        async for item in self:
+            accumulator = await _resolve(predicate(accumulator, item))
+        return accumulator
+
+    async def collect(self, factory: Callable[[List[I]], O] = list) -> O:
+        return factory([item async for item in self])
+
+    def get(self) -> AsyncIterator[I]:
+        return self.__aiter__()
+
+    def __aiter__(self) -> AsyncIterator[I]:
+        return self._iterator
+
+    async def __anext__(self) -> I:
+        return await self._iterator.__anext__()
@@ -0,0 +1,41 @@
+from __future__ import annotations
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from typing import Any, List, TypeVar
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+I = TypeVar('I')
+
+FORMATS = ('list', 'numpy')
+
+
+def chunks(iterator: Iterator[I], size: int) -> Iterator[List[I]]:
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def check_format(format: str) -> None:
+    if format not in FORMATS:
+        raise ValueError('Unknown batch format %r, expected one of: %s' % (format, ', '.join(FORMATS)))
+    if format == 'numpy' and numpy is None:
+        raise ImportError('numpy is required for batch format %r' % format)
+
+
+def check_size(size: int) -> None:
+    if size < 1:
+        raise ValueError('Batch size must be positive, got %r' % size)
+
+
+def map_batches(predicate: Callable[[Any], Iterable[Any]], size: int, format: str,
+                iterator: Iterator[Any]) -> Iterator[Any]:
+    for chunk in chunks(iterator, size):
+        if format == 'numpy':
+            chunk = numpy.asarray(chunk)
+        yield from predicate(chunk)
@@ -0,0 +1,106 @@
+from __future__ import annotations
+from collections.abc import Iterable, Iterator
+import mmap
+import pickle
+import tempfile
+from threading import Lock
+from typing import IO, Any, List, Optional, Tuple
+
+
+def check_cache(memory_limit: Optional[int], frame_size: int) -> None:
+    if memory_limit is not None and memory_limit < 0:
+        raise ValueError('Memory limit must be a non-negative number of items, got %r' % memory_limit)
+    if frame_size < 1:
+        raise ValueError('Frame size must be positive, got %r' % frame_size)
+
+
+class Replay(Iterable):
+
+    def __init__(self, source: Iterable[Any], memory_limit: Optional[int] = None, frame_size: int = 1024) -> None:
+        check_cache(memory_limit, frame_size)
+        self._source = source
+        self._upstream: Optional[Iterator[Any]] = None
+        self._exhausted = False
+        self._memory_limit = memory_limit
+        self._frame_size = frame_size
+        self._memory: List[Any] = []
+        self._pending: List[Any] = []
+        self._frames: List[Tuple[int, int]] = []
+        self._spill: Optional[IO[bytes]] = None
+        self._map: Optional[mmap.mmap] = None
+        self._size = 0
+        self._lock = Lock()
+
+    @property
+    def spilled(self) -> int:
+        return len(self._frames) * self._frame_size
+
+    def _fetch(self) -> bool:
+        with self._lock:
+            if self._exhausted:
+                return False
+            if self._upstream is None:
+                self._upstream = iter(self._source)
+            try:
+                item = next(self._upstream)
+            except StopIteration:
+                self._exhausted = True
+                return False
+            if self._memory_limit is None or len(self._memory) < self._memory_limit:
+                self._memory.append(item)
+            else:
+                self._pending.append(item)
+                if len(self._pending) >= self._frame_size:
+                    self._flush()
+            self._size += 1
+            return True
+
+    def _flush(self) -> None:
+        if self._spill is None:
+            self._spill = tempfile.TemporaryFile()
+        data = pickle.dumps(self._pending, pickle.HIGHEST_PROTOCOL)
+        offset = self._spill.seek(0, 2)
+        self._spill.write(data)
+        self._frames.append((offset, len(data)))
+        self._pending = []
+
+    def _load(self, frame: int) -> List[Any]:
+        offset, length = self._frames[frame]
+        if self._map is None or offset + length > len(self._map):
+            self._spill.flush()
+            self._map = mmap.mmap(self._spill.fileno(), 0, access=mmap.ACCESS_READ)
+        with memoryview(self._map) as view, view[offset:offset + length] as data:
+            return pickle.loads(data)
+
+    def _spilled(self, index: int, frames: List[Any]) -> Any:
+        with self._lock:
+            frame, position = divmod(index, self._frame_size)
+            if frame < len(self._frames):
+                if self._spill is None:
+                    raise ValueError('Cache is closed, spilled items cannot be read')
+                if frames[0] != frame:
+                    frames[:] = [frame, self._load(frame)]
+                return frames[1][position]
+            return self._pending[index - len(self._frames) * self._frame_size]
+
+    def __iter__(self) -> Iterator[Any]:
+        index = 0
+        frames: List[Any] = [-1, None]
+        while True:
+            while index >= self._size:
+                if not self._fetch() and index >= self._size:
+                    return
+            if index < len(self._memory):
+                yield self._memory[index]
+            else:
+                yield self._spilled(index - len(self._memory), frames)
+            index += 1
+
+    def close(self) -> None:
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            if self._spill is not None:
+                self._spill.close()
+                self._spill = None
@@ -0,0 +1,100 @@
+from __future__ import annotations
+from array import array
+from collections.abc import Callable, Iterator, Mapping
+from operator import attrgetter, itemgetter
+from typing import Any, Dict, List, Optional, Union
+
+from pyfluent.batch import chunks
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+CHUNK_SIZE = 65536
+FORMATS = ('array', 'numpy')
+
+
+def _require_numpy() -> None:
+    if numpy is None:
+        raise ImportError('numpy is required for columnar numpy collection')
+
+
+class NumpyBuffer(object):
+
+    def __init__(self, dtype: Any, capacity: int = CHUNK_SIZE) -> None:
+        _require_numpy()
+        self._buffer = numpy.empty(max(capacity, 1), dtype=dtype)
+        self._size = 0
+
+    def _reserve(self, size: int) -> None:
+        capacity = len(self._buffer)
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        buffer = numpy.empty(capacity, dtype=self._buffer.dtype)
+        buffer[:self._size] = self._buffer[:self._size]
+        self._buffer = buffer
+
+    def extend(self, values: List[Any]) -> None:
+        size = self._size + len(values)
+        self._reserve(size)
+        self._buffer[self._size:size] = values
+        self._size = size
+
+    def result(self) -> Any:
+        if self._size == len(self._buffer):
+            return self._buffer
+        return self._buffer[:self._size].copy()
+
+
+def collect_array(typecode: str, iterator: Iterator[Any], size: Optional[int] = None) -> array:
+    if not size:
+        result = array(typecode)
+        for chunk in chunks(iterator, CHUNK_SIZE):
+            result.fromlist(chunk)
+        return result
+    result = array(typecode, bytes(array(typecode).itemsize)) * size
+    filled = 0
+    for chunk in chunks(iterator, CHUNK_SIZE):
+        result[filled:filled + len(chunk)] = array(typecode, chunk)
+        filled += len(chunk)
+    del result[filled:]
+    return result
+
+
+def collect_numpy(dtype: Any, iterator: Iterator[Any], size: Optional[int] = None) -> Any:
+    buffer = NumpyBuffer(dtype, size or CHUNK_SIZE)
+    for chunk in chunks(iterator, CHUNK_SIZE):
+        buffer.extend(chunk)
+    return buffer.result()
+
+
+def _getters(item: Any, fields: List[str]) -> List[Callable[[Any], Any]]:
+    if isinstance(item, Mapping):
+        return [itemgetter(field) for field in fields]
+    if isinstance(item, tuple) and not hasattr(item, '_fields'):
+        return [itemgetter(index) for index in range(len(fields))]
+    return [attrgetter(field) for field in fields]
+
+
+def collect_columns(fields: Mapping[str, Any], format: str, iterator: Iterator[Any],
+                    size: Optional[int] = None) -> Dict[str, Any]:
+    if format not in FORMATS:
+        raise ValueError('Unknown columnar format %r, expected one of: %s' % (format, ', '.join(FORMATS)))
+    names = list(fields)
+    columns: List[Union[array, NumpyBuffer]]
+    if format == 'numpy':
+        columns = [NumpyBuffer(fields[name], size or CHUNK_SIZE) for name in names]
+    else:
+        columns = [array(fields[name]) for name in names]
+    getters = None
+    for chunk in chunks(iterator, CHUNK_SIZE):
+        if getters is None:
+            getters = _getters(chunk[0], names)
+        for column, getter in zip(columns, getters):
+            column.extend(list(map(getter, chunk)))
+    if format == 'numpy':
+        return {name: column.result() for name, column in zip(names, columns)}
+    return dict(zip(names, columns))
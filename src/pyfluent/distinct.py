@@ -0,0 +1,57 @@
+from __future__ import annotations
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from typing import Any, Optional, Set
+
+from pyfluent.sketch import BloomFilter
+
+MODES = ('exact', 'bloom', 'lru')
+
+
+def check_distinct(mode: str, capacity: Optional[int], error_rate: float) -> None:
+    if mode not in MODES:
+        raise ValueError('Unknown distinct mode %r, expected one of: %s' % (mode, ', '.join(MODES)))
+    if mode != 'exact' and (capacity is None or capacity < 1):
+        raise ValueError('Mode %r requires positive capacity, got %r' % (mode, capacity))
+    if not 0 < error_rate < 1:
+        raise ValueError('Error rate must be between 0 and 1, got %r' % error_rate)
+
+
+def _exact(key: Optional[Callable[[Any], Hashable]], iterator: Iterator[Any]) -> Iterator[Any]:
+    seen: Set[Hashable] = set()
+    add = seen.add
+    for item in iterator:
+        value = item if key is None else key(item)
+        if value not in seen:
+            add(value)
+            yield item
+
+
+def _bloom(key: Optional[Callable[[Any], Hashable]], capacity: int, error_rate: float,
+           iterator: Iterator[Any]) -> Iterator[Any]:
+    add = BloomFilter(capacity, error_rate).add
+    for item in iterator:
+        if add(item if key is None else key(item)):
+            yield item
+
+
+def _lru(key: Optional[Callable[[Any], Hashable]], capacity: int, iterator: Iterator[Any]) -> Iterator[Any]:
+    recent: OrderedDict = OrderedDict()
+    for item in iterator:
+        value = item if key is None else key(item)
+        if value in recent:
+            recent.move_to_end(value)
+            continue
+        recent[value] = None
+        if len(recent) > capacity:
+            recent.popitem(last=False)
+        yield item
+
+
+def distinct(key: Optional[Callable[[Any], Hashable]], mode: str, capacity: Optional[int], error_rate: float,
+             iterator: Iterator[Any]) -> Iterator[Any]:
+    if mode == 'bloom':
+        return _bloom(key, capacity, error_rate, iterator)
+    if mode == 'lru':
+        return _lru(key, capacity, iterator)
+    return _exact(key, iterator)
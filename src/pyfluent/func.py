@@ -1,4 +1,6 @@
-from typing import Any, Callable, Iterator, TypeVar
+from functools import partial
+import operator
+from typing import Any, Callable, Collection, Hashable, Iterator, Optional, Tuple, TypeVar
 
 O = TypeVar('O')
 T = TypeVar('T')
@@ -7,3 +9,89 @@ T = TypeVar('T')
 def callUnpacked(predicate: T) -> Callable[[Iterator[Any]], O]:
     return lambda it: predicate(*it)
 
+
+class Composed(object):
+    __slots__ = ('functions',)
+
+    def __init__(self, functions: Tuple[Callable[[Any], Any], ...]) -> None:
+        self.functions = functions
+
+    def __call__(self, item: Any) -> Any:
+        for function in self.functions:
+            item = function(item)
+        return item
+
+    def __repr__(self) -> str:
+        return 'compose(%s)' % ', '.join(map(repr, self.functions))
+
+
+def _attribute(function: Callable[[Any], Any]) -> Optional[str]:
+    if type(function) is not operator.attrgetter:
+        return None
+    paths = function.__reduce__()[1]
+    return paths[0] if len(paths) == 1 else None
+
+
+def compose(*functions: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    flat = []
+    for function in functions:
+        for part in function.functions if isinstance(function, Composed) else (function,):
+            previous, current = flat and _attribute(flat[-1]), _attribute(part)
+            if previous and current:
+                flat[-1] = operator.attrgetter('%s.%s' % (previous, current))
+            else:
+                flat.append(part)
+    if not flat:
+        raise TypeError('compose() requires at least one function')
+    if len(flat) == 1:
+        return flat[0]
+    return Composed(tuple(flat))
+
+
+def attr(path: str) -> Callable[[Any], Any]:
+    return operator.attrgetter(path)
+
+
+def item(*path: Hashable) -> Callable[[Any], Any]:
+    if not path:
+        raise TypeError('item() requires at least one key')
+    return compose(*map(operator.itemgetter, path))
+
+
+def _compare(comparison: Callable[[Any, Any], bool], value: Any,
+             key: Optional[Callable[[Any], Any]]) -> Callable[[Any], bool]:
+    predicate = partial(comparison, value)
+    return predicate if key is None else compose(key, predicate)
+
+
+def eq(value: Any, key: Optional[Callable[[Any], Any]] = None) -> Callable[[Any], bool]:
+    return _compare(operator.eq, value, key)
+
+
+def ne(value: Any, key: Optional[Callable[[Any], Any]] = None) -> Callable[[Any], bool]:
+    return _compare(operator.ne, value, key)
+
+
+def lt(value: Any, key: Optional[Callable[[Any], Any]] = None) -> Callable[[Any], bool]:
+    return _compare(operator.gt, value, key)
+
+
+def le(value: Any, key: Optional[Callable[[Any], Any]] = None) -> Callable[[Any], bool]:
+    return _compare(operator.ge, value, key)
+
+
+def gt(value: Any, key: Optional[Callable[[Any], Any]] = None) -> Callable[[Any], bool]:
+    return _compare(operator.lt, value, key)
+
+
+def ge(value: Any, key: Optional[Callable[[Any], Any]] = None) -> Callable[[Any], bool]:
+    return _compare(operator.le, value, key)
+
+
+def isIn(values: Collection[Any], key: Optional[Callable[[Any], Any]] = None) -> Callable[[Any], bool]:
+    contains = frozenset(values).__contains__
+    return contains if key is None else compose(key, contains)
+
+
+def negate(predicate: Callable[[Any], Any]) -> Callable[[Any], bool]:
+    return compose(predicate, operator.not_)
@@ -1,55 +1,178 @@
 from __future__ import annotations
-from collections.abc import Callable, Iterator, Iterable
-from itertools import chain, filterfalse, islice
-from functools import partial, reduce
-from typing import Any, Generic, Optional, TypeVar, Union
+from array import array
+from collections import deque
+from collections.abc import Callable, Hashable, Iterator, Iterable, Mapping, Sequence, Sized
+from concurrent.futures import Executor
+from functools import reduce
+import heapq
+from itertools import count
+import json
+from operator import length_hint
+from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar, Union
+
+from pyfluent.aggregate import Aggregator, Count, fields, group_by
+from pyfluent.cache import Replay
+from pyfluent.columnar import collect_array, collect_columns, collect_numpy
+from pyfluent.parallel import MISSING, parallel_reduce
+from pyfluent.partition import Partitioned
+from pyfluent.plan import Stage, build, explain, resize
+from pyfluent.profiling import Profiler, StageStats
+from pyfluent.sinks import BATCH_SIZE, write_file, write_sink
+from pyfluent.sketch import HyperLogLog, KllSketch, reservoir_sample
+from pyfluent.sort import check_k
+from pyfluent.sources import BLOCK_SIZE, check_compression, check_partition, read_csv, read_jsonl, read_lines
+from pyfluent.stages import Stages
+from pyfluent.views import Slicer, slice_source, sliceable
 
 I = TypeVar('I')
 O = TypeVar('O')
 T = TypeVar('T')
 
 
-def _peek_item(predicate: Callable[[I], None], item: I) -> I:
-    predicate(item)
-    return item
-
-
-class FluentIterator(Generic[I], Iterator):
+class FluentIterator(Stages, Generic[I], Iterator):
 
     def __init__(self, iterator: Iterator[I]) -> None:
         super().__init__()
-        self._iterator = iter(iterator)
+        self._source = iterator
+        self._base: Optional[FluentIterator[Any]] = None
+        self._stages: Tuple[Stage, ...] = ()
+        self._built: Optional[Iterator[I]] = None
+        self._profiler: Optional[Profiler] = None
+
+    @classmethod
+    def fromLines(cls,
+                  path: str,
+                  binary: bool = False,
+                  encoding: str = 'utf-8',
+                  partition: int = 0,
+                  partitions: int = 1,
+                  blockSize: int = BLOCK_SIZE,
+                  compression: Optional[str] = None,
+                  workers: int = 1) -> FluentIterator[Union[bytes, str]]:
+        check_partition(partition, partitions)
+        check_compression(compression, partitions, workers)
+        return cls(read_lines(path, binary, encoding, partition, partitions, blockSize, compression, workers))
+
+    @classmethod
+    def fromJsonl(cls,
+                  path: str,
+                  loads: Callable[[bytes], Any] = json.loads,
+                  partition: int = 0,
+                  partitions: int = 1,
+                  blockSize: int = BLOCK_SIZE,
+                  compression: Optional[str] = None,
+                  workers: int = 1) -> FluentIterator[Any]:
+        check_partition(partition, partitions)
+        check_compression(compression, partitions, workers)
+        return cls(read_jsonl(path, loads, partition, partitions, blockSize, compression, workers))
+
+    @classmethod
+    def fromCsv(cls,
+                path: str,
+                header: bool = True,
+                encoding: str = 'utf-8',
+                partition: int = 0,
+                partitions: int = 1,
+                blockSize: int = BLOCK_SIZE,
+                compression: Optional[str] = None,
+                workers: int = 1,
+                **formatting: Any) -> FluentIterator[Any]:
+        check_partition(partition, partitions)
+        check_compression(compression, partitions, workers)
+        return cls(read_csv(path, header, encoding, partition, partitions, blockSize, compression, workers,
+                            **formatting))
+
+    @classmethod
+    def _derive(cls, base: FluentIterator[Any], stages: Tuple[Stage, ...],
+                profiler: Optional[Profiler]) -> FluentIterator[Any]:
+        derived = cls.__new__(cls)
+        derived._source = base._source
+        derived._base = base
+        derived._stages = stages
+        derived._built = None
+        derived._profiler = profiler
+        return derived
+
+    def _positional(self) -> bool:
+        return self._base is None and self._built is None and sliceable(self._source)
 
-    def peek(self, predicate: Callable[[I], None]) -> FluentIterator[I]:
-        return self.map(partial(_peek_item, predicate))
+    def _then(self, stage: Stage) -> FluentIterator[Any]:
+        if isinstance(stage.predicate, Slicer) and self._positional():
+            return type(self)(slice_source(self._source, stage.predicate.bounds))
+        if self._built is None and self._base is not None and all(s.elementwise for s in self._stages):
+            return self._derive(self._base, self._stages + (stage,), self._profiler)
+        return self._derive(self, (stage,), self._profiler)
 
-    def map(self, predicate: Callable[[I], O]) -> FluentIterator[O]:
-        return FluentIterator(map(predicate, self._iterator))
+    def _absorb(self, factory: Callable[[Tuple[Stage, ...]], Stage]) -> FluentIterator[Any]:
+        if self._built is None and self._base is not None and all(s.elementwise for s in self._stages):
+            return self._derive(self._base, (factory(self._stages),), self._profiler)
+        return self._derive(self, (factory(()),), self._profiler)
 
-    def filter(self, predicate: Callable[[I], bool]) -> FluentIterator[I]:
-        return FluentIterator(filter(predicate, self._iterator))
+    @property
+    def _iterator(self) -> Iterator[I]:
+        if self._built is None:
+            if self._base is None:
+                self._built = iter(self._source)
+            else:
+                self._built = build(self._base._iterator, self._stages, self._profiler)
+        return self._built
 
-    def filterfalse(self, predicate: Callable[[I], bool]) -> FluentIterator[I]:
-        return FluentIterator(filterfalse(predicate, self._iterator))
+    def _size(self) -> Optional[int]:
+        if self._built is not None:
+            return None
+        if self._base is None:
+            return len(self._source) if isinstance(self._source, Sized) else None
+        return resize(self._stages, self._base._size())
 
-    def flatten(self) -> FluentIterator[Any]:
-        return FluentIterator(chain.from_iterable(self._iterator))
+    def _hint(self) -> Optional[int]:
+        if self._base is None:
+            hint = length_hint(self._source if self._built is None else self._built, -1)
+            return None if hint < 0 else hint
+        return resize(self._stages, self._base._hint())
 
-    def enumerate(self) -> FluentIterator[Tuple[int, I]]:
-        return FluentIterator(enumerate(self._iterator))
+    def __length_hint__(self) -> int:
+        hint = self._hint()
+        return NotImplemented if hint is None else hint
 
-    def skip(self, num: int) -> FluentIterator[I]:
-        return FluentIterator(islice(self._iterator, num, None))
+    def cache(self, memoryLimit: Optional[int] = None, frameSize: int = 1024) -> FluentIterator[I]:
+        return FluentIterator(Replay(self, memoryLimit, frameSize))
 
-    def prepend(self, item: Union[Iterable[I], I]) -> FluentIterator[I]:
-        if isinstance(item, Iterable):
-            return FluentIterator(chain(item, self._iterator))
-        return FluentIterator(chain([item], self._iterator))
+    def tee(self,
+            n: int = 2,
+            memoryLimit: Optional[int] = None,
+            frameSize: int = 1024) -> Tuple[FluentIterator[I], ...]:
+        if n < 0:
+            raise ValueError('Number of iterators must be non-negative, got %r' % n)
+        replay = Replay(self, memoryLimit, frameSize)
+        return tuple(FluentIterator(replay) for _ in range(n))
 
-    def append(self, item: Union[Iterable[I], I]) -> FluentIterator[I]:
-        if isinstance(item, Iterable):
-            return FluentIterator(chain(self._iterator, item))
-        return FluentIterator(chain(self._iterator, [item]))
+    def replay(self) -> FluentIterator[I]:
+        if self._base is not None or not isinstance(self._source, Replay):
+            raise TypeError('Only iterators returned by cache() or tee() can be replayed')
+        return FluentIterator(self._source)
+
+    def partition(self, n: int, ordered: bool = True, chunksize: int = 1024) -> Partitioned:
+        return Partitioned(self, n, ordered, chunksize)
+
+    def plan(self) -> List[Stage]:
+        stages: List[Stage] = []
+        node: Optional[FluentIterator[Any]] = self
+        while node is not None:
+            stages[:0] = node._stages
+            node = node._base
+        return stages
+
+    def explain(self) -> str:
+        return explain(self._source, self.plan())
+
+    @property
+    def profiler(self) -> Optional[Profiler]:
+        return self._profiler
+
+    def instrument(self,
+                   callback: Optional[Callable[[StageStats], None]] = None,
+                   allocations: bool = False) -> FluentIterator[I]:
+        return self._derive(self, (), Profiler(callback, allocations))
 
     def allMatch(self, predicate: Callable[[I], bool]) -> bool:
         return all(self.map(predicate))
@@ -63,15 +186,118 @@ class FluentIterator(Generic[I], Iterator):
     def first(self) -> Optional[I]:
         return next(self._iterator, None)
 
+    def last(self) -> Optional[I]:
+        if self._positional():
+            return self._source[-1] if len(self._source) else None
+        for item in deque(self._iterator, maxlen=1):
+            return item
+        return None
+
     def reduce(self,
                predicate: Callable[[I], O], initializer: Optional[O] = None
                ) -> Optional[O]:
         return reduce(predicate, self._iterator, initializer)
 
+    def parallelReduce(self,
+                       predicate: Callable[[O, I], O],
+                       combiner: Optional[Callable[[O, O], O]] = None,
+                       initializer: Any = MISSING,
+                       workers: Optional[int] = None,
+                       executor: Union[str, Executor] = 'thread',
+                       chunksize: int = 1024,
+                       zero: Any = MISSING) -> Optional[O]:
+        return parallel_reduce(predicate, combiner, initializer, zero, workers, executor, chunksize, self._iterator)
+
     def collect(self,
                 factory: Callable[[Iterable[I]], Iterator[O]] = list
                 ) -> Iterator[O]:
-        return factory(self._iterator)
+        return factory(self)
+
+    def collectArray(self, typecode: str) -> array:
+        return collect_array(typecode, self._iterator, self._hint())
+
+    def collectNumpy(self, dtype: Any = float) -> Any:
+        return collect_numpy(dtype, self._iterator, self._hint())
+
+    def collectColumns(self, fields: Mapping[str, Any], format: str = 'array') -> Dict[str, Any]:
+        return collect_columns(fields, format, self._iterator, self._hint())
+
+    def count(self) -> int:
+        size = self._size()
+        if size is not None:
+            return size
+        counter = count()
+        deque(zip(self._iterator, counter), maxlen=0)
+        return next(counter)
+
+    def groupBy(self,
+                key: Callable[[I], Hashable],
+                aggregator: Optional[Aggregator] = None,
+                maxKeys: Optional[int] = None) -> Dict[Hashable, Any]:
+        return group_by(key, aggregator or Count(), maxKeys, self._iterator)
+
+    def countBy(self, key: Callable[[I], Hashable], maxKeys: Optional[int] = None) -> Dict[Hashable, int]:
+        return group_by(key, Count(), maxKeys, self._iterator)
+
+    def aggregate(self,
+                  key: Callable[[I], Hashable],
+                  maxKeys: Optional[int] = None,
+                  **aggregators: Any) -> Dict[Hashable, Dict[str, Any]]:
+        return group_by(key, fields(aggregators), maxKeys, self._iterator)
+
+    def topK(self, k: int, key: Optional[Callable[[I], Any]] = None) -> List[I]:
+        check_k(k)
+        return heapq.nlargest(k, self._iterator, key=key)
+
+    def bottomK(self, k: int, key: Optional[Callable[[I], Any]] = None) -> List[I]:
+        check_k(k)
+        return heapq.nsmallest(k, self._iterator, key=key)
+
+    def approxCountDistinct(self, key: Optional[Callable[[I], Any]] = None, precision: int = 14) -> int:
+        sketch = HyperLogLog(precision)
+        for item in self._iterator if key is None else map(key, self._iterator):
+            sketch.add(item)
+        return sketch.count()
+
+    def approxQuantiles(self,
+                        qs: Sequence[float],
+                        key: Optional[Callable[[I], Any]] = None,
+                        k: int = 200,
+                        seed: Optional[int] = None) -> List[Any]:
+        sketch = KllSketch(k, seed)
+        for item in self._iterator if key is None else map(key, self._iterator):
+            sketch.add(item)
+        return sketch.quantiles(qs)
+
+    def sample(self, n: int, seed: Optional[int] = None) -> List[I]:
+        return reservoir_sample(n, seed, self._iterator)
+
+    def toFile(self,
+               path: str,
+               format: str = 'lines',
+               compression: Optional[str] = None,
+               encoding: str = 'utf-8',
+               batchSize: int = BATCH_SIZE,
+               **formatting: Any) -> int:
+        return write_file(path, format, compression, encoding, batchSize, self._iterator, **formatting)
+
+    def toSink(self, writeBatch: Callable[[List[I]], Any], batchSize: int = BATCH_SIZE) -> int:
+        return write_sink(writeBatch, batchSize, self._iterator)
+
+    def close(self) -> None:
+        node: FluentIterator[Any] = self
+        while True:
+            close = getattr(node._built, 'close', None)
+            if close is not None:
+                close()
+            if node._base is None:
+                break
+            node = node._base
+        # the cache is shared with tee() siblings and replay() iterators, closing any of them releases its spill file
+        if isinstance(node._source, Replay):
+            node._source.close()
+        if self._profiler is not None:
+            self._profiler.close()
 
     def get(self) -> Iterator[I]:
         return iter(self)
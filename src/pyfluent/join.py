@@ -0,0 +1,121 @@
+from __future__ import annotations
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from itertools import groupby
+from operator import length_hint
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+HOWS = ('inner', 'left', 'outer')
+STRATEGIES = ('hash', 'merge')
+
+Pair = Tuple[Optional[Any], Optional[Any]]
+
+
+def check_join(how: str, strategy: str) -> None:
+    if how not in HOWS:
+        raise ValueError('Unknown join type %r, expected one of: %s' % (how, ', '.join(HOWS)))
+    if strategy not in STRATEGIES:
+        raise ValueError('Unknown join strategy %r, expected one of: %s' % (strategy, ', '.join(STRATEGIES)))
+
+
+def _table(items: Iterable[Any], key: Callable[[Any], Hashable]) -> Dict[Hashable, List[Any]]:
+    table: Dict[Hashable, List[Any]] = {}
+    for item in items:
+        group = key(item)
+        matches = table.get(group)
+        if matches is None:
+            table[group] = [item]
+        else:
+            matches.append(item)
+    return table
+
+
+def _probe_left(left: Iterator[Any], right: Iterable[Any], left_key: Callable[[Any], Hashable],
+                right_key: Callable[[Any], Hashable], how: str) -> Iterator[Pair]:
+    table = _table(right, right_key)
+    matched: Set[Hashable] = set()
+    for item in left:
+        group = left_key(item)
+        matches = table.get(group)
+        if matches is None:
+            if how != 'inner':
+                yield (item, None)
+            continue
+        if how == 'outer':
+            matched.add(group)
+        for match in matches:
+            yield (item, match)
+    if how == 'outer':
+        for group, matches in table.items():
+            if group not in matched:
+                for match in matches:
+                    yield (None, match)
+
+
+def _probe_right(left: Iterator[Any], right: Iterable[Any], left_key: Callable[[Any], Hashable],
+                 right_key: Callable[[Any], Hashable], how: str) -> Iterator[Pair]:
+    table = _table(left, left_key)
+    matched: Set[Hashable] = set()
+    for item in right:
+        group = right_key(item)
+        matches = table.get(group)
+        if matches is None:
+            if how == 'outer':
+                yield (None, item)
+            continue
+        matched.add(group)
+        for match in matches:
+            yield (match, item)
+    if how != 'inner':
+        for group, matches in table.items():
+            if group not in matched:
+                for match in matches:
+                    yield (match, None)
+
+
+def hash_join(other: Iterable[Any], left_key: Callable[[Any], Hashable], right_key: Callable[[Any], Hashable],
+              how: str, left: Iterator[Any]) -> Iterator[Pair]:
+    # probing with the right side emits rows in right order, so only inner joins may build on a smaller left side,
+    # left and outer joins keep the left order
+    if how != 'inner':
+        return _probe_left(left, other, left_key, right_key, how)
+    left_size = length_hint(left, -1)
+    right_size = length_hint(other, -1)
+    if 0 <= left_size < right_size:
+        return _probe_right(left, other, left_key, right_key, how)
+    return _probe_left(left, other, left_key, right_key, how)
+
+
+def merge_join(other: Iterable[Any], left_key: Callable[[Any], Any], right_key: Callable[[Any], Any], how: str,
+               left: Iterator[Any]) -> Iterator[Pair]:
+    left_groups = groupby(left, left_key)
+    right_groups = groupby(other, right_key)
+    left_group = next(left_groups, None)
+    right_group = next(right_groups, None)
+    while left_group is not None and right_group is not None:
+        if left_group[0] < right_group[0]:
+            if how != 'inner':
+                for item in left_group[1]:
+                    yield (item, None)
+            left_group = next(left_groups, None)
+        elif right_group[0] < left_group[0]:
+            if how == 'outer':
+                for item in right_group[1]:
+                    yield (None, item)
+            right_group = next(right_groups, None)
+        else:
+            matches = list(right_group[1])
+            for item in left_group[1]:
+                for match in matches:
+                    yield (item, match)
+            left_group = next(left_groups, None)
+            right_group = next(right_groups, None)
+    if how != 'inner':
+        while left_group is not None:
+            for item in left_group[1]:
+                yield (item, None)
+            left_group = next(left_groups, None)
+    if how == 'outer':
+        while right_group is not None:
+            for item in right_group[1]:
+                yield (None, item)
+            right_group = next(right_groups, None)
@@ -0,0 +1,126 @@
+from __future__ import annotations
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from copy import deepcopy
+from functools import reduce
+from typing import Any, Deque, List, Optional, Set, TypeVar, Union
+
+from pyfluent.batch import chunks
+
+I = TypeVar('I')
+O = TypeVar('O')
+
+EXECUTORS = {
+    'thread': ThreadPoolExecutor,
+    'process': ProcessPoolExecutor,
+}
+
+
+MISSING = object()
+
+
+def _reduce_chunk(predicate: Callable[[O, I], O], zero: Optional[List[Any]], chunk: List[I]) -> O:
+    if zero is None:
+        return reduce(predicate, chunk)
+    return reduce(predicate, chunk, deepcopy(zero[0]))
+
+
+def _map_chunk(predicate: Callable[[I], O], chunk: List[I]) -> List[O]:
+    return [predicate(item) for item in chunk]
+
+
+def check_parallel(executor: Union[str, Executor], chunksize: int) -> None:
+    if not isinstance(executor, Executor) and executor not in EXECUTORS:
+        raise ValueError('Unknown executor %r, expected one of: %s' % (executor, ', '.join(EXECUTORS)))
+    if chunksize < 1:
+        raise ValueError('Chunk size must be positive, got %r' % chunksize)
+
+
+def create_executor(executor: Union[str, Executor], workers: Optional[int]) -> Executor:
+    if isinstance(executor, Executor):
+        return executor
+    try:
+        return EXECUTORS[executor](max_workers=workers)
+    except KeyError:
+        raise ValueError('Unknown executor %r, expected one of: %s' % (executor, ', '.join(EXECUTORS))) from None
+
+
+def shutdown(executor: Executor, owned: bool, pending: Iterable[Future]) -> None:
+    for future in pending:
+        future.cancel()
+    if owned:
+        executor.shutdown(wait=True)
+
+
+def parallel_map(predicate: Callable[[I], O],
+                 workers: Optional[int],
+                 executor: Union[str, Executor],
+                 chunksize: int,
+                 ordered: bool,
+                 iterator: Iterator[I]) -> Iterator[O]:
+    check_parallel(executor, chunksize)
+    pool = create_executor(executor, workers)
+    owned = pool is not executor
+    inflight = 2 * (workers or getattr(pool, '_max_workers', None) or 1)
+    source = chunks(iterator, chunksize)
+    if ordered:
+        queue: Deque[Future] = deque()
+        try:
+            for chunk in source:
+                queue.append(pool.submit(_map_chunk, predicate, chunk))
+                if len(queue) >= inflight:
+                    yield from queue.popleft().result()
+            while queue:
+                yield from queue.popleft().result()
+        finally:
+            shutdown(pool, owned, queue)
+    else:
+        pending: Set[Future] = set()
+        try:
+            for chunk in source:
+                pending.add(pool.submit(_map_chunk, predicate, chunk))
+                if len(pending) >= inflight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        finally:
+            shutdown(pool, owned, pending)
+
+
+def parallel_reduce(predicate: Callable[[O, I], O],
+                    combiner: Optional[Callable[[O, O], O]],
+                    initializer: Any,
+                    zero: Any,
+                    workers: Optional[int],
+                    executor: Union[str, Executor],
+                    chunksize: int,
+                    iterator: Iterator[I]) -> Any:
+    check_parallel(executor, chunksize)
+    # every chunk folds into its own copy of zero, which has to be neutral for the combiner (0 for addition, an
+    # empty Counter for histograms), the initializer is combined once with the first partial result, as in reduce
+    combiner = combiner or predicate
+    pool = create_executor(executor, workers)
+    owned = pool is not executor
+    inflight = 2 * (workers or getattr(pool, '_max_workers', None) or 1)
+    queue: Deque[Future] = deque()
+    start = None if zero is MISSING else [zero]
+    result = initializer
+    try:
+        for chunk in chunks(iterator, chunksize):
+            queue.append(pool.submit(_reduce_chunk, predicate, start, chunk))
+            while len(queue) >= inflight or (queue and queue[0].done()):
+                reduced = queue.popleft().result()
+                result = reduced if result is MISSING else combiner(result, reduced)
+        while queue:
+            reduced = queue.popleft().result()
+            result = reduced if result is MISSING else combiner(result, reduced)
+    finally:
+        shutdown(pool, owned, queue)
+    if result is MISSING:
+        return None if zero is MISSING else zero
+    return result
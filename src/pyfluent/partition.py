@@ -0,0 +1,244 @@
+from __future__ import annotations
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
+import multiprocessing
+from multiprocessing import resource_tracker, shared_memory
+from queue import Empty
+from threading import Event, Thread
+from typing import Any, Dict, List, Optional, Tuple
+
+from pyfluent.batch import chunks
+from pyfluent.pipelining import POLL_INTERVAL, _Failure, _put
+
+SHARED_MIN = 256
+_TYPECODES = {int: 'q', float: 'd'}
+
+Payload = Tuple[Any, ...]
+
+
+def check_partitioned(partitions: int, chunksize: int) -> None:
+    if partitions < 1:
+        raise ValueError('Number of partitions must be positive, got %r' % partitions)
+    if chunksize < 1:
+        raise ValueError('Chunk size must be positive, got %r' % chunksize)
+
+
+def encode(batch: List[Any]) -> Payload:
+    if len(batch) < SHARED_MIN:
+        return ('list', batch)
+    types = set(map(type, batch))
+    typecode = _TYPECODES.get(types.pop()) if len(types) == 1 else None
+    if typecode is None:
+        return ('list', batch)
+    try:
+        data = array(typecode, batch)
+    except OverflowError:
+        return ('list', batch)
+    size = len(data) * data.itemsize
+    block = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        block.buf[:size] = memoryview(data).cast('B')
+    finally:
+        block.close()
+    return ('shared', block.name, typecode, len(data))
+
+
+def decode(payload: Payload) -> List[Any]:
+    if payload[0] == 'list':
+        return payload[1]
+    _, name, typecode, length = payload
+    block = shared_memory.SharedMemory(name)
+    try:
+        with block.buf[:length * array(typecode).itemsize] as raw, raw.cast(typecode) as values:
+            return values.tolist()
+    finally:
+        block.close()
+        block.unlink()
+
+
+def _fork() -> bool:
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+
+def _sequence_chunks(source: Sequence[Any], index: int, partitions: int,
+                     chunksize: int) -> Iterator[Tuple[int, List[Any]]]:
+    for sequence in range(index, -(-len(source) // chunksize), partitions):
+        yield sequence, list(source[sequence * chunksize:(sequence + 1) * chunksize])
+
+
+def release(payload: Payload) -> None:
+    if payload[0] == 'shared':
+        block = shared_memory.SharedMemory(payload[1])
+        block.close()
+        block.unlink()
+
+
+class _Inbox(object):
+
+    def __init__(self, queue: Any) -> None:
+        self.queue = queue
+        self.ended = False
+
+    def __iter__(self) -> Iterator[Tuple[int, List[Any]]]:
+        for sequence, payload in iter(self.queue.get, None):
+            yield sequence, decode(payload)
+        self.ended = True
+
+    def drain(self) -> None:
+        # a sub-chain that stops reading early would leave the feeder blocked on this inbox forever, starving the
+        # other workers, so the remaining chunks are read up to the end marker and their shared blocks released
+        if not self.ended:
+            for _, payload in iter(self.queue.get, None):
+                release(payload)
+            self.ended = True
+
+
+def _worker(function: Callable[[Any], Iterable[Any]], wrap: Callable[[Iterator[Any]], Any],
+            inputs: Iterable[Tuple[int, List[Any]]], outbox: Any) -> None:
+    # every input chunk yields exactly one output message, tagged with the chunk sequence number
+    current: Optional[int] = None
+    buffer: List[Any] = []
+
+    def feed() -> Iterator[Any]:
+        nonlocal current, buffer
+        for sequence, chunk in inputs:
+            if current is not None:
+                outbox.put((current, encode(buffer)))
+                buffer = []
+            current = sequence
+            yield from chunk
+
+    try:
+        for item in function(wrap(feed())):
+            buffer.append(item)
+        outbox.put((current, encode(buffer)))
+    except BaseException as error:
+        outbox.put(_Failure(error))
+    finally:
+        if isinstance(inputs, _Inbox):
+            inputs.drain()
+    outbox.put(None)
+
+
+def _feed(iterator: Iterator[Any], inboxes: List[Any], stop: Event, chunksize: int,
+          failures: List[BaseException]) -> None:
+    try:
+        for sequence, chunk in enumerate(chunks(iterator, chunksize)):
+            if not _put(inboxes[sequence % len(inboxes)], stop, (sequence, encode(chunk))):
+                return
+    except BaseException as error:
+        failures.append(error)
+    for inbox in inboxes:
+        _put(inbox, stop, None)
+
+
+def _receive(outbox: Any, processes: List[Any]) -> Any:
+    while True:
+        try:
+            return outbox.get(timeout=POLL_INTERVAL)
+        except Empty:
+            crashed = [process for process in processes if process.exitcode not in (None, 0)]
+            if not crashed:
+                continue
+        try:
+            return outbox.get_nowait()
+        except Empty:
+            raise RuntimeError('Worker process exited unexpectedly with code %r' % crashed[0].exitcode) from None
+
+
+def _discard(outbox: Any) -> None:
+    while True:
+        try:
+            message = outbox.get_nowait()
+        except (Empty, OSError, ValueError):
+            return
+        if isinstance(message, tuple) and not isinstance(message, _Failure) and message[1][0] == 'shared':
+            release(message[1])
+
+
+def partitioned(function: Callable[[Any], Iterable[Any]],
+                wrap: Callable[[Iterator[Any]], Any],
+                partitions: int,
+                ordered: bool,
+                chunksize: int,
+                source: Iterable[Any],
+                sequence: Optional[Sequence[Any]] = None) -> Iterator[Any]:
+    context = multiprocessing.get_context('fork' if _fork() else None)
+    # forked workers must share the tracker, otherwise each reports blocks unlinked by the parent as leaked
+    resource_tracker.ensure_running()
+    outbox = context.Queue()
+    inboxes: List[Any] = []
+    stop = Event()
+    failures: List[BaseException] = []
+    feeder: Optional[Thread] = None
+    processes = []
+    for index in range(partitions):
+        if sequence is not None and _fork():
+            inputs: Iterable[Tuple[int, List[Any]]] = _sequence_chunks(sequence, index, partitions, chunksize)
+        else:
+            inboxes.append(context.Queue(2))
+            inputs = _Inbox(inboxes[-1])
+        processes.append(context.Process(target=_worker, args=(function, wrap, inputs, outbox), daemon=True))
+    for process in processes:
+        process.start()
+    if inboxes:
+        feeder = Thread(target=_feed, args=(iter(source), inboxes, stop, chunksize, failures), daemon=True)
+        feeder.start()
+    try:
+        pending: Dict[int, List[Any]] = {}
+        tail: List[Any] = []
+        expected = 0
+        finished = 0
+        while finished < partitions:
+            message = _receive(outbox, processes)
+            if message is None:
+                finished += 1
+                continue
+            if isinstance(message, _Failure):
+                raise message.error
+            current, payload = message
+            items = decode(payload)
+            if not ordered:
+                yield from items
+            elif current is None:
+                tail.extend(items)
+            else:
+                pending[current] = items
+                while expected in pending:
+                    yield from pending.pop(expected)
+                    expected += 1
+        for current in sorted(pending):
+            yield from pending[current]
+        yield from tail
+        if failures:
+            raise failures[0]
+    finally:
+        stop.set()
+        if feeder is not None:
+            feeder.join()
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+        _discard(outbox)
+        for queue in inboxes:
+            _discard(queue)
+        for queue in [outbox] + inboxes:
+            queue.cancel_join_thread()
+            queue.close()
+
+
+class Partitioned(object):
+
+    def __init__(self, node: Any, partitions: int, ordered: bool = True, chunksize: int = 1024) -> None:
+        check_partitioned(partitions, chunksize)
+        self._node = node
+        self._partitions = partitions
+        self._ordered = ordered
+        self._chunksize = chunksize
+
+    def process(self, function: Callable[[Any], Iterable[Any]]) -> Any:
+        node = self._node
+        wrap = type(node)
+        sequence = node._source if node._positional() else None
+        return wrap(partitioned(function, wrap, self._partitions, self._ordered, self._chunksize, node, sequence))
@@ -0,0 +1,45 @@
+from __future__ import annotations
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, List, Optional, Tuple
+
+from pyfluent.iterator import FluentIterator
+from pyfluent.plan import Stage, compile, explain
+from pyfluent.stages import Stages
+
+
+class Pipeline(Stages):
+
+    def __init__(self, stages: Tuple[Stage, ...] = ()) -> None:
+        super().__init__()
+        self._stages = stages
+        self._runners: Optional[List[Callable[[Iterator[Any]], Iterator[Any]]]] = None
+
+    def _then(self, stage: Stage) -> Pipeline:
+        return Pipeline(self._stages + (stage,))
+
+    def _absorb(self, factory: Callable[[Tuple[Stage, ...]], Stage]) -> Pipeline:
+        index = len(self._stages)
+        while index and self._stages[index - 1].elementwise:
+            index -= 1
+        return Pipeline(self._stages[:index] + (factory(self._stages[index:]),))
+
+    @property
+    def stages(self) -> Tuple[Stage, ...]:
+        return self._stages
+
+    def compile(self) -> Pipeline:
+        if self._runners is None:
+            self._runners = compile(self._stages)
+        return self
+
+    def explain(self) -> str:
+        return explain(self, self._stages)
+
+    def run(self, iterable: Iterable[Any]) -> FluentIterator[Any]:
+        runners = self._runners
+        if runners is None:
+            runners = self._runners = compile(self._stages)
+        iterator = iter(iterable)
+        for runner in runners:
+            iterator = runner(iterator)
+        return FluentIterator(iterator)
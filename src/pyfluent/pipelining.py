@@ -0,0 +1,166 @@
+from __future__ import annotations
+from collections.abc import Iterator, Sequence
+from functools import partial
+from itertools import chain
+import multiprocessing
+from queue import Empty, Full, Queue
+from threading import Event, Thread
+from typing import Any, List, NamedTuple
+
+from pyfluent.batch import chunks
+from pyfluent.plan import Stage, build, resize
+
+EXECUTORS = ('thread', 'process')
+POLL_INTERVAL = 0.05
+
+_END = object()
+
+
+class _Failure(NamedTuple):
+    error: BaseException
+
+
+def check_executor(executor: str) -> None:
+    if executor not in EXECUTORS:
+        raise ValueError('Unknown executor %r, expected one of: %s' % (executor, ', '.join(EXECUTORS)))
+
+
+def check_boundary(executor: str, maxsize: int, chunksize: int) -> None:
+    check_executor(executor)
+    if maxsize < 1:
+        raise ValueError('Queue size must be positive, got %r' % maxsize)
+    if chunksize < 1:
+        raise ValueError('Chunk size must be positive, got %r' % chunksize)
+
+
+def check_prefetch(size: int) -> None:
+    if size < 1:
+        raise ValueError('Prefetch size must be positive, got %r' % size)
+
+
+def _put(queue: Any, stop: Event, item: Any) -> bool:
+    while not stop.is_set():
+        try:
+            queue.put(item, timeout=POLL_INTERVAL)
+            return True
+        except Full:
+            continue
+    return False
+
+
+def _get(queue: Any, process: Any) -> Any:
+    while True:
+        try:
+            return queue.get(timeout=POLL_INTERVAL)
+        except Empty:
+            if process.is_alive():
+                continue
+        try:
+            return queue.get_nowait()
+        except Empty:
+            raise RuntimeError('Worker process exited unexpectedly with code %r' % process.exitcode) from None
+
+
+def _close(iterator: Iterator[Any]) -> None:
+    close = getattr(iterator, 'close', None)
+    if close is not None:
+        close()
+
+
+def _thread_worker(iterator: Iterator[Any], queue: Queue, stop: Event) -> None:
+    try:
+        for item in iterator:
+            if not _put(queue, stop, item):
+                return
+        _put(queue, stop, _END)
+    except BaseException as error:
+        _put(queue, stop, _Failure(error))
+    finally:
+        _close(iterator)
+
+
+def thread_segment(stages: Sequence[Stage], maxsize: int, iterator: Iterator[Any]) -> Iterator[Any]:
+    queue: Queue = Queue(maxsize)
+    stop = Event()
+    worker = Thread(target=_thread_worker, args=(build(iterator, stages), queue, stop), daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = queue.get()
+            if item is _END:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+        worker.join()
+
+
+def _process_worker(stages: Sequence[Stage], inbox: Any, outbox: Any, chunksize: int) -> None:
+    buffer: List[Any] = []
+    try:
+        for item in build(chain.from_iterable(iter(inbox.get, None)), stages):
+            buffer.append(item)
+            if len(buffer) >= chunksize:
+                outbox.put(buffer)
+                buffer = []
+    except BaseException as error:
+        if buffer:
+            outbox.put(buffer)
+        outbox.put(_Failure(error))
+        return
+    if buffer:
+        outbox.put(buffer)
+    outbox.put(None)
+
+
+def _feed(iterator: Iterator[Any], inbox: Any, stop: Event, chunksize: int, failures: List[BaseException]) -> None:
+    try:
+        for chunk in chunks(iterator, chunksize):
+            if not _put(inbox, stop, chunk):
+                return
+    except BaseException as error:
+        failures.append(error)
+    _put(inbox, stop, None)
+
+
+def process_segment(stages: Sequence[Stage], maxsize: int, chunksize: int, iterator: Iterator[Any]) -> Iterator[Any]:
+    context = multiprocessing.get_context()
+    inbox = context.Queue(maxsize)
+    outbox = context.Queue(maxsize)
+    stop = Event()
+    failures: List[BaseException] = []
+    process = context.Process(target=_process_worker, args=(tuple(stages), inbox, outbox, chunksize), daemon=True)
+    process.start()
+    feeder = Thread(target=_feed, args=(iterator, inbox, stop, chunksize, failures), daemon=True)
+    feeder.start()
+    try:
+        while True:
+            chunk = _get(outbox, process)
+            if chunk is None:
+                break
+            if isinstance(chunk, _Failure):
+                raise chunk.error
+            yield from chunk
+        if failures:
+            raise failures[0]
+    finally:
+        stop.set()
+        feeder.join()
+        if process.is_alive():
+            process.terminate()
+        process.join()
+        for queue in (inbox, outbox):
+            queue.cancel_join_thread()
+            queue.close()
+
+
+def segment_stage(executor: str, maxsize: int, chunksize: int, stages: Sequence[Stage]) -> Stage:
+    label = '%s, maxsize=%d' % (executor, maxsize)
+    if stages:
+        label += ': ' + ' -> '.join(stage.describe() for stage in stages)
+    length = partial(resize, tuple(stages))
+    if executor == 'process':
+        return Stage('boundary', partial(process_segment, tuple(stages), maxsize, chunksize), label, length)
+    return Stage('boundary', partial(thread_segment, tuple(stages), maxsize), label, length)
@@ -0,0 +1,201 @@
+from __future__ import annotations
+from collections.abc import Callable, Iterator, Sequence
+from functools import lru_cache, partial
+from itertools import compress, filterfalse, starmap, tee
+from operator import not_
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Tuple, TypeVar
+
+from pyfluent.func import Composed
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pyfluent.profiling import Profiler
+
+I = TypeVar('I')
+
+ELEMENTWISE = frozenset(('map', 'filter', 'filterfalse', 'peek', 'starmap', 'starfilter', 'starpeek'))
+
+_STATEMENTS = {
+    'map': 'item = {call}',
+    'filter': 'if not {call}: continue',
+    'filterfalse': 'if {call}: continue',
+    'peek': '{call}',
+    'starmap': 'item = {call}',
+    'starfilter': 'if not {call}: continue',
+    'starpeek': '{call}',
+}
+
+
+def _peek_item(predicate: Callable[[I], None], item: I) -> I:
+    predicate(item)
+    return item
+
+
+def name_of(predicate: Any) -> str:
+    if isinstance(predicate, partial):
+        return 'partial(%s)' % name_of(predicate.func)
+    if isinstance(predicate, Composed):
+        return 'compose(%s)' % ', '.join(map(name_of, predicate.functions))
+    return getattr(predicate, '__qualname__', None) or type(predicate).__name__
+
+
+def same_length(size: int) -> int:
+    return size
+
+
+class Stage(NamedTuple):
+    kind: str
+    predicate: Optional[Callable[..., Any]]
+    label: str = ''
+    length: Optional[Callable[[int], Optional[int]]] = None
+
+    @property
+    def elementwise(self) -> bool:
+        return self.kind in ELEMENTWISE
+
+    def apply(self, iterator: Iterator[Any]) -> Iterator[Any]:
+        if self.kind == 'map':
+            return map(self.predicate, iterator)
+        if self.kind == 'filter':
+            return filter(self.predicate, iterator)
+        if self.kind == 'filterfalse':
+            return filterfalse(self.predicate, iterator)
+        if self.kind == 'peek':
+            return map(partial(_peek_item, self.predicate), iterator)
+        if self.kind == 'starmap':
+            return starmap(self.predicate, iterator)
+        if self.elementwise:
+            return fuse(iterator, [self])
+        return self.predicate(iterator)
+
+    def describe(self) -> str:
+        if self.label:
+            return '%s(%s)' % (self.kind, self.label)
+        if self.elementwise:
+            return '%s(%s)' % (self.kind, name_of(self.predicate))
+        return self.kind
+
+
+def resize(stages: Sequence[Stage], size: Optional[int]) -> Optional[int]:
+    for stage in stages:
+        if size is None or stage.length is None:
+            return None
+        size = stage.length(size)
+    return size
+
+
+def _call(kind: str, index: int, depth: int) -> str:
+    call = 'f%d_0(%s)' % (index, '*item' if kind.startswith('star') else 'item')
+    for position in range(1, depth):
+        call = 'f%d_%d(%s)' % (index, position, call)
+    return call
+
+
+@lru_cache(maxsize=None)
+def _compile(signature: Tuple[Tuple[str, int], ...]) -> Callable[..., Iterator[Any]]:
+    arguments = ''.join('f%d_%d, ' % (index, position)
+                        for index, (kind, depth) in enumerate(signature) for position in range(depth))
+    lines = ['def fused(%siterator):' % arguments, '    for item in iterator:']
+    lines.extend('        ' + _STATEMENTS[kind].format(call=_call(kind, index, depth))
+                 for index, (kind, depth) in enumerate(signature))
+    lines.append('        yield item')
+    namespace: Dict[str, Any] = {}
+    exec('\n'.join(lines), namespace)
+    return namespace['fused']
+
+
+def _predicate(stage: Stage) -> Callable[..., Any]:
+    if stage.predicate is None and stage.kind in ('filter', 'filterfalse'):
+        return bool
+    return stage.predicate
+
+
+def _functions(stage: Stage) -> Tuple[Callable[..., Any], ...]:
+    predicate = _predicate(stage)
+    return predicate.functions if isinstance(predicate, Composed) else (predicate,)
+
+
+def _chain(steps: Tuple[Tuple[bool, Callable[..., Any]], ...], iterator: Iterator[Any]) -> Iterator[Any]:
+    for star, function in steps:
+        iterator = starmap(function, iterator) if star else map(function, iterator)
+    return iterator
+
+
+def _select(keep: bool, functions: Tuple[Callable[..., Any], ...], iterator: Iterator[Any]) -> Iterator[Any]:
+    items, keys = tee(iterator)
+    for function in functions:
+        keys = map(function, keys)
+    return compress(items, keys if keep else map(not_, keys))
+
+
+def _native(stages: Sequence[Stage]) -> Optional[Tuple[Tuple[bool, Callable[..., Any]], ...]]:
+    steps: List[Tuple[bool, Callable[..., Any]]] = []
+    for stage in stages:
+        if stage.kind not in ('map', 'starmap'):
+            return None
+        functions = _functions(stage)
+        steps.append((stage.kind == 'starmap', functions[0]))
+        steps.extend((False, function) for function in functions[1:])
+    return tuple(steps)
+
+
+def _applies_directly(stage: Stage) -> bool:
+    if not stage.elementwise:
+        return True
+    return stage.kind in ('filter', 'filterfalse', 'peek') and not isinstance(stage.predicate, Composed)
+
+
+def _runner(stages: Sequence[Stage]) -> Callable[[Iterator[Any]], Iterator[Any]]:
+    if len(stages) == 1 and _applies_directly(stages[0]):
+        return stages[0].apply
+    steps = _native(stages)
+    if steps is not None:
+        return partial(_chain, steps)
+    if len(stages) == 1 and stages[0].kind in ('filter', 'filterfalse'):
+        return partial(_select, stages[0].kind == 'filter', _functions(stages[0]))
+    groups = [_functions(stage) for stage in stages]
+    signature = tuple((stage.kind, len(functions)) for stage, functions in zip(stages, groups))
+    return partial(_compile(signature), *[function for functions in groups for function in functions])
+
+
+def fuse(iterator: Iterator[Any], stages: Sequence[Stage]) -> Iterator[Any]:
+    return _runner(stages)(iterator)
+
+
+def segments(stages: Sequence[Stage]) -> List[Tuple[Stage, ...]]:
+    result: List[Tuple[Stage, ...]] = []
+    run: List[Stage] = []
+    for stage in stages:
+        if stage.elementwise:
+            run.append(stage)
+            continue
+        if run:
+            result.append(tuple(run))
+            run = []
+        result.append((stage,))
+    if run:
+        result.append(tuple(run))
+    return result
+
+
+def compile(stages: Sequence[Stage]) -> List[Callable[[Iterator[Any]], Iterator[Any]]]:
+    return [_runner(segment) for segment in segments(stages)]
+
+
+def build(iterator: Iterator[Any], stages: Sequence[Stage], profiler: Optional[Profiler] = None) -> Iterator[Any]:
+    if profiler is not None:
+        for stage in stages:
+            iterator = profiler.instrument(stage.describe(), stage.apply, iterator)
+        return iterator
+    for runner in compile(stages):
+        iterator = runner(iterator)
+    return iterator
+
+
+def explain(source: Any, stages: Sequence[Stage]) -> str:
+    lines = ['source(%s)' % type(source).__name__]
+    for segment in segments(stages):
+        if len(segment) > 1:
+            lines.append('fused[%s]' % ' -> '.join(stage.describe() for stage in segment))
+        else:
+            lines.append(segment[0].describe())
+    return '\n'.join(lines)
@@ -0,0 +1,108 @@
+from __future__ import annotations
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass
+from time import perf_counter, process_time
+import tracemalloc
+from typing import Any, Dict, List, Optional, TypeVar
+
+I = TypeVar('I')
+
+
+def _traced() -> int:
+    return tracemalloc.get_traced_memory()[0]
+
+
+def _untraced() -> int:
+    return 0
+
+
+@dataclass
+class StageStats(object):
+    name: str
+    items_in: int = 0
+    items_out: int = 0
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    allocated: Optional[int] = None
+    finished: bool = False
+
+
+class Profiler(object):
+
+    def __init__(self, callback: Optional[Callable[[StageStats], None]] = None, allocations: bool = False) -> None:
+        self.callback = callback
+        self.allocations = allocations
+        self.stats: List[StageStats] = []
+        self._started_tracing = False
+        self._running = 0
+
+    def _memory(self) -> Callable[[], int]:
+        if not self.allocations:
+            return _untraced
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return _traced
+
+    def instrument(self, name: str, apply: Callable[[Iterator[Any]], Iterator[Any]],
+                   iterator: Iterator[Any]) -> Iterator[Any]:
+        stats = StageStats(name, allocated=0 if self.allocations else None)
+        self.stats.append(stats)
+        memory = self._memory()
+        self._running += 1
+        return self._measure_output(stats, memory, apply(self._measure_input(stats, memory, iterator)))
+
+    def _measure_input(self, stats: StageStats, memory: Callable[[], int], iterator: Iterator[I]) -> Iterator[I]:
+        while True:
+            wall, cpu, allocated = perf_counter(), process_time(), memory()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                stats.wall_time -= perf_counter() - wall
+                stats.cpu_time -= process_time() - cpu
+                if stats.allocated is not None:
+                    stats.allocated -= memory() - allocated
+            stats.items_in += 1
+            yield item
+
+    def _measure_output(self, stats: StageStats, memory: Callable[[], int], iterator: Iterator[I]) -> Iterator[I]:
+        try:
+            while True:
+                wall, cpu, allocated = perf_counter(), process_time(), memory()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    stats.wall_time += perf_counter() - wall
+                    stats.cpu_time += process_time() - cpu
+                    if stats.allocated is not None:
+                        stats.allocated += memory() - allocated
+                stats.items_out += 1
+                yield item
+        finally:
+            stats.finished = True
+            self._running -= 1
+            if not self._running:
+                self.close()
+            if self.callback is not None:
+                self.callback(stats)
+
+    def report(self) -> List[Dict[str, Any]]:
+        return [asdict(stats) for stats in self.stats]
+
+    def format(self) -> str:
+        lines = ['%-40s %10s %10s %12s %12s %12s' % ('stage', 'in', 'out', 'wall [s]', 'cpu [s]', 'alloc [B]')]
+        for stats in self.stats:
+            allocated = '-' if stats.allocated is None else str(stats.allocated)
+            lines.append('%-40s %10d %10d %12.6f %12.6f %12s' % (stats.name[:40], stats.items_in, stats.items_out,
+                                                                 stats.wall_time, stats.cpu_time, allocated))
+        return '\n'.join(lines)
+
+    def close(self) -> None:
+        # stops tracing started by this profiler, called once the last instrumented stage finishes
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
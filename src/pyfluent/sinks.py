@@ -0,0 +1,80 @@
+from __future__ import annotations
+from collections.abc import Callable, Iterator, Mapping
+import bz2
+import csv
+import gzip
+import json
+import lzma
+from typing import IO, Any, List, Optional
+
+from pyfluent.batch import chunks
+
+BATCH_SIZE = 8192
+FORMATS = ('lines', 'jsonl', 'csv')
+COMPRESSIONS = {
+    'gzip': gzip.open,
+    'bz2': bz2.open,
+    'xz': lzma.open,
+}
+
+
+def check_batch_size(batch_size: int) -> None:
+    if batch_size < 1:
+        raise ValueError('Number of items written per batch must be positive, got %r' % batch_size)
+
+
+def check_sink(format: str, compression: Optional[str], batch_size: int) -> None:
+    if format not in FORMATS:
+        raise ValueError('Unknown file format %r, expected one of: %s' % (format, ', '.join(FORMATS)))
+    if compression is not None and compression not in COMPRESSIONS:
+        raise ValueError('Unknown compression %r, expected one of: %s' % (compression, ', '.join(COMPRESSIONS)))
+    check_batch_size(batch_size)
+
+
+def _open(path: str, compression: Optional[str], encoding: str, newline: Optional[str]) -> IO[str]:
+    if compression is None:
+        return open(path, 'w', encoding=encoding, newline=newline)
+    return COMPRESSIONS[compression](path, 'wt', encoding=encoding, newline=newline)
+
+
+def _write_lines(handle: IO[str], batch: List[Any], dumps: Callable[[Any], str]) -> None:
+    handle.write('\n'.join(map(dumps, batch)))
+    handle.write('\n')
+
+
+def _write_csv(handle: IO[str], batches: Iterator[List[Any]], formatting: Any) -> int:
+    written = 0
+    writer: Any = None
+    for batch in batches:
+        if writer is None:
+            if isinstance(batch[0], Mapping):
+                writer = csv.DictWriter(handle, list(batch[0]), **formatting)
+                writer.writeheader()
+            else:
+                writer = csv.writer(handle, **formatting)
+        writer.writerows(batch)
+        written += len(batch)
+    return written
+
+
+def write_file(path: str, format: str, compression: Optional[str], encoding: str, batch_size: int,
+               iterator: Iterator[Any], **formatting: Any) -> int:
+    check_sink(format, compression, batch_size)
+    with _open(path, compression, encoding, '' if format == 'csv' else None) as handle:
+        if format == 'csv':
+            return _write_csv(handle, chunks(iterator, batch_size), formatting)
+        dumps = str if format == 'lines' else json.dumps
+        written = 0
+        for batch in chunks(iterator, batch_size):
+            _write_lines(handle, batch, dumps)
+            written += len(batch)
+        return written
+
+
+def write_sink(write_batch: Callable[[List[Any]], Any], batch_size: int, iterator: Iterator[Any]) -> int:
+    check_batch_size(batch_size)
+    written = 0
+    for batch in chunks(iterator, batch_size):
+        write_batch(batch)
+        written += len(batch)
+    return written
@@ -0,0 +1,184 @@
+from __future__ import annotations
+from bisect import bisect_left
+from collections.abc import Hashable, Iterator, Sequence
+from hashlib import blake2b
+from itertools import accumulate, islice
+import math
+import random
+from typing import Any, List, Optional
+
+MASK64 = (1 << 64) - 1
+
+
+def mix64(value: int) -> int:
+    value = (value + 0x9E3779B97F4A7C15) & MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK64
+    return value ^ (value >> 31)
+
+
+def hash64(item: Hashable) -> int:
+    return mix64(hash(item) & MASK64)
+
+
+class BloomFilter(object):
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        if capacity < 1:
+            raise ValueError('Capacity must be positive, got %r' % capacity)
+        if not 0 < error_rate < 1:
+            raise ValueError('Error rate must be between 0 and 1, got %r' % error_rate)
+        self.size = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.hashes = max(1, int(round(self.size / capacity * math.log(2))))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: Hashable) -> List[int]:
+        value = hash64(item)
+        first, second = value & 0xFFFFFFFF, (value >> 32) | 1
+        return [(first + index * second) % self.size for index in range(self.hashes)]
+
+    def add(self, item: Hashable) -> bool:
+        bits = self._bits
+        present = True
+        for position in self._positions(item):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not bits[byte] & mask:
+                present = False
+                bits[byte] |= mask
+        return not present
+
+    def __contains__(self, item: Hashable) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+def stable_hash64(item: Any) -> int:
+    if isinstance(item, (int, float)):
+        return mix64(hash(item) & MASK64)
+    if isinstance(item, str):
+        item = item.encode('utf-8')
+    elif not isinstance(item, (bytes, bytearray, memoryview)):
+        item = repr(item).encode('utf-8')
+    return int.from_bytes(blake2b(item, digest_size=8).digest(), 'little')
+
+
+class HyperLogLog(object):
+
+    def __init__(self, precision: int = 14) -> None:
+        if not 4 <= precision <= 18:
+            raise ValueError('Precision must be between 4 and 18, got %r' % precision)
+        self.precision = precision
+        self._registers = bytearray(1 << precision)
+
+    def add(self, item: Any) -> HyperLogLog:
+        value = stable_hash64(item)
+        bits = 64 - self.precision
+        index = value >> bits
+        rank = bits - (value & ((1 << bits) - 1)).bit_length() + 1
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+        return self
+
+    def merge(self, other: HyperLogLog) -> HyperLogLog:
+        if other.precision != self.precision:
+            raise ValueError('Cannot merge sketches with precision %d and %d' % (self.precision, other.precision))
+        self._registers = bytearray(map(max, self._registers, other._registers))
+        return self
+
+    def count(self) -> int:
+        size = len(self._registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / math.fsum(2.0 ** -register for register in self._registers)
+        zeros = self._registers.count(0)
+        if estimate <= 2.5 * size and zeros:
+            estimate = size * math.log(size / zeros)
+        return int(round(estimate))
+
+
+class KllSketch(object):
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None) -> None:
+        if k < 8:
+            raise ValueError('Sketch size must be at least 8, got %r' % k)
+        self.k = k
+        self.count = 0
+        self._random = random.Random(seed)
+        self._compactors: List[List[Any]] = []
+        self._size = 0
+        self._max_size = 0
+        self._grow()
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._compactors) - level - 1
+        return max(2, int(math.ceil(self.k * (2.0 / 3.0) ** depth)))
+
+    def _grow(self) -> None:
+        self._compactors.append([])
+        self._max_size = sum(self._capacity(level) for level in range(len(self._compactors)))
+
+    def _compress(self) -> None:
+        for level, compactor in enumerate(self._compactors):
+            if len(compactor) < self._capacity(level):
+                continue
+            if level + 1 == len(self._compactors):
+                self._grow()
+            compactor.sort()
+            last = compactor.pop() if len(compactor) % 2 else None
+            self._compactors[level + 1].extend(compactor[self._random.random() < 0.5::2])
+            compactor.clear()
+            if last is not None:
+                compactor.append(last)
+            self._size = sum(map(len, self._compactors))
+            if self._size < self._max_size:
+                return
+
+    def add(self, item: Any) -> KllSketch:
+        self._compactors[0].append(item)
+        self.count += 1
+        self._size += 1
+        if self._size >= self._max_size:
+            self._compress()
+        return self
+
+    def merge(self, other: KllSketch) -> KllSketch:
+        while len(self._compactors) < len(other._compactors):
+            self._grow()
+        for level, compactor in enumerate(other._compactors):
+            self._compactors[level].extend(compactor)
+        self.count += other.count
+        self._size = sum(map(len, self._compactors))
+        while self._size >= self._max_size:
+            self._compress()
+        return self
+
+    def quantiles(self, qs: Sequence[float]) -> List[Any]:
+        for q in qs:
+            if not 0 <= q <= 1:
+                raise ValueError('Quantile must be between 0 and 1, got %r' % q)
+        weighted = sorted((item, 1 << level) for level, compactor in enumerate(self._compactors) for item in compactor)
+        if not weighted:
+            return [None for _ in qs]
+        total = sum(weight for _, weight in weighted)
+        ranks = list(accumulate(weight for _, weight in weighted))
+        return [weighted[min(bisect_left(ranks, q * total), len(weighted) - 1)][0] for q in qs]
+
+
+def _open_unit(generator: random.Random) -> float:
+    return generator.random() or 1e-300
+
+
+def reservoir_sample(size: int, seed: Optional[int], iterator: Iterator[Any]) -> List[Any]:
+    if size < 0:
+        raise ValueError('Sample size must be non-negative, got %r' % size)
+    reservoir = list(islice(iterator, size))
+    if len(reservoir) < size or not size:
+        return reservoir
+    generator = random.Random(seed)
+    weight = math.exp(math.log(_open_unit(generator)) / size)
+    while True:
+        skip = int(math.log(_open_unit(generator)) / math.log1p(-weight)) if weight < 1 else 0
+        item = next(islice(iterator, skip, None), reservoir)
+        if item is reservoir:
+            return reservoir
+        reservoir[generator.randrange(size)] = item
+        weight *= math.exp(math.log(_open_unit(generator)) / size)
@@ -0,0 +1,64 @@
+from __future__ import annotations
+from collections.abc import Callable, Iterator
+import heapq
+from itertools import islice
+import pickle
+import tempfile
+from typing import IO, Any, List, Optional
+
+from pyfluent.batch import chunks
+
+FRAME_SIZE = 1024
+
+
+def _spill(run: List[Any]) -> IO[bytes]:
+    spill = tempfile.TemporaryFile()
+    for frame in chunks(iter(run), FRAME_SIZE):
+        pickle.dump(frame, spill, pickle.HIGHEST_PROTOCOL)
+    spill.seek(0)
+    return spill
+
+
+def _read(spill: IO[bytes]) -> Iterator[Any]:
+    while True:
+        try:
+            frame = pickle.load(spill)
+        except EOFError:
+            return
+        yield from frame
+
+
+def external_sort(key: Optional[Callable[[Any], Any]],
+                  reverse: bool,
+                  memory_limit: Optional[int],
+                  iterator: Iterator[Any]) -> Iterator[Any]:
+    if memory_limit is None:
+        yield from sorted(iterator, key=key, reverse=reverse)
+        return
+    run = list(islice(iterator, memory_limit))
+    run.sort(key=key, reverse=reverse)
+    spills: List[IO[bytes]] = []
+    try:
+        for chunk in chunks(iterator, memory_limit):
+            spills.append(_spill(run))
+            run = chunk
+            run.sort(key=key, reverse=reverse)
+        if not spills:
+            yield from run
+            return
+        spills.append(_spill(run))
+        del run
+        yield from heapq.merge(*map(_read, spills), key=key, reverse=reverse)
+    finally:
+        for spill in spills:
+            spill.close()
+
+
+def check_memory_limit(memory_limit: Optional[int]) -> None:
+    if memory_limit is not None and memory_limit < 1:
+        raise ValueError('Memory limit must be a positive number of items, got %r' % memory_limit)
+
+
+def check_k(k: int) -> None:
+    if k < 0:
+        raise ValueError('Number of items must be non-negative, got %r' % k)
@@ -0,0 +1,256 @@
+from __future__ import annotations
+from collections.abc import Callable, Iterator
+import bz2
+import csv
+from functools import partial
+import gzip
+import io
+import json
+import lzma
+import mmap
+import os
+import re
+from typing import IO, Any, Dict, List, Optional, Tuple, Union
+import zlib
+
+from pyfluent.parallel import parallel_map
+from pyfluent.pipelining import thread_segment
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+BLOCK_SIZE = 1 << 20
+PREFETCH = 16
+MEMBER_LIMIT = 4 << 20
+SEGMENT_STEP = 1 << 16
+
+OPENERS: Dict[str, Callable[..., IO[bytes]]] = {
+    'gzip': gzip.open,
+    'bz2': bz2.open,
+    'xz': lzma.open,
+}
+if zstandard is not None:  # pragma: no cover
+    OPENERS['zstd'] = zstandard.open
+
+DECOMPRESSORS: Dict[str, Callable[[], Any]] = {
+    'gzip': partial(zlib.decompressobj, 31),
+    'bz2': bz2.BZ2Decompressor,
+    'xz': lzma.LZMADecompressor,
+}
+
+MAGIC = {
+    'gzip': re.compile(b'\x1f\x8b\x08'),
+    'bz2': re.compile(b'BZh[1-9](?:1AY&SY|\x17rE8P\x90)'),
+    'xz': re.compile(b'\xfd7zXZ\x00'),
+}
+
+EXTENSIONS = {
+    '.gz': 'gzip',
+    '.bz2': 'bz2',
+    '.xz': 'xz',
+    '.zst': 'zstd',
+}
+
+
+def check_partition(partition: int, partitions: int) -> None:
+    if partitions < 1:
+        raise ValueError('Number of partitions must be positive, got %r' % partitions)
+    if not 0 <= partition < partitions:
+        raise ValueError('Partition must be in range [0, %d), got %r' % (partitions, partition))
+
+
+def byte_range(size: int, partition: int, partitions: int) -> Tuple[int, int]:
+    check_partition(partition, partitions)
+    return size * partition // partitions, size * (partition + 1) // partitions
+
+
+def _blocks(handle: Union[IO[bytes], mmap.mmap], start: int, end: int, block_size: int) -> Iterator[bytes]:
+    # yields blocks of complete lines, each line belongs to the range its first byte falls into
+    if start > 0:
+        handle.seek(start - 1)
+        offset = start - 1 + len(handle.readline())
+    else:
+        handle.seek(0)
+        offset = 0
+    pending = b''
+    while offset < end:
+        block = handle.read(block_size)
+        if not block:
+            if pending:
+                yield pending
+            return
+        data = pending + block if pending else block
+        cut = data.rfind(b'\n') + 1
+        if cut > end - offset:
+            yield data[:data.find(b'\n', end - offset - 1)]
+            return
+        if cut:
+            yield data[:cut - 1]
+        pending = data[cut:]
+        offset += cut
+
+
+def _complete_lines(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    pending = b''
+    for chunk in chunks:
+        data = pending + chunk if pending else chunk
+        cut = data.rfind(b'\n') + 1
+        if cut:
+            yield data[:cut - 1]
+        pending = data[cut:]
+    if pending:
+        yield pending
+
+
+def _stream(path: str, compression: str, block_size: int, offset: int = 0) -> Iterator[bytes]:
+    with open(path, 'rb') as raw:
+        raw.seek(offset)
+        with OPENERS[compression](raw, 'rb') as handle:
+            yield from iter(partial(handle.read, block_size), b'')
+
+
+def _decode_segment(compression: str, view: memoryview, bounds: Tuple[int, int]) -> Optional[bytes]:
+    decompressor = DECOMPRESSORS[compression]()
+    begin, end = bounds
+    parts: List[bytes] = []
+    size = 0
+    try:
+        for offset in range(begin, end, SEGMENT_STEP):
+            if decompressor.eof:
+                return None
+            parts.append(decompressor.decompress(view[offset:min(offset + SEGMENT_STEP, end)],
+                                                 MEMBER_LIMIT - size + 1))
+            size += len(parts[-1])
+            if size > MEMBER_LIMIT:
+                return None
+    except (OSError, EOFError, zlib.error, lzma.LZMAError):
+        return None
+    if not decompressor.eof or decompressor.unused_data:
+        return None
+    return b''.join(parts)
+
+
+def _members(path: str, compression: str, workers: int, block_size: int) -> Iterator[bytes]:
+    # member headers are only candidates, a segment that does not decode to exactly one member of bounded size
+    # means a false header or a large member, so the rest of the file is streamed sequentially
+    fallback = 0
+    with open(path, 'rb') as handle:
+        if not os.fstat(handle.fileno()).st_size:
+            return
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            offsets = [match.start() for match in MAGIC[compression].finditer(mapped)]
+            if len(offsets) > 1 and offsets[0] == 0:
+                segments = list(zip(offsets, offsets[1:] + [len(mapped)]))
+                with memoryview(mapped) as view:
+                    decoded = parallel_map(partial(_decode_segment, compression, view), workers, 'thread', 1, True,
+                                           iter(segments))
+                    try:
+                        for (begin, end), data in zip(segments, decoded):
+                            if data is None:
+                                fallback = begin
+                                break
+                            yield data
+                        else:
+                            return
+                    finally:
+                        decoded.close()
+    yield from _stream(path, compression, block_size, fallback)
+
+
+def infer_compression(path: str) -> Optional[str]:
+    return EXTENSIONS.get(os.path.splitext(path)[1])
+
+
+def check_compression(compression: Optional[str], partitions: int, workers: int) -> None:
+    if compression is None or compression == 'infer':
+        return
+    if compression not in OPENERS and compression != 'zstd':
+        raise ValueError('Unknown compression %r, expected one of: %s' % (compression, ', '.join(EXTENSIONS.values())))
+    if compression == 'zstd' and zstandard is None:
+        raise ImportError('zstandard is required for compression %r' % compression)
+    if partitions != 1:
+        raise ValueError('Compressed files cannot be split into byte ranges')
+    if workers < 1:
+        raise ValueError('Number of workers must be positive, got %r' % workers)
+
+
+def _decompressed(path: str, compression: str, workers: int, block_size: int) -> Iterator[bytes]:
+    if workers > 1 and compression in MAGIC:
+        chunks: Iterator[bytes] = _members(path, compression, workers, block_size)
+    else:
+        chunks = _stream(path, compression, block_size)
+    return _complete_lines(thread_segment((), PREFETCH, chunks))
+
+
+def read_blocks(path: str, partition: int = 0, partitions: int = 1, block_size: int = BLOCK_SIZE,
+                compression: Optional[str] = None, workers: int = 1) -> Iterator[bytes]:
+    if block_size < 1:
+        raise ValueError('Block size must be positive, got %r' % block_size)
+    check_partition(partition, partitions)
+    if compression == 'infer':
+        compression = infer_compression(path)
+    check_compression(compression, partitions, workers)
+    if compression is not None:
+        yield from _decompressed(path, compression, workers, block_size)
+        return
+    with open(path, 'rb') as handle:
+        size = os.fstat(handle.fileno()).st_size
+        start, end = byte_range(size, partition, partitions)
+        try:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        except (OSError, ValueError):
+            mapped = None
+        if mapped is None:
+            yield from _blocks(handle, start, end, block_size)
+            return
+        with mapped:
+            yield from _blocks(mapped, start, end, block_size)
+
+
+def read_lines(path: str, binary: bool = False, encoding: str = 'utf-8', partition: int = 0, partitions: int = 1,
+               block_size: int = BLOCK_SIZE, compression: Optional[str] = None,
+               workers: int = 1) -> Iterator[Union[bytes, str]]:
+    for block in read_blocks(path, partition, partitions, block_size, compression, workers):
+        if binary:
+            yield from block.split(b'\n')
+            continue
+        text = block.decode(encoding)
+        if '\r' in text:
+            # universal newlines, as open() does in text mode, a block always ends right before a '\n'
+            text = text[:-1] if text.endswith('\r') else text
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        yield from text.split('\n')
+
+
+def _csv_lines(path: str, encoding: str, partition: int, partitions: int, block_size: int,
+               compression: Optional[str], workers: int) -> Iterator[str]:
+    # csv needs the line terminators to tell a quoted newline from the end of a record, the same way a file opened
+    # with newline='' keeps them
+    for block in read_blocks(path, partition, partitions, block_size, compression, workers):
+        yield from io.StringIO(block.decode(encoding) + '\n', newline='')
+
+
+def read_jsonl(path: str, loads: Callable[[bytes], Any] = json.loads, partition: int = 0, partitions: int = 1,
+               block_size: int = BLOCK_SIZE, compression: Optional[str] = None, workers: int = 1) -> Iterator[Any]:
+    for line in read_lines(path, True, 'utf-8', partition, partitions, block_size, compression, workers):
+        if line.strip():
+            yield loads(line)
+
+
+def _header(path: str, encoding: str, formatting: Dict[str, Any]) -> Optional[List[str]]:
+    with open(path, newline='', encoding=encoding) as handle:
+        return next(csv.reader(handle, **formatting), None)
+
+
+def read_csv(path: str, header: bool = True, encoding: str = 'utf-8', partition: int = 0, partitions: int = 1,
+             block_size: int = BLOCK_SIZE, compression: Optional[str] = None, workers: int = 1,
+             **formatting: Any) -> Iterator[Any]:
+    lines = _csv_lines(path, encoding, partition, partitions, block_size, compression, workers)
+    if not header:
+        yield from csv.reader(lines, **formatting)
+    elif partition == 0:
+        yield from csv.DictReader(lines, **formatting)
+    else:
+        yield from csv.DictReader(lines, _header(path, encoding, formatting), **formatting)
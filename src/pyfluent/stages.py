@@ -0,0 +1,188 @@
+from __future__ import annotations
+from collections.abc import Callable, Iterable, Iterator, Sized
+from concurrent.futures import Executor
+from functools import partial
+from itertools import chain
+from operator import add
+from typing import Any, List, Optional, Tuple, TypeVar, Union
+
+from pyfluent.batch import check_format, check_size, chunks, map_batches
+from pyfluent.distinct import check_distinct, distinct
+from pyfluent.join import check_join, hash_join, merge_join
+from pyfluent.parallel import check_parallel, parallel_map
+from pyfluent.pipelining import check_boundary, check_prefetch, segment_stage, thread_segment
+from pyfluent.plan import Stage, name_of, same_length
+from pyfluent.sort import check_memory_limit, external_sort
+from pyfluent.views import Slicer
+from pyfluent.window import check_aggregate, check_window, rolling, windows
+
+I = TypeVar('I')
+O = TypeVar('O')
+S = TypeVar('S', bound='Stages')
+
+
+def _batch(size: int, iterator: Iterator[I]) -> Iterator[List[I]]:
+    return chunks(iterator, size)
+
+
+def _batch_length(size: int, items: int) -> int:
+    return -(-items // size)
+
+
+def _extend_length(items: Iterable[Any]) -> Optional[Callable[[int], int]]:
+    if isinstance(items, Sized):
+        return partial(add, len(items))
+    return None
+
+
+def _rolling_length(size: int, items: int) -> int:
+    return max(items - size + 1, 0)
+
+
+def _prepend(items: Iterable[I], iterator: Iterator[I]) -> Iterator[I]:
+    return chain(items, iterator)
+
+
+def _append(items: Iterable[I], iterator: Iterator[I]) -> Iterator[I]:
+    return chain(iterator, items)
+
+
+class Stages(object):
+
+    def _then(self: S, stage: Stage) -> S:
+        raise NotImplementedError()
+
+    def _absorb(self: S, factory: Callable[[Tuple[Stage, ...]], Stage]) -> S:
+        raise NotImplementedError()
+
+    def peek(self: S, predicate: Callable[[Any], None]) -> S:
+        return self._then(Stage('peek', predicate, length=same_length))
+
+    def map(self: S, predicate: Callable[[Any], Any]) -> S:
+        return self._then(Stage('map', predicate, length=same_length))
+
+    def starmap(self: S, predicate: Callable[..., Any]) -> S:
+        return self._then(Stage('starmap', predicate, length=same_length))
+
+    def starfilter(self: S, predicate: Callable[..., bool]) -> S:
+        return self._then(Stage('starfilter', predicate))
+
+    def starpeek(self: S, predicate: Callable[..., None]) -> S:
+        return self._then(Stage('starpeek', predicate, length=same_length))
+
+    def parallelMap(self: S,
+                    predicate: Callable[[Any], Any],
+                    workers: Optional[int] = None,
+                    executor: Union[str, Executor] = 'thread',
+                    chunksize: int = 1,
+                    ordered: bool = True) -> S:
+        check_parallel(executor, chunksize)
+        stage = partial(parallel_map, predicate, workers, executor, chunksize, ordered)
+        label = '%s, executor=%r' % (name_of(predicate), executor)
+        return self._then(Stage('parallelMap', stage, label, same_length))
+
+    def filter(self: S, predicate: Callable[[Any], bool]) -> S:
+        return self._then(Stage('filter', predicate))
+
+    def filterfalse(self: S, predicate: Callable[[Any], bool]) -> S:
+        return self._then(Stage('filterfalse', predicate))
+
+    def flatten(self: S) -> S:
+        return self._then(Stage('flatten', chain.from_iterable))
+
+    def batch(self: S, size: int) -> S:
+        check_size(size)
+        return self._then(Stage('batch', partial(_batch, size), str(size), partial(_batch_length, size)))
+
+    def unbatch(self: S) -> S:
+        return self._then(Stage('unbatch', chain.from_iterable))
+
+    def mapBatches(self: S, predicate: Callable[[Any], Iterable[Any]], size: int = 1024, format: str = 'list') -> S:
+        check_size(size)
+        check_format(format)
+        stage = partial(map_batches, predicate, size, format)
+        return self._then(Stage('mapBatches', stage, '%s, size=%d, format=%r' % (name_of(predicate), size, format)))
+
+    def enumerate(self: S) -> S:
+        return self._then(Stage('enumerate', enumerate, length=same_length))
+
+    def skip(self: S, num: int) -> S:
+        if num < 0:
+            raise ValueError('Number of items to skip must be non-negative, got %r' % num)
+        slicer = Slicer(num, None)
+        return self._then(Stage('skip', slicer, str(num), slicer.length))
+
+    def take(self: S, num: int) -> S:
+        if num < 0:
+            raise ValueError('Number of items to take must be non-negative, got %r' % num)
+        slicer = Slicer(0, num)
+        return self._then(Stage('take', slicer, str(num), slicer.length))
+
+    limit = take
+
+    def slice(self: S, start: int, stop: Optional[int] = None, step: int = 1) -> S:
+        slicer = Slicer(start, stop, step)
+        label = '%d:%s:%d' % (start, '' if stop is None else stop, step)
+        return self._then(Stage('slice', slicer, label, slicer.length))
+
+    def prepend(self: S, item: Any) -> S:
+        if not isinstance(item, Iterable):
+            item = [item]
+        return self._then(Stage('prepend', partial(_prepend, item), type(item).__name__, _extend_length(item)))
+
+    def append(self: S, item: Any) -> S:
+        if not isinstance(item, Iterable):
+            item = [item]
+        return self._then(Stage('append', partial(_append, item), type(item).__name__, _extend_length(item)))
+
+    # boundary and prefetch workers stop when the chain is exhausted or closed, a short-circuit terminal such as
+    # first() or anyMatch() leaves the rest of the chain readable, so its workers stay parked until close()
+    def boundary(self: S, executor: str = 'thread', maxsize: int = 16, chunksize: int = 64) -> S:
+        check_boundary(executor, maxsize, chunksize)
+        return self._absorb(partial(segment_stage, executor, maxsize, chunksize))
+
+    def prefetch(self: S, size: int = 16) -> S:
+        check_prefetch(size)
+        return self._then(Stage('prefetch', partial(thread_segment, (), size), str(size), same_length))
+
+    def sorted(self: S,
+               key: Optional[Callable[[Any], Any]] = None,
+               reverse: bool = False,
+               memoryLimit: Optional[int] = None) -> S:
+        check_memory_limit(memoryLimit)
+        stage = partial(external_sort, key, reverse, memoryLimit)
+        label = 'key=%s, reverse=%r' % (key and name_of(key), reverse)
+        return self._then(Stage('sorted', stage, label, same_length))
+
+    def window(self: S, size: int, step: Optional[int] = None, incomplete: bool = False, view: bool = False) -> S:
+        step = size if step is None else step
+        check_window(size, step)
+        stage = partial(windows, size, step, incomplete, view)
+        return self._then(Stage('window', stage, 'size=%d, step=%d' % (size, step)))
+
+    def rolling(self: S, size: int, aggregate: Union[str, Callable[[Any], Any]], incomplete: bool = False) -> S:
+        check_window(size, 1)
+        check_aggregate(aggregate)
+        label = 'size=%d, %s' % (size, aggregate if isinstance(aggregate, str) else name_of(aggregate))
+        length = same_length if incomplete else partial(_rolling_length, size)
+        return self._then(Stage('rolling', partial(rolling, size, aggregate, incomplete), label, length))
+
+    def join(self: S,
+             other: Iterable[Any],
+             leftKey: Callable[[Any], Any],
+             rightKey: Optional[Callable[[Any], Any]] = None,
+             how: str = 'inner',
+             strategy: str = 'hash') -> S:
+        check_join(how, strategy)
+        join = hash_join if strategy == 'hash' else merge_join
+        stage = partial(join, other, leftKey, rightKey or leftKey, how)
+        return self._then(Stage('join', stage, '%s, how=%r, strategy=%r' % (name_of(leftKey), how, strategy)))
+
+    def distinct(self: S,
+                 key: Optional[Callable[[Any], Any]] = None,
+                 mode: str = 'exact',
+                 capacity: Optional[int] = None,
+                 errorRate: float = 0.01) -> S:
+        check_distinct(mode, capacity, errorRate)
+        stage = partial(distinct, key, mode, capacity, errorRate)
+        return self._then(Stage('distinct', stage, 'mode=%r, capacity=%r' % (mode, capacity)))
@@ -0,0 +1,70 @@
+from __future__ import annotations
+from collections.abc import Iterator, Sequence
+from itertools import islice
+from typing import Any, Optional, Union
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+class SequenceView(Sequence):
+
+    def __init__(self, sequence: Sequence[Any], indices: range) -> None:
+        self._sequence = sequence
+        self._indices = indices
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return SequenceView(self._sequence, self._indices[index])
+        return self._sequence[self._indices[index]]
+
+    def __iter__(self) -> Iterator[Any]:
+        return map(self._sequence.__getitem__, self._indices)
+
+    def __repr__(self) -> str:
+        return 'SequenceView(%s, %r)' % (type(self._sequence).__name__, self._indices)
+
+
+def _slices_natively(source: Any) -> bool:
+    return isinstance(source, (range, memoryview, SequenceView)) or \
+        numpy is not None and isinstance(source, numpy.ndarray)
+
+
+# sequences with constant time indexing, others like deque index in linear time and are iterated with islice
+INDEXABLE = (list, tuple, str, bytes, bytearray)
+
+
+def sliceable(source: Any) -> bool:
+    return isinstance(source, INDEXABLE) or _slices_natively(source)
+
+
+def slice_source(source: Any, bounds: slice) -> Any:
+    if _slices_natively(source):
+        return source[bounds]
+    return SequenceView(source, range(len(source))[bounds])
+
+
+def check_slice(start: int, stop: Optional[int], step: int) -> None:
+    if start < 0 or stop is not None and stop < 0:
+        raise ValueError('Slice bounds must be non-negative, got %r:%r' % (start, stop))
+    if step < 1:
+        raise ValueError('Slice step must be positive, got %r' % step)
+
+
+class Slicer(object):
+    __slots__ = ('bounds',)
+
+    def __init__(self, start: int, stop: Optional[int], step: int = 1) -> None:
+        check_slice(start, stop, step)
+        self.bounds = slice(start, stop, step)
+
+    def __call__(self, iterator: Iterator[Any]) -> Iterator[Any]:
+        return islice(iterator, self.bounds.start, self.bounds.stop, self.bounds.step)
+
+    def length(self, size: int) -> int:
+        return len(range(size)[self.bounds])
@@ -0,0 +1,113 @@
+from __future__ import annotations
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from itertools import islice
+import operator
+from typing import Any, Deque, Tuple, Union
+
+
+class WindowView(Sequence):
+
+    __slots__ = ('_buffer',)
+
+    def __init__(self, buffer: Deque[Any]) -> None:
+        self._buffer = buffer
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self._buffer[position] for position in range(*index.indices(len(self._buffer)))]
+        return self._buffer[index]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._buffer)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(map(operator.eq, self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return 'WindowView(%r)' % list(self._buffer)
+
+
+def check_window(size: int, step: int) -> None:
+    if size < 1:
+        raise ValueError('Window size must be positive, got %r' % size)
+    if step < 1:
+        raise ValueError('Window step must be positive, got %r' % step)
+
+
+def windows(size: int, step: int, incomplete: bool, view: bool, iterator: Iterator[Any]) -> Iterator[Sequence[Any]]:
+    # with view=True every window is the same WindowView over the buffer, valid only until the next item is pulled,
+    # so it must be consumed right away and not collected or passed to another thread
+    buffer: Deque[Any] = deque(maxlen=size)
+    shared = WindowView(buffer)
+    start = 0
+    index = -1
+    for index, item in enumerate(iterator):
+        buffer.append(item)
+        if index == start + size - 1:
+            yield shared if view else tuple(buffer)
+            start += step
+    if incomplete and start <= index:
+        yield tuple(islice(buffer, max(len(buffer) - (index - start + 1), 0), None))
+
+
+def _rolling_sum(size: int, incomplete: bool, mean: bool, iterator: Iterator[Any]) -> Iterator[Any]:
+    buffer: Deque[Any] = deque()
+    total = 0
+    for item in iterator:
+        buffer.append(item)
+        total += item
+        if len(buffer) > size:
+            total -= buffer.popleft()
+        if incomplete or len(buffer) == size:
+            yield total / len(buffer) if mean else total
+
+
+def _rolling_extreme(size: int, incomplete: bool, better: Callable[[Any, Any], bool],
+                     iterator: Iterator[Any]) -> Iterator[Any]:
+    candidates: Deque[Tuple[int, Any]] = deque()
+    for index, item in enumerate(iterator):
+        while candidates and not better(candidates[-1][1], item):
+            candidates.pop()
+        candidates.append((index, item))
+        if candidates[0][0] <= index - size:
+            candidates.popleft()
+        if incomplete or index >= size - 1:
+            yield candidates[0][1]
+
+
+def _rolling_generic(size: int, incomplete: bool, aggregate: Callable[[Sequence[Any]], Any],
+                     iterator: Iterator[Any]) -> Iterator[Any]:
+    buffer: Deque[Any] = deque(maxlen=size)
+    view = WindowView(buffer)
+    for item in iterator:
+        buffer.append(item)
+        if incomplete or len(buffer) == size:
+            yield aggregate(view)
+
+
+def rolling(size: int, aggregate: Union[str, Callable[[Sequence[Any]], Any]], incomplete: bool,
+            iterator: Iterator[Any]) -> Iterator[Any]:
+    if aggregate == 'sum':
+        return _rolling_sum(size, incomplete, False, iterator)
+    if aggregate == 'mean':
+        return _rolling_sum(size, incomplete, True, iterator)
+    if aggregate == 'min':
+        return _rolling_extreme(size, incomplete, operator.lt, iterator)
+    if aggregate == 'max':
+        return _rolling_extreme(size, incomplete, operator.gt, iterator)
+    return _rolling_generic(size, incomplete, aggregate, iterator)
+
+
+AGGREGATES = ('sum', 'mean', 'min', 'max')
+
+
+def check_aggregate(aggregate: Union[str, Callable[[Sequence[Any]], Any]]) -> None:
+    if isinstance(aggregate, str) and aggregate not in AGGREGATES:
+        raise ValueError('Unknown rolling aggregate %r, expected callable or one of: %s' %
+                         (aggregate, ', '.join(AGGREGATES)))
@@ -0,0 +1,93 @@
+from operator import itemgetter
+
+import mock
+import unittest
+
+from pyfluent import aggregate
+from pyfluent.aggregate import Count, Fields, Max, Mean, Min, Reduce, Sum, fields, group_by
+from pyfluent.iterator import FluentIterator
+
+ROWS = [('a', 1), ('b', 5), ('a', 3), ('c', 2), ('b', -1), ('a', 2)]
+value = itemgetter(1)
+key = itemgetter(0)
+
+
+class AggregatorsTest(unittest.TestCase):
+
+    def fold(self, aggregator, items):
+        accumulator = aggregator.create()
+        for item in items:
+            accumulator = aggregator.add(accumulator, item)
+        return accumulator
+
+    def test_partial_results_are_mergeable(self) -> None:
+        for aggregator in (Count(), Sum(value), Min(value), Max(value), Mean(value), Reduce(max, 0, value=value)):
+            whole = self.fold(aggregator, ROWS)
+            merged = aggregator.merge(self.fold(aggregator, ROWS[:2]), self.fold(aggregator, ROWS[2:]))
+            self.assertEqual(aggregator.result(merged), aggregator.result(whole), type(aggregator).__name__)
+
+    def test_min_and_max_merge_empty_partials(self) -> None:
+        self.assertEqual(Min().merge(None, 3), 3)
+        self.assertEqual(Max().merge(3, None), 3)
+
+    def test_mean_of_nothing_is_none(self) -> None:
+        self.assertIsNone(Mean().result(Mean().create()))
+
+    def test_reduce_copies_initializer(self) -> None:
+        aggregator = Reduce(lambda acc, item: acc | {item}, set())
+        self.assertIsNot(aggregator.create(), aggregator.create())
+
+    def test_fields_builds_named_aggregators(self) -> None:
+        aggregator = fields({'sum': value, 'top': Max(value)})
+        self.assertIsInstance(aggregator, Fields)
+        self.assertEqual(aggregator.result(self.fold(aggregator, ROWS)), {'sum': 12, 'top': 5})
+
+    def test_fields_rejects_unknown_shortcut(self) -> None:
+        with self.assertRaises(TypeError):
+            fields({'median': value})
+
+
+class GroupByTest(unittest.TestCase):
+
+    def test_groups_without_spilling(self) -> None:
+        with mock.patch.object(aggregate, '_Spill') as spill:
+            self.assertEqual(group_by(key, Sum(value), None, iter(ROWS)), {'a': 6, 'b': 4, 'c': 2})
+        spill.assert_not_called()
+
+    def test_spills_when_number_of_keys_is_exceeded(self) -> None:
+        result = group_by(key, fields({'sum': value, 'mean': value}), 1, iter(ROWS), partitions=2)
+        self.assertEqual(result, {
+            'a': {'sum': 6, 'mean': 2.0},
+            'b': {'sum': 4, 'mean': 2.0},
+            'c': {'sum': 2, 'mean': 2.0},
+        })
+
+    def test_spilled_result_equals_in_memory_result(self) -> None:
+        rows = [(item % 37, item) for item in range(1000)]
+        self.assertEqual(group_by(key, Mean(value), 5, iter(rows)), group_by(key, Mean(value), None, iter(rows)))
+
+    def test_max_keys_must_be_positive(self) -> None:
+        with self.assertRaises(ValueError):
+            group_by(key, Count(), 0, iter([]))
+
+
+class FluentIteratorGroupByTest(unittest.TestCase):
+
+    def test_group_by_counts_by_default(self) -> None:
+        self.assertEqual(FluentIterator(ROWS).groupBy(key), {'a': 3, 'b': 2, 'c': 1})
+
+    def test_group_by_with_aggregator(self) -> None:
+        self.assertEqual(FluentIterator(ROWS).groupBy(key, Min(value)), {'a': 1, 'b': -1, 'c': 2})
+
+    def test_count_by(self) -> None:
+        result = FluentIterator('abracadabra').countBy(str, maxKeys=2)
+        self.assertEqual(result, {'a': 5, 'b': 2, 'r': 2, 'c': 1, 'd': 1})
+
+    def test_aggregate(self) -> None:
+        result = FluentIterator(ROWS).aggregate(key, sum=value, min=value, max=value, n=Count())
+        self.assertEqual(result['a'], {'sum': 6, 'min': 1, 'max': 3, 'n': 3})
+
+    def test_group_by_exhausts_iterator(self) -> None:
+        itr = FluentIterator(ROWS)
+        itr.countBy(key)
+        self.assertSequenceEqual(itr.collect(), [])
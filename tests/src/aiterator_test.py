@@ -0,0 +1,119 @@
+import asyncio
+from typing import Any, AsyncIterator, List
+
+import mock
+import unittest
+
+from pyfluent.aiterator import AsyncFluentIterator
+
+
+async def _agen(values: List[Any]) -> AsyncIterator[Any]:
+    for value in values:
+        yield value
+
+
+async def _adouble(item: int) -> int:
+    await asyncio.sleep(0)
+    return item * 2
+
+
+class AsyncFluentIteratorTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.iterator_values = [1, 2, 3]
+        self.iterator = AsyncFluentIterator(_agen(self.iterator_values))
+
+    async def test_accepts_sync_iterables(self) -> None:
+        self.assertSequenceEqual(await AsyncFluentIterator(range(3)).collect(), [0, 1, 2])
+
+    async def test_collect_exhaust_iterator(self) -> None:
+        self.assertSequenceEqual(await self.iterator.collect(), self.iterator_values)
+        self.assertSequenceEqual(await self.iterator.collect(), [])
+
+    async def test_collect_uses_factory(self) -> None:
+        self.assertEqual(await self.iterator.collect(tuple), (1, 2, 3))
+
+    async def test_fluent_is_also_an_async_iterator(self) -> None:
+        self.assertEqual(await self.iterator.__anext__(), 1)
+        self.assertSequenceEqual([item async for item in self.iterator], [2, 3])
+
+    async def test_map_accepts_sync_and_async_predicates(self) -> None:
+        result = await self.iterator.map(_adouble).map(lambda item: item + 1).collect()
+        self.assertSequenceEqual(result, [3, 5, 7])
+
+    async def test_non_terminal_methods_do_not_call_predicate(self) -> None:
+        predicate = mock.Mock()
+        self.iterator.map(predicate).filter(predicate).peek(predicate)
+        predicate.assert_not_called()
+
+    async def test_peek_leaves_elements_in_place(self) -> None:
+        predicate = mock.Mock()
+        self.assertSequenceEqual(await self.iterator.peek(predicate).collect(), self.iterator_values)
+        predicate.assert_has_calls([mock.call(item) for item in self.iterator_values])
+
+    async def test_filter_and_filterfalse(self) -> None:
+        values = AsyncFluentIterator(range(6))
+        self.assertSequenceEqual(await values.filter(lambda item: item % 2).collect(), [1, 3, 5])
+        values = AsyncFluentIterator(range(6))
+        self.assertSequenceEqual(await values.filterfalse(lambda item: item % 2).collect(), [0, 2, 4])
+
+    async def test_flatten_accepts_sync_and_async_iterables(self) -> None:
+        result = await AsyncFluentIterator([[1, 2], _agen([3])]).flatten().collect()
+        self.assertSequenceEqual(result, [1, 2, 3])
+
+    async def test_enumerate_and_skip(self) -> None:
+        self.assertSequenceEqual(await self.iterator.enumerate().skip(1).collect(), [(1, 2), (2, 3)])
+
+    async def test_skip_expects_positive_value(self) -> None:
+        with self.assertRaises(ValueError):
+            self.iterator.skip(-1)
+
+    async def test_prepend_and_append(self) -> None:
+        self.assertSequenceEqual(await self.iterator.prepend(0).append([4, 5]).collect(), [0, 1, 2, 3, 4, 5])
+
+    async def test_matchers(self) -> None:
+        self.assertTrue(await AsyncFluentIterator([1, 2]).allMatch(_adouble))
+        self.assertTrue(await AsyncFluentIterator([0, 2]).anyMatch(lambda item: item))
+        self.assertTrue(await AsyncFluentIterator([0, 0]).noneMatch(lambda item: item))
+
+    async def test_first_does_not_exhaust_iterator(self) -> None:
+        self.assertEqual(await self.iterator.first(), 1)
+        self.assertSequenceEqual(await self.iterator.collect(), [2, 3])
+        self.assertIsNone(await self.iterator.first())
+
+    async def test_reduce(self) -> None:
+        self.assertEqual(await self.iterator.reduce(lambda acc, item: acc + item, 0), 6)
+
+
+class AsyncFluentIteratorAmapTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_amap_keeps_order(self) -> None:
+        async def delayed(item: int) -> int:
+            await asyncio.sleep(0.001 * (5 - item))
+            return item
+
+        self.assertSequenceEqual(await AsyncFluentIterator(range(5)).amap(delayed, concurrency=5).collect(),
+                                 [0, 1, 2, 3, 4])
+
+    async def test_amap_unordered_yields_all_results(self) -> None:
+        result = await AsyncFluentIterator(range(5)).amap(_adouble, concurrency=3, ordered=False).collect()
+        self.assertSequenceEqual(sorted(result), [0, 2, 4, 6, 8])
+
+    async def test_amap_runs_at_most_concurrency_awaitables(self) -> None:
+        running = 0
+        peak = 0
+
+        async def tracked(item: int) -> int:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return item
+
+        await AsyncFluentIterator(range(20)).amap(tracked, concurrency=4).collect()
+        self.assertEqual(peak, 4)
+
+    async def test_amap_expects_positive_concurrency(self) -> None:
+        with self.assertRaises(ValueError):
+            AsyncFluentIterator([]).amap(_adouble, concurrency=0)
@@ -0,0 +1,71 @@
+import mock
+import unittest
+
+from pyfluent import batch
+from pyfluent.batch import check_format, check_size, chunks, map_batches
+from pyfluent.iterator import FluentIterator
+
+
+class ChunksTest(unittest.TestCase):
+
+    def test_splits_iterator_into_lists_of_given_size(self) -> None:
+        self.assertSequenceEqual(list(chunks(iter(range(5)), 2)), [[0, 1], [2, 3], [4]])
+
+    def test_empty_iterator_gives_no_chunks(self) -> None:
+        self.assertSequenceEqual(list(chunks(iter([]), 2)), [])
+
+
+class ChecksTest(unittest.TestCase):
+
+    def test_size_must_be_positive(self) -> None:
+        with self.assertRaises(ValueError):
+            check_size(0)
+
+    def test_unknown_format_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            check_format('arrow')
+
+    def test_numpy_format_requires_numpy(self) -> None:
+        with mock.patch.object(batch, 'numpy', None):
+            with self.assertRaises(ImportError):
+                check_format('numpy')
+
+
+class MapBatchesTest(unittest.TestCase):
+
+    def test_predicate_is_called_once_per_batch(self) -> None:
+        predicate = mock.Mock(side_effect=lambda chunk: [sum(chunk)])
+        self.assertSequenceEqual(list(map_batches(predicate, 2, 'list', iter(range(5)))), [1, 5, 4])
+        self.assertEqual(predicate.call_count, 3)
+
+    @unittest.skipIf(batch.numpy is None, 'numpy is not installed')
+    def test_numpy_format_passes_arrays(self) -> None:
+        result = list(map_batches(lambda chunk: chunk * 2, 3, 'numpy', iter(range(4))))
+        self.assertSequenceEqual(result, [0, 2, 4, 6])
+
+
+class FluentIteratorBatchTest(unittest.TestCase):
+
+    def test_batch_groups_items(self) -> None:
+        self.assertSequenceEqual(FluentIterator(range(5)).batch(2).collect(), [[0, 1], [2, 3], [4]])
+
+    def test_batch_expects_positive_size(self) -> None:
+        with self.assertRaises(ValueError):
+            FluentIterator([]).batch(0)
+
+    def test_unbatch_restores_stream(self) -> None:
+        self.assertSequenceEqual(FluentIterator(range(5)).batch(2).unbatch().collect(), [0, 1, 2, 3, 4])
+
+    def test_map_batches_is_non_terminal(self) -> None:
+        predicate = mock.Mock()
+        FluentIterator([1]).mapBatches(predicate)
+        predicate.assert_not_called()
+
+    def test_map_batches_flattens_results_into_stream(self) -> None:
+        result = FluentIterator(range(6)).mapBatches(lambda chunk: [item + 1 for item in chunk], size=4)
+        self.assertSequenceEqual(result.filter(lambda item: item % 2).collect(), [1, 3, 5])
+
+    @unittest.skipIf(batch.numpy is None, 'numpy is not installed')
+    def test_map_batches_with_numpy(self) -> None:
+        result = FluentIterator(range(5)).mapBatches(lambda chunk: chunk ** 2, size=2, format='numpy').collect()
+        self.assertSequenceEqual(result, [0, 1, 4, 9, 16])
@@ -0,0 +1,96 @@
+import unittest
+
+from pyfluent.cache import Replay, check_cache
+from pyfluent.iterator import FluentIterator
+
+
+class Counting(object):
+
+    def __init__(self, n: int) -> None:
+        self.n = n
+        self.produced = 0
+
+    def __iter__(self):
+        for item in range(self.n):
+            self.produced += 1
+            yield item
+
+
+class ReplayTest(unittest.TestCase):
+
+    def test_replays_from_memory(self) -> None:
+        source = Counting(10)
+        replay = Replay(source)
+        self.assertSequenceEqual(list(replay), list(range(10)))
+        self.assertSequenceEqual(list(replay), list(range(10)))
+        self.assertEqual(source.produced, 10)
+        self.assertEqual(replay.spilled, 0)
+
+    def test_spills_over_memory_limit(self) -> None:
+        source = Counting(1000)
+        replay = Replay(source, memory_limit=100, frame_size=64)
+        self.assertSequenceEqual(list(replay), list(range(1000)))
+        self.assertSequenceEqual(list(replay), list(range(1000)))
+        self.assertEqual(source.produced, 1000)
+        self.assertEqual(replay.spilled, 896)
+        replay.close()
+
+    def test_readers_advance_independently(self) -> None:
+        source = Counting(500)
+        replay = Replay(source, memory_limit=10, frame_size=16)
+        fast, slow = iter(replay), iter(replay)
+        self.assertSequenceEqual([next(fast) for _ in range(300)], list(range(300)))
+        self.assertSequenceEqual([next(slow) for _ in range(5)], list(range(5)))
+        self.assertEqual(source.produced, 300)
+        self.assertSequenceEqual(list(slow), list(range(5, 500)))
+        self.assertSequenceEqual(list(fast), list(range(300, 500)))
+        self.assertEqual(source.produced, 500)
+        replay.close()
+
+    def test_is_lazy(self) -> None:
+        source = Counting(10)
+        Replay(source)
+        self.assertEqual(source.produced, 0)
+
+    def test_checks(self) -> None:
+        with self.assertRaises(ValueError):
+            check_cache(-1, 10)
+        with self.assertRaises(ValueError):
+            check_cache(None, 0)
+
+
+class FluentIteratorCacheTest(unittest.TestCase):
+
+    def test_cache_can_be_replayed(self) -> None:
+        source = Counting(20)
+        cached = FluentIterator(source).map(lambda x: x * 2).cache(memoryLimit=5, frameSize=4)
+        self.assertSequenceEqual(cached.filter(lambda x: x % 4 == 0).collect(), list(range(0, 40, 4)))
+        self.assertSequenceEqual(cached.replay().collect(), list(range(0, 40, 2)))
+        self.assertEqual(source.produced, 20)
+
+    def test_replay_requires_cache(self) -> None:
+        with self.assertRaises(TypeError):
+            FluentIterator([1]).replay()
+        with self.assertRaises(TypeError):
+            FluentIterator([1]).cache().map(str).replay()
+
+    def test_tee_shares_upstream(self) -> None:
+        source = Counting(100)
+        left, right = FluentIterator(source).tee(2, memoryLimit=10, frameSize=8)
+        self.assertSequenceEqual(left.skip(90).collect(), list(range(90, 100)))
+        self.assertSequenceEqual(right.map(str).first(), '0')
+        self.assertEqual(source.produced, 100)
+
+    def test_close_releases_spill_file(self) -> None:
+        cached = FluentIterator(Counting(100)).cache(memoryLimit=10, frameSize=8)
+        itr = cached.map(str)
+        self.assertEqual(itr.take(50).collect()[-1], '49')
+        spill = cached._source._spill
+        itr.close()
+        self.assertTrue(spill.closed)
+        with self.assertRaises(ValueError):
+            cached.replay().collect()
+
+    def test_tee_checks_count(self) -> None:
+        with self.assertRaises(ValueError):
+            FluentIterator([]).tee(-1)
@@ -0,0 +1,131 @@
+from array import array
+from collections import namedtuple
+import tracemalloc
+
+import mock
+import unittest
+
+from pyfluent import columnar
+from pyfluent.columnar import NumpyBuffer, collect_array, collect_columns, collect_numpy
+from pyfluent.iterator import FluentIterator
+
+Point = namedtuple('Point', ['y', 'x'])
+
+requires_numpy = unittest.skipIf(columnar.numpy is None, 'numpy is not installed')
+
+
+class CollectArrayTest(unittest.TestCase):
+
+    def test_collects_typed_array(self) -> None:
+        result = collect_array('q', iter(range(5)))
+        self.assertIsInstance(result, array)
+        self.assertEqual(result.typecode, 'q')
+        self.assertSequenceEqual(result, [0, 1, 2, 3, 4])
+
+    def test_collects_more_than_single_chunk(self) -> None:
+        with mock.patch.object(columnar, 'CHUNK_SIZE', 2):
+            self.assertSequenceEqual(collect_array('d', iter([1.5, 2.5, 3.5])), [1.5, 2.5, 3.5])
+
+    def test_presized_array_is_trimmed_or_extended(self) -> None:
+        with mock.patch.object(columnar, 'CHUNK_SIZE', 2):
+            self.assertSequenceEqual(collect_array('q', iter(range(3)), size=5), [0, 1, 2])
+            self.assertSequenceEqual(collect_array('q', iter(range(5)), size=3), [0, 1, 2, 3, 4])
+
+    def test_presizing_does_not_copy_a_zeroed_buffer(self) -> None:
+        size = 1 << 20
+        tracemalloc.start()
+        try:
+            with mock.patch.object(columnar, 'CHUNK_SIZE', 1024):
+                result = collect_array('q', iter(range(size)), size=size)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertLess(peak, 1.5 * len(result) * result.itemsize)
+
+    def test_rejects_values_not_matching_typecode(self) -> None:
+        with self.assertRaises(TypeError):
+            collect_array('q', iter(['a']))
+
+
+@requires_numpy
+class NumpyBufferTest(unittest.TestCase):
+
+    def test_grows_geometrically(self) -> None:
+        buffer = NumpyBuffer('int64', capacity=2)
+        buffer.extend([1, 2, 3])
+        self.assertEqual(len(buffer._buffer), 4)
+        buffer.extend([4, 5])
+        self.assertEqual(len(buffer._buffer), 8)
+        self.assertSequenceEqual(buffer.result().tolist(), [1, 2, 3, 4, 5])
+
+    def test_result_is_trimmed_to_size(self) -> None:
+        buffer = NumpyBuffer('float64', capacity=10)
+        buffer.extend([1.0])
+        self.assertEqual(buffer.result().shape, (1,))
+
+
+class CollectNumpyTest(unittest.TestCase):
+
+    @requires_numpy
+    def test_collects_array_of_given_dtype(self) -> None:
+        with mock.patch.object(columnar, 'CHUNK_SIZE', 2):
+            result = collect_numpy('int32', iter(range(5)))
+        self.assertEqual(result.dtype, columnar.numpy.dtype('int32'))
+        self.assertSequenceEqual(result.tolist(), [0, 1, 2, 3, 4])
+
+    @requires_numpy
+    def test_presized_buffer_is_allocated_once(self) -> None:
+        with mock.patch.object(columnar, 'CHUNK_SIZE', 2), \
+                mock.patch.object(columnar.numpy, 'empty', wraps=columnar.numpy.empty) as empty:
+            result = collect_numpy('int64', iter(range(5)), size=5)
+        self.assertEqual(empty.call_count, 1)
+        self.assertSequenceEqual(result.tolist(), [0, 1, 2, 3, 4])
+
+    def test_requires_numpy(self) -> None:
+        with mock.patch.object(columnar, 'numpy', None):
+            with self.assertRaises(ImportError):
+                collect_numpy('int32', iter([]))
+
+
+class CollectColumnsTest(unittest.TestCase):
+
+    def test_tuples_are_split_positionally(self) -> None:
+        result = collect_columns({'a': 'q', 'b': 'd'}, 'array', iter([(1, 0.5), (2, 1.5)]))
+        self.assertSequenceEqual(result['a'], [1, 2])
+        self.assertSequenceEqual(result['b'], [0.5, 1.5])
+
+    def test_mappings_are_split_by_key(self) -> None:
+        result = collect_columns({'b': 'q'}, 'array', iter([{'a': 1, 'b': 2}]))
+        self.assertSequenceEqual(result['b'], [2])
+
+    def test_records_are_split_by_attribute(self) -> None:
+        result = collect_columns({'x': 'q', 'y': 'q'}, 'array', iter([Point(1, 2), Point(3, 4)]))
+        self.assertSequenceEqual(result['x'], [2, 4])
+        self.assertSequenceEqual(result['y'], [1, 3])
+
+    def test_empty_stream_gives_empty_columns(self) -> None:
+        self.assertSequenceEqual(collect_columns({'a': 'q'}, 'array', iter([]))['a'], [])
+
+    def test_unknown_format_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            collect_columns({'a': 'q'}, 'arrow', iter([]))
+
+    @requires_numpy
+    def test_numpy_columns(self) -> None:
+        result = collect_columns({'a': 'int64', 'b': 'float32'}, 'numpy', iter([(1, 0.5), (2, 1.5)]))
+        self.assertSequenceEqual(result['a'].tolist(), [1, 2])
+        self.assertEqual(result['b'].dtype, columnar.numpy.dtype('float32'))
+
+
+class FluentIteratorColumnarTest(unittest.TestCase):
+
+    def test_collect_array(self) -> None:
+        self.assertSequenceEqual(FluentIterator(range(3)).map(float).collectArray('d'), [0.0, 1.0, 2.0])
+
+    @requires_numpy
+    def test_collect_numpy(self) -> None:
+        self.assertSequenceEqual(FluentIterator(range(3)).collectNumpy('int8').tolist(), [0, 1, 2])
+
+    def test_collect_columns(self) -> None:
+        result = FluentIterator(range(3)).map(lambda item: (item, item * 2)).collectColumns({'a': 'b', 'b': 'b'})
+        self.assertSequenceEqual(result['b'], [0, 2, 4])
@@ -0,0 +1,51 @@
+import unittest
+
+from pyfluent.distinct import check_distinct, distinct
+from pyfluent.iterator import FluentIterator
+
+VALUES = [1, 2, 1, 3, 2, 4, 1]
+
+
+class DistinctTest(unittest.TestCase):
+
+    def test_exact_keeps_first_occurrence(self) -> None:
+        self.assertSequenceEqual(list(distinct(None, 'exact', None, 0.01, iter(VALUES))), [1, 2, 3, 4])
+
+    def test_exact_with_key(self) -> None:
+        self.assertSequenceEqual(list(distinct(str.lower, 'exact', None, 0.01, iter('aAbBa'))), ['a', 'b'])
+
+    def test_bloom_drops_all_repeats(self) -> None:
+        self.assertSequenceEqual(list(distinct(None, 'bloom', 100, 0.01, iter(VALUES))), [1, 2, 3, 4])
+
+    def test_bloom_loses_few_unique_items(self) -> None:
+        result = list(distinct(None, 'bloom', 10000, 0.01, iter(range(10000))))
+        self.assertGreater(len(result), 9800)
+
+    def test_lru_drops_only_recent_repeats(self) -> None:
+        self.assertSequenceEqual(list(distinct(None, 'lru', 2, 0.01, iter([1, 2, 3, 1, 3, 3, 2]))), [1, 2, 3, 1, 2])
+
+    def test_lru_refreshes_repeated_keys(self) -> None:
+        self.assertSequenceEqual(list(distinct(None, 'lru', 2, 0.01, iter([1, 2, 1, 3, 1]))), [1, 2, 3])
+
+    def test_checks(self) -> None:
+        with self.assertRaises(ValueError):
+            check_distinct('hll', None, 0.01)
+        with self.assertRaises(ValueError):
+            check_distinct('lru', None, 0.01)
+        with self.assertRaises(ValueError):
+            check_distinct('bloom', 10, 0)
+
+
+class FluentIteratorDistinctTest(unittest.TestCase):
+
+    def test_distinct_defaults_to_exact(self) -> None:
+        self.assertSequenceEqual(FluentIterator(VALUES).distinct().collect(), [1, 2, 3, 4])
+
+    def test_distinct_modes(self) -> None:
+        self.assertSequenceEqual(FluentIterator(VALUES).distinct(mode='bloom', capacity=10).collect(), [1, 2, 3, 4])
+        self.assertSequenceEqual(FluentIterator(VALUES).distinct(abs, mode='lru', capacity=1).collect(),
+                                 [1, 2, 1, 3, 2, 4, 1])
+
+    def test_distinct_validates_eagerly(self) -> None:
+        with self.assertRaises(ValueError):
+            FluentIterator(VALUES).distinct(mode='bloom')
@@ -3,7 +3,10 @@ from typing import Any, Iterable, Optional, Tuple, Callable
 import mock
 import unittest
 
-from pyfluent.func import callUnpacked
+from collections import namedtuple
+import operator
+
+from pyfluent.func import Composed, attr, callUnpacked, compose, eq, ge, gt, isIn, item, le, lt, ne, negate
 
 
 class FuncCallUnpackedTest(unittest.TestCase):
@@ -34,3 +37,47 @@ class FuncCallUnpackedTest(unittest.TestCase):
         self.callable('abc')
         self.predicate.assert_called_once_with('a', 'b', 'c')
 
+
+Point = namedtuple('Point', 'x y')
+Line = namedtuple('Line', 'start end')
+
+
+class FuncBuildersTest(unittest.TestCase):
+
+    def test_compose_applies_functions_in_order(self) -> None:
+        self.assertEqual(compose(abs, str, len)(-120), 3)
+
+    def test_compose_flattens_nested_compositions(self) -> None:
+        composed = compose(compose(abs, str), compose(len, bool))
+        self.assertIsInstance(composed, Composed)
+        self.assertEqual(len(composed.functions), 4)
+
+    def test_compose_of_single_function_returns_it(self) -> None:
+        self.assertIs(compose(abs), abs)
+        with self.assertRaises(TypeError):
+            compose()
+
+    def test_attribute_paths_collapse_into_single_attrgetter(self) -> None:
+        getter = compose(attr('end'), attr('x'))
+        self.assertIsInstance(getter, operator.attrgetter)
+        self.assertEqual(getter(Line(Point(1, 2), Point(3, 4))), 3)
+
+    def test_item_follows_key_path(self) -> None:
+        self.assertEqual(item('a', 0, 'b')({'a': [{'b': 5}]}), 5)
+        self.assertIsInstance(item('a'), operator.itemgetter)
+
+    def test_comparisons(self) -> None:
+        self.assertSequenceEqual([eq(2)(v) for v in (1, 2, 3)], [False, True, False])
+        self.assertSequenceEqual([ne(2)(v) for v in (1, 2, 3)], [True, False, True])
+        self.assertSequenceEqual([lt(2)(v) for v in (1, 2, 3)], [True, False, False])
+        self.assertSequenceEqual([le(2)(v) for v in (1, 2, 3)], [True, True, False])
+        self.assertSequenceEqual([gt(2)(v) for v in (1, 2, 3)], [False, False, True])
+        self.assertSequenceEqual([ge(2)(v) for v in (1, 2, 3)], [False, True, True])
+        self.assertSequenceEqual([isIn([1, 3])(v) for v in (1, 2, 3)], [True, False, True])
+
+    def test_comparisons_with_key(self) -> None:
+        self.assertTrue(gt(1, key=attr('y'))(Point(0, 2)))
+        self.assertFalse(isIn('ab', key=item('k'))({'k': 'c'}))
+
+    def test_negate(self) -> None:
+        self.assertTrue(negate(eq(1))(2))
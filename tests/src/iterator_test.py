@@ -1,4 +1,4 @@
-from operator import methodcaller
+from operator import length_hint, methodcaller
 from typing import Any, Iterable, Optional, Tuple
 
 import mock
@@ -516,3 +516,72 @@ class FluentIteratorReduceTestCase(FluentIteratorTestBase):
         self.predicate.assert_has_calls(
                 [mock.call(0, 1), mock.call(1, 2), mock.call(3, 3)])
 
+
+class FluentIteratorPlanTestCase(FluentIteratorTestBase):
+
+    def test_stages_are_not_built_until_terminal_is_called(self):
+        self.iterator.map(self.sentinel).filter(self.sentinel).peek(self.sentinel)
+        self.iter_mock.assert_not_called()
+        self.sentinel.assert_not_called()
+
+    def test_adjacent_elementwise_stages_are_recorded_in_single_node(self):
+        itr = self.iterator.map(str).filter(bool).peek(print)
+        self.assertEqual(itr.explain(), 'source(Mock)\nfused[map(str) -> filter(bool) -> peek(print)]')
+
+    def test_star_stages_unpack_items(self):
+        itr = FluentIterator('abcd').enumerate().starfilter(lambda index, _: index % 2).starpeek(self.sentinel)
+        self.assertSequenceEqual(itr.starmap(lambda index, char: char * index).collect(), ['b', 'ddd'])
+        self.sentinel.assert_has_calls([mock.call(1, 'b'), mock.call(3, 'd')])
+
+    def test_stateful_stages_break_fusion(self):
+        itr = self.iterator.map(str).enumerate().filterfalse(bool).skip(1)
+        self.assertEqual(itr.explain(), 'source(Mock)\nmap(str)\nenumerate\nfilterfalse(bool)\nskip(1)')
+
+    def test_plan_returns_all_stages_in_order(self):
+        itr = self.iterator.map(str).enumerate().filter(bool)
+        self.assertSequenceEqual([stage.kind for stage in itr.plan()], ['map', 'enumerate', 'filter'])
+
+    def test_fused_chain_yields_same_items_as_unfused(self):
+        itr = FluentIterator(range(10)).map(lambda item: item * 3).filter(lambda item: item % 2).peek(self.sentinel)
+        self.assertSequenceEqual(itr.collect(), [3, 9, 15, 21, 27])
+        self.assertEqual(self.sentinel.call_count, 5)
+
+    def test_stage_derived_from_consumed_iterator_continues_where_it_stopped(self):
+        itr = FluentIterator('abc').enumerate()
+        self.assertEqual(next(itr), (0, 'a'))
+        self.assertSequenceEqual(itr.map(lambda item: item[0]).collect(), [1, 2])
+
+
+class FluentIteratorLengthTestCase(unittest.TestCase):
+
+    def test_length_hint_follows_size_preserving_stages(self):
+        itr = FluentIterator([1, 2, 3, 4]).map(str).enumerate().skip(1).prepend([0, 0]).append(range(3))
+        self.assertEqual(length_hint(itr), 8)
+        self.assertEqual(itr.count(), 8)
+
+    def test_size_is_unknown_after_filter(self):
+        itr = FluentIterator([1, 2, 3]).filter(bool)
+        self.assertEqual(length_hint(itr, -1), -1)
+        self.assertEqual(itr.count(), 3)
+
+    def test_count_does_not_iterate_when_size_is_known(self):
+        sentinel = mock.Mock()
+        itr = FluentIterator(range(10)).map(sentinel).batch(3)
+        self.assertEqual(itr.count(), 4)
+        sentinel.assert_not_called()
+
+    def test_count_iterates_unsized_sources(self):
+        itr = FluentIterator(iter(range(5))).skip(2)
+        self.assertEqual(itr.count(), 3)
+        self.assertSequenceEqual(itr.collect(), [])
+
+    def test_length_hint_tracks_consumption(self):
+        itr = FluentIterator([1, 2, 3]).map(str)
+        next(itr)
+        self.assertEqual(length_hint(itr), 2)
+        self.assertEqual(itr.count(), 2)
+
+    def test_collect_is_presized(self):
+        with mock.patch.object(FluentIterator, '__length_hint__', autospec=True, return_value=3) as hint:
+            self.assertSequenceEqual(FluentIterator([1, 2, 3]).collect(), [1, 2, 3])
+        hint.assert_called_once()
@@ -0,0 +1,99 @@
+from operator import itemgetter
+
+import mock
+import unittest
+
+from pyfluent.iterator import FluentIterator
+from pyfluent.join import _probe_left, _probe_right, check_join, hash_join, merge_join
+
+LEFT = [(1, 'a'), (2, 'b'), (2, 'c'), (4, 'd')]
+RIGHT = [(2, 'x'), (3, 'y'), (4, 'z'), (4, 'w')]
+key = itemgetter(0)
+
+INNER = [((2, 'b'), (2, 'x')), ((2, 'c'), (2, 'x')), ((4, 'd'), (4, 'z')), ((4, 'd'), (4, 'w'))]
+LEFT_ONLY = [((1, 'a'), None)]
+RIGHT_ONLY = [(None, (3, 'y'))]
+
+
+class JoinTestMixin(object):
+
+    def join(self, how, left=LEFT, right=RIGHT):
+        raise NotImplementedError()
+
+    def test_inner_join(self) -> None:
+        self.assertCountEqual(self.join('inner'), INNER)
+
+    def test_left_join(self) -> None:
+        self.assertCountEqual(self.join('left'), INNER + LEFT_ONLY)
+
+    def test_outer_join(self) -> None:
+        self.assertCountEqual(self.join('outer'), INNER + LEFT_ONLY + RIGHT_ONLY)
+
+    def test_empty_sides(self) -> None:
+        self.assertSequenceEqual(self.join('outer', left=[]), [(None, item) for item in RIGHT])
+        self.assertSequenceEqual(self.join('left', right=[]), [(item, None) for item in LEFT])
+
+
+class ProbeLeftTest(JoinTestMixin, unittest.TestCase):
+
+    def join(self, how, left=LEFT, right=RIGHT):
+        return list(_probe_left(iter(left), right, key, key, how))
+
+
+class ProbeRightTest(JoinTestMixin, unittest.TestCase):
+
+    def join(self, how, left=LEFT, right=RIGHT):
+        return list(_probe_right(iter(left), right, key, key, how))
+
+
+class MergeJoinTest(JoinTestMixin, unittest.TestCase):
+
+    def join(self, how, left=LEFT, right=RIGHT):
+        return list(merge_join(iter(right), key, key, how, iter(left)))
+
+    def test_merge_join_keeps_sorted_order(self) -> None:
+        self.assertSequenceEqual(self.join('outer'), LEFT_ONLY + INNER[:2] + RIGHT_ONLY + INNER[2:])
+
+
+class HashJoinTest(unittest.TestCase):
+
+    def test_builds_table_on_smaller_side(self) -> None:
+        with mock.patch('pyfluent.join._probe_right') as probe:
+            hash_join(RIGHT * 2, key, key, 'inner', iter(LEFT))
+        probe.assert_called_once()
+
+    def test_left_and_outer_joins_keep_left_order(self) -> None:
+        right = RIGHT + [(9, 'q')] * 4
+        expected = LEFT_ONLY + INNER
+        self.assertSequenceEqual(list(hash_join(right, key, key, 'left', iter(LEFT))), expected)
+        self.assertSequenceEqual(list(hash_join(right, key, key, 'outer', iter(LEFT))),
+                                 expected + RIGHT_ONLY + [(None, (9, 'q'))] * 4)
+        self.assertSequenceEqual(list(hash_join(right[:1], key, key, 'left', iter(LEFT))),
+                                 [((1, 'a'), None), ((2, 'b'), (2, 'x')), ((2, 'c'), (2, 'x')), ((4, 'd'), None)])
+
+    def test_builds_table_on_right_side_when_sizes_are_unknown(self) -> None:
+        with mock.patch('pyfluent.join._probe_left') as probe:
+            hash_join(iter(RIGHT), key, key, 'inner', (item for item in LEFT))
+        probe.assert_called_once()
+
+    def test_checks(self) -> None:
+        with self.assertRaises(ValueError):
+            check_join('cross', 'hash')
+        with self.assertRaises(ValueError):
+            check_join('inner', 'nested')
+
+
+class FluentIteratorJoinTest(unittest.TestCase):
+
+    def test_join_is_non_terminal(self) -> None:
+        left_key = mock.Mock()
+        FluentIterator(LEFT).join(RIGHT, left_key)
+        left_key.assert_not_called()
+
+    def test_join_with_different_keys(self) -> None:
+        result = FluentIterator(['aa', 'b']).join([1, 2, 3], len, lambda item: item).collect()
+        self.assertCountEqual(result, [('aa', 2), ('b', 1)])
+
+    def test_merge_join(self) -> None:
+        result = FluentIterator(LEFT).join(RIGHT, key, how='left', strategy='merge').map(itemgetter(1)).collect()
+        self.assertSequenceEqual(result, [None, (2, 'x'), (2, 'x'), (4, 'z'), (4, 'w')])
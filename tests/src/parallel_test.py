@@ -0,0 +1,152 @@
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
+from itertools import count
+import operator
+import threading
+
+import mock
+import unittest
+
+from pyfluent.iterator import FluentIterator
+from pyfluent.parallel import MISSING, create_executor, parallel_map, parallel_reduce
+
+
+def _square(item: int) -> int:
+    return item * item
+
+
+class CreateExecutorTest(unittest.TestCase):
+
+    def test_returns_given_executor(self) -> None:
+        with ThreadPoolExecutor(1) as executor:
+            self.assertIs(create_executor(executor, None), executor)
+
+    def test_raises_on_unknown_executor(self) -> None:
+        with self.assertRaises(ValueError):
+            create_executor('fiber', None)
+
+
+class ParallelMapTest(unittest.TestCase):
+
+    def test_ordered_map_keeps_source_order(self) -> None:
+        result = list(parallel_map(_square, 4, 'thread', 3, True, iter(range(20))))
+        self.assertSequenceEqual(result, [item * item for item in range(20)])
+
+    def test_unordered_map_yields_all_results(self) -> None:
+        result = list(parallel_map(_square, 4, 'thread', 3, False, iter(range(20))))
+        self.assertSequenceEqual(sorted(result), [item * item for item in range(20)])
+
+    def test_rejects_non_positive_chunksize(self) -> None:
+        with self.assertRaises(ValueError):
+            next(parallel_map(_square, 1, 'thread', 0, True, iter([1])))
+
+    def test_keeps_bounded_number_of_items_in_flight(self) -> None:
+        source = count()
+        result = parallel_map(_square, 2, 'thread', 1, True, source)
+        self.assertEqual(next(result), 0)
+        result.close()
+        self.assertLessEqual(next(source), 6)
+
+    def test_does_not_shutdown_given_executor(self) -> None:
+        with ThreadPoolExecutor(2) as executor:
+            list(parallel_map(_square, None, executor, 1, True, iter([1, 2])))
+            self.assertEqual(executor.submit(_square, 3).result(), 9)
+
+    def test_exception_in_predicate_is_propagated(self) -> None:
+        with self.assertRaises(ZeroDivisionError):
+            list(parallel_map(lambda item: 1 // item, 2, 'thread', 1, True, iter([1, 0])))
+
+
+class FluentIteratorParallelMapTest(unittest.TestCase):
+
+    def test_is_non_terminal(self) -> None:
+        predicate = mock.Mock()
+        FluentIterator([1, 2]).parallelMap(predicate)
+        predicate.assert_not_called()
+
+    def test_checks_executor_and_chunksize_eagerly(self) -> None:
+        with self.assertRaises(ValueError):
+            FluentIterator([1]).parallelMap(_square, executor='fiber')
+        with self.assertRaises(ValueError):
+            FluentIterator([1]).parallelMap(_square, chunksize=0)
+
+    def test_chains_with_other_stages(self) -> None:
+        result = FluentIterator([[1, 2], [3]]).flatten().parallelMap(_square, workers=2).filter(bool).collect()
+        self.assertSequenceEqual(result, [1, 4, 9])
+
+    def test_process_executor(self) -> None:
+        result = FluentIterator(range(10)).parallelMap(operator.neg, workers=2, executor='process', chunksize=4)
+        self.assertSequenceEqual(result.collect(), [-item for item in range(10)])
+
+    def test_runs_predicate_on_worker_threads(self) -> None:
+        main = threading.get_ident()
+        result = FluentIterator(range(4)).parallelMap(lambda _: threading.get_ident(), workers=2).collect()
+        self.assertNotIn(main, result)
+
+
+class ParallelReduceTest(unittest.TestCase):
+
+    def test_reduces_chunks_and_combines_partials(self) -> None:
+        result = parallel_reduce(operator.add, None, MISSING, MISSING, 4, 'thread', 7, iter(range(100)))
+        self.assertEqual(result, 4950)
+
+    def test_zero_is_used_for_each_chunk(self) -> None:
+        result = parallel_reduce(lambda acc, item: acc | {item % 5}, operator.or_, MISSING, set(), 2, 'thread', 3,
+                                 iter(range(20)))
+        self.assertEqual(result, {0, 1, 2, 3, 4})
+
+    def test_each_chunk_folds_into_its_own_copy_of_initializer(self) -> None:
+        def tally(histogram: Counter, item: int) -> Counter:
+            histogram[item % 3] += 1
+            return histogram
+
+        zero: Counter = Counter()
+        result = parallel_reduce(tally, operator.add, MISSING, zero, 4, 'thread', 100, iter(range(3000)))
+        self.assertEqual(result, Counter({0: 1000, 1: 1000, 2: 1000}))
+        self.assertEqual(zero, Counter())
+
+    def test_initializer_is_applied_once_like_reduce(self) -> None:
+        for zero in (MISSING, 0):
+            self.assertEqual(parallel_reduce(operator.add, None, 10, zero, 2, 'thread', 2, iter(range(10))),
+                             reduce(operator.add, range(10), 10))
+        result = parallel_reduce(operator.add, None, 'x', MISSING, 2, 'thread', 2, iter('abcde'))
+        self.assertEqual(result, 'xabcde')
+
+    def test_combines_partials_in_source_order(self) -> None:
+        result = parallel_reduce(operator.add, None, '', MISSING, 4, 'thread', 2, iter('abcdefg'))
+        self.assertEqual(result, 'abcdefg')
+
+    def test_empty_source_returns_initializer(self) -> None:
+        self.assertEqual(parallel_reduce(operator.add, None, 0, MISSING, 2, 'thread', 2, iter([])), 0)
+        self.assertEqual(parallel_reduce(operator.add, None, MISSING, 0, 2, 'thread', 2, iter([])), 0)
+        self.assertIsNone(parallel_reduce(operator.add, None, MISSING, MISSING, 2, 'thread', 2, iter([])))
+
+    def test_rejects_non_positive_chunksize(self) -> None:
+        with self.assertRaises(ValueError):
+            parallel_reduce(operator.add, None, 0, MISSING, 2, 'thread', 0, iter([]))
+
+    def test_exception_in_predicate_is_propagated(self) -> None:
+        with self.assertRaises(TypeError):
+            parallel_reduce(operator.add, None, MISSING, MISSING, 2, 'thread', 2, iter([1, 'a']))
+
+
+class FluentIteratorParallelReduceTest(unittest.TestCase):
+
+    def test_thread_pool_by_default(self) -> None:
+        self.assertEqual(FluentIterator(range(1000)).parallelReduce(lambda acc, item: acc + item, workers=2,
+                                                                    chunksize=100), 499500)
+
+    def test_process_pool_with_initializer_and_combiner(self) -> None:
+        result = FluentIterator(range(10)).parallelReduce(max, combiner=max, initializer=-1, workers=2,
+                                                          executor='process', chunksize=3)
+        self.assertEqual(result, 9)
+
+    def test_initializer_matches_reduce(self) -> None:
+        self.assertEqual(FluentIterator(range(10)).parallelReduce(operator.add, initializer=10, chunksize=2),
+                         FluentIterator(range(10)).reduce(operator.add, 10))
+
+    def test_is_terminal(self) -> None:
+        itr = FluentIterator(range(10))
+        itr.parallelReduce(operator.add, executor='thread')
+        self.assertSequenceEqual(itr.collect(), [])
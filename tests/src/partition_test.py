@@ -0,0 +1,81 @@
+import unittest
+
+import mock
+
+from pyfluent import partition
+from pyfluent.iterator import FluentIterator
+from pyfluent.partition import decode, encode
+
+requires_fork = unittest.skipUnless(partition._fork(), 'fork start method is not available')
+
+
+def _double(item):
+    return item * 2
+
+
+def _fail(item):
+    raise KeyError(item)
+
+
+class TransportTest(unittest.TestCase):
+
+    def test_small_batches_are_sent_as_lists(self) -> None:
+        self.assertEqual(encode([1, 2]), ('list', [1, 2]))
+
+    def test_numeric_batches_use_shared_memory(self) -> None:
+        for batch in ([1, -2, 3] * 100, [0.5, 1.5] * 200):
+            payload = encode(batch)
+            self.assertEqual(payload[0], 'shared')
+            self.assertEqual(decode(payload), batch)
+
+    def test_mixed_or_unrepresentable_batches_fall_back_to_lists(self) -> None:
+        for batch in ([1, 2.0] * 200, [True] * 300, [2 ** 70] * 300, ['a'] * 300):
+            self.assertEqual(encode(batch)[0], 'list')
+
+
+@requires_fork
+class FluentIteratorPartitionTest(unittest.TestCase):
+
+    def test_ordered_sequence_source(self) -> None:
+        result = FluentIterator(list(range(1000))).partition(3, chunksize=64).process(
+            lambda part: part.map(_double).filter(lambda item: item % 3))
+        self.assertSequenceEqual(result.collect(), [item * 2 for item in range(1000) if item * 2 % 3])
+
+    def test_ordered_iterator_source(self) -> None:
+        with mock.patch.object(partition, 'SHARED_MIN', 4):
+            result = FluentIterator(iter(range(500))).map(float).partition(4, chunksize=16).process(
+                lambda part: part.map(_double))
+            self.assertSequenceEqual(result.collect(), [item * 2.0 for item in range(500)])
+
+    def test_unordered(self) -> None:
+        result = FluentIterator(iter('abcdefgh')).partition(2, ordered=False, chunksize=3).process(
+            lambda part: part.map(str.upper))
+        self.assertCountEqual(result.collect(), 'ABCDEFGH')
+
+    def test_more_partitions_than_items(self) -> None:
+        self.assertSequenceEqual(FluentIterator([1, 2]).partition(4).process(lambda part: part).collect(), [1, 2])
+        self.assertSequenceEqual(FluentIterator(iter([])).partition(2).process(lambda part: part).collect(), [])
+
+    def test_worker_errors_are_raised(self) -> None:
+        result = FluentIterator(iter(range(10))).partition(2, chunksize=2).process(lambda part: part.map(_fail))
+        with self.assertRaises(KeyError):
+            result.collect()
+
+    def test_workers_stopping_early_do_not_block_the_others(self) -> None:
+        with mock.patch.object(partition, 'SHARED_MIN', 4):
+            result = FluentIterator(iter(range(100000))).partition(2, chunksize=100).process(
+                lambda part: part.filter(lambda item: item < 150).take(60))
+            self.assertSequenceEqual(result.collect(), list(range(60)) + list(range(100, 150)))
+        result = FluentIterator(iter(range(10000))).partition(3, chunksize=10).process(lambda part: FluentIterator([]))
+        self.assertSequenceEqual(result.collect(), [])
+
+    def test_is_lazy(self) -> None:
+        with mock.patch.object(partition.multiprocessing, 'get_context') as get_context:
+            FluentIterator([1]).partition(2).process(lambda part: part)
+        get_context.assert_not_called()
+
+    def test_checks(self) -> None:
+        with self.assertRaisesRegex(ValueError, 'Number of partitions'):
+            FluentIterator([]).partition(0)
+        with self.assertRaisesRegex(ValueError, 'Chunk size'):
+            FluentIterator([]).partition(1, chunksize=0)
@@ -0,0 +1,65 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import mock
+import unittest
+
+from pyfluent import plan
+from pyfluent.iterator import FluentIterator
+from pyfluent.pipeline import Pipeline
+
+
+def _double(item: int) -> int:
+    return item * 2
+
+
+def _is_odd(item: int) -> bool:
+    return item % 2 == 1
+
+
+def _is_big(item: int) -> bool:
+    return item > 2
+
+
+class PipelineTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.pipeline = Pipeline().map(_double).filter(_is_big).enumerate()
+
+    def test_building_does_not_call_predicates(self) -> None:
+        predicate = mock.Mock()
+        Pipeline().map(predicate).filter(predicate)
+        predicate.assert_not_called()
+
+    def test_stage_methods_return_new_pipelines(self) -> None:
+        pipeline = Pipeline()
+        self.assertIsNot(pipeline.map(_double), pipeline)
+        self.assertSequenceEqual(pipeline.stages, ())
+
+    def test_run_returns_fluent_iterator(self) -> None:
+        result = self.pipeline.run([1, 2, 3])
+        self.assertIsInstance(result, FluentIterator)
+        self.assertSequenceEqual(result.collect(), [(0, 4), (1, 6)])
+
+    def test_pipeline_can_be_applied_to_many_sources(self) -> None:
+        self.assertSequenceEqual(self.pipeline.run([2]).collect(), [(0, 4)])
+        self.assertSequenceEqual(self.pipeline.run(iter([3, 1])).collect(), [(0, 6)])
+
+    def test_terminals_chain_on_run_result(self) -> None:
+        self.assertEqual(Pipeline().filter(_is_odd).run(range(10)).reduce(lambda acc, item: acc + item, 0), 25)
+
+    def test_compile_happens_once(self) -> None:
+        with mock.patch('pyfluent.pipeline.compile', wraps=plan.compile) as compiler:
+            self.pipeline.compile()
+            self.pipeline.run([1]).collect()
+            self.pipeline.run([2]).collect()
+        compiler.assert_called_once_with(self.pipeline.stages)
+
+    def test_explain_shows_fused_stages(self) -> None:
+        self.assertEqual(self.pipeline.explain(),
+                         'source(Pipeline)\nfused[map(_double) -> filter(_is_big)]\nenumerate')
+
+    def test_pipeline_is_safe_to_share_between_threads(self) -> None:
+        pipeline = Pipeline().map(_double).map(str).skip(1)
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(lambda size: pipeline.run(range(size)).collect(), range(50)))
+        self.assertSequenceEqual(results, [[str(item * 2) for item in range(1, size)] for size in range(50)])
@@ -0,0 +1,182 @@
+import multiprocessing
+import operator
+import threading
+import time
+from typing import Iterator
+
+import unittest
+
+from pyfluent.iterator import FluentIterator
+from pyfluent.pipeline import Pipeline
+from pyfluent.pipelining import check_boundary, check_executor, process_segment, thread_segment
+from pyfluent.plan import Stage
+
+
+def _is_odd(item: int) -> bool:
+    return item % 2 == 1
+
+
+def _inverse(item: int) -> float:
+    return 1 / item
+
+
+def _failing_source() -> Iterator[int]:
+    yield 1
+    yield 2
+    raise KeyError('source')
+
+
+class CheckExecutorTest(unittest.TestCase):
+
+    def test_rejects_unknown_executor(self) -> None:
+        with self.assertRaises(ValueError):
+            check_executor('fiber')
+
+    def test_rejects_non_positive_boundary_sizes(self) -> None:
+        with self.assertRaisesRegex(ValueError, 'Queue size'):
+            check_boundary('thread', 0, 1)
+        with self.assertRaisesRegex(ValueError, 'Chunk size'):
+            check_boundary('thread', 1, 0)
+        with self.assertRaisesRegex(ValueError, 'Unknown executor'):
+            FluentIterator([]).boundary('fiber')
+
+
+class ThreadSegmentTest(unittest.TestCase):
+
+    def test_runs_stages_on_worker_thread(self) -> None:
+        threads = []
+        stages = [Stage('peek', lambda item: threads.append(threading.get_ident())), Stage('map', operator.neg)]
+        self.assertSequenceEqual(list(thread_segment(stages, 2, iter([1, 2, 3]))), [-1, -2, -3])
+        self.assertNotIn(threading.get_ident(), threads)
+
+    def test_upstream_exception_is_raised_after_preceding_items(self) -> None:
+        result = thread_segment([], 4, _failing_source())
+        self.assertEqual(next(result), 1)
+        self.assertEqual(next(result), 2)
+        with self.assertRaises(KeyError):
+            next(result)
+
+    def test_closing_consumer_stops_worker(self) -> None:
+        before = threading.active_count()
+        result = thread_segment([], 1, iter(range(1000000)))
+        self.assertEqual(next(result), 0)
+        result.close()
+        self.assertEqual(threading.active_count(), before)
+
+
+class ProcessSegmentTest(unittest.TestCase):
+
+    def test_runs_stages_in_worker_process(self) -> None:
+        stages = [Stage('filter', _is_odd), Stage('map', operator.neg)]
+        self.assertSequenceEqual(list(process_segment(stages, 2, 3, iter(range(10)))), [-1, -3, -5, -7, -9])
+
+    def test_exception_in_worker_is_raised_after_preceding_items(self) -> None:
+        result = process_segment([Stage('map', _inverse)], 2, 10, iter([1, 2, 0, 4]))
+        self.assertEqual(next(result), 1.0)
+        self.assertEqual(next(result), 0.5)
+        with self.assertRaises(ZeroDivisionError):
+            next(result)
+
+    def test_upstream_exception_is_propagated(self) -> None:
+        result = process_segment([], 2, 1, _failing_source())
+        self.assertSequenceEqual([next(result), next(result)], [1, 2])
+        with self.assertRaises(KeyError):
+            next(result)
+
+    def test_closing_consumer_stops_worker_process(self) -> None:
+        # multiprocessing queue feeder threads exit asynchronously after close, only the segment's own workers count
+        def workers():
+            return [thread for thread in threading.enumerate() if thread.name != 'QueueFeederThread']
+
+        before = workers()
+        result = process_segment([], 1, 1, iter(range(1000000)))
+        self.assertEqual(next(result), 0)
+        result.close()
+        self.assertEqual(multiprocessing.active_children(), [])
+        self.assertEqual(workers(), before)
+
+
+class FluentIteratorBoundaryTest(unittest.TestCase):
+
+    def test_boundary_is_non_terminal(self) -> None:
+        before = threading.active_count()
+        FluentIterator([1]).map(str).boundary()
+        self.assertEqual(threading.active_count(), before)
+
+    def test_boundary_absorbs_preceding_elementwise_stages(self) -> None:
+        itr = FluentIterator([1]).enumerate().map(str).filter(bool).boundary().map(len)
+        self.assertEqual(itr.explain(),
+                         'source(list)\nenumerate\nboundary(thread, maxsize=16: map(str) -> filter(bool))\nmap(len)')
+
+    def test_segments_are_chained(self) -> None:
+        result = (FluentIterator(range(10))
+                  .map(operator.neg).boundary(maxsize=2)
+                  .filter(_is_odd).boundary(executor='process', chunksize=2)
+                  .map(abs)
+                  .collect())
+        self.assertSequenceEqual(result, [1, 3, 5, 7, 9])
+
+    def test_first_and_close_stop_all_workers(self) -> None:
+        before = threading.active_count()
+        itr = FluentIterator(range(1000000)).boundary(maxsize=1).map(operator.neg).boundary(maxsize=1)
+        self.assertEqual(itr.first(), 0)
+        self.assertTrue(itr.anyMatch(operator.truth))
+        itr.close()
+        time.sleep(0.1)
+        self.assertEqual(threading.active_count(), before)
+
+    def test_pipeline_boundary(self) -> None:
+        pipeline = Pipeline().map(operator.neg).boundary().map(abs)
+        self.assertSequenceEqual(pipeline.run([1, 2]).collect(), [1, 2])
+        self.assertSequenceEqual([stage.kind for stage in pipeline.stages], ['boundary', 'map'])
+
+
+class FluentIteratorPrefetchTest(unittest.TestCase):
+
+    def test_prefetch_keeps_order(self) -> None:
+        self.assertSequenceEqual(FluentIterator(range(100)).prefetch(8).collect(), list(range(100)))
+
+    def test_prefetch_expects_positive_size(self) -> None:
+        with self.assertRaisesRegex(ValueError, 'Prefetch size'):
+            FluentIterator([]).prefetch(0)
+
+    def test_prefetch_reads_ahead_at_most_size_items(self) -> None:
+        pulled = []
+        itr = FluentIterator(range(100)).peek(pulled.append).prefetch(4)
+        self.assertEqual(itr.first(), 0)
+        time.sleep(0.1)
+        self.assertLessEqual(len(pulled), 6)
+        itr.close()
+
+    def test_prefetch_overlaps_upstream_latency(self) -> None:
+        # the consumer holds on to the first item until upstream has produced a later one, which only happens when
+        # upstream keeps running ahead on the prefetch thread
+        produced = threading.Event()
+        overlapped = []
+
+        def produce(item: int) -> None:
+            if item == 3:
+                produced.set()
+
+        def consume(item: int) -> None:
+            if item == 0:
+                overlapped.append(produced.wait(5))
+
+        FluentIterator(range(10)).peek(produce).prefetch(10).peek(consume).collect()
+        self.assertSequenceEqual(overlapped, [True])
+
+    def test_prefetch_reraises_upstream_exception_in_position(self) -> None:
+        itr = FluentIterator(_failing_source()).prefetch(4)
+        self.assertSequenceEqual([next(itr), next(itr)], [1, 2])
+        with self.assertRaises(KeyError):
+            next(itr)
+
+    def test_prefetch_is_not_fused_with_preceding_stages(self) -> None:
+        self.assertEqual(FluentIterator([]).map(str).prefetch(2).explain(), 'source(list)\nmap(str)\nprefetch(2)')
+
+    def test_abandoned_prefetch_stops_worker(self) -> None:
+        before = threading.active_count()
+        itr = FluentIterator(range(1000000)).prefetch(2)
+        itr.first()
+        del itr
+        self.assertEqual(threading.active_count(), before)
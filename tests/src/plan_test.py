@@ -0,0 +1,113 @@
+from itertools import islice
+from typing import Any
+import weakref
+
+import mock
+import unittest
+
+from pyfluent.func import attr, compose, gt
+from pyfluent.plan import Stage, build, explain, fuse, segments
+
+
+def _double(item: Any) -> Any:
+    return item * 2
+
+
+def _is_even(item: Any) -> bool:
+    return item % 2 == 0
+
+
+class StageTest(unittest.TestCase):
+
+    def test_elementwise_stages_are_recognized(self) -> None:
+        for kind in ('map', 'filter', 'filterfalse', 'peek'):
+            self.assertTrue(Stage(kind, _double).elementwise)
+        self.assertFalse(Stage('enumerate', enumerate).elementwise)
+
+    def test_non_elementwise_stage_applies_predicate_to_iterator(self) -> None:
+        self.assertSequenceEqual(list(Stage('enumerate', enumerate).apply(iter('ab'))), [(0, 'a'), (1, 'b')])
+
+    def test_describe_uses_label_or_predicate_name(self) -> None:
+        self.assertEqual(Stage('map', _double).describe(), 'map(_double)')
+        self.assertEqual(Stage('skip', islice, '3').describe(), 'skip(3)')
+        self.assertEqual(Stage('enumerate', enumerate).describe(), 'enumerate')
+
+
+class FuseTest(unittest.TestCase):
+
+    def test_single_stage_uses_builtin(self) -> None:
+        self.assertIsInstance(fuse(iter([1]), [Stage('map', _double)]), map)
+
+    def test_multiple_stages_are_fused_into_single_generator(self) -> None:
+        peeked = mock.Mock()
+        stages = [
+            Stage('map', _double),
+            Stage('peek', peeked),
+            Stage('filter', lambda item: item > 2),
+            Stage('filterfalse', lambda item: item == 6),
+        ]
+        self.assertSequenceEqual(list(fuse(iter([1, 2, 3, 4]), stages)), [4, 8])
+        peeked.assert_has_calls([mock.call(2), mock.call(4), mock.call(6), mock.call(8)])
+
+    def test_map_chains_use_builtins(self) -> None:
+        stages = [Stage('starmap', pow), Stage('map', compose(str, len))]
+        result = fuse(iter([(2, 10), (3, 2)]), stages)
+        self.assertIsInstance(result, map)
+        self.assertSequenceEqual(list(result), [4, 1])
+
+    def test_star_stages_unpack_items(self) -> None:
+        peeked = mock.Mock()
+        stages = [Stage('starpeek', peeked), Stage('starfilter', lambda a, b: a < b), Stage('starmap', pow)]
+        self.assertSequenceEqual(list(fuse(iter([(2, 3), (3, 2), (1, 5)]), stages)), [8, 1])
+        peeked.assert_has_calls([mock.call(2, 3), mock.call(3, 2), mock.call(1, 5)])
+
+    def test_composed_predicates_are_inlined(self) -> None:
+        stages = [Stage('filter', gt(1, key=attr('real'))), Stage('map', compose(abs, str))]
+        self.assertSequenceEqual(list(fuse(iter([-3, 1, 2]), stages)), ['2'])
+        self.assertSequenceEqual(list(fuse(iter([-3, 1, 2]), stages[:1])), [2])
+        self.assertSequenceEqual(list(fuse(iter([-3, 1, 2]), [Stage('filterfalse', gt(1, key=abs))])), [1])
+
+    def test_filter_without_predicate_uses_truthiness(self) -> None:
+        stages = [Stage('map', _double), Stage('filter', None)]
+        self.assertSequenceEqual(list(fuse(iter([0, 1]), stages)), [2])
+
+
+class SegmentsTest(unittest.TestCase):
+
+    def test_adjacent_elementwise_stages_are_grouped(self) -> None:
+        stages = [Stage('map', _double), Stage('filter', _is_even), Stage('enumerate', enumerate),
+                  Stage('map', _double)]
+        self.assertSequenceEqual([len(segment) for segment in segments(stages)], [2, 1, 1])
+
+    def test_build_applies_all_segments(self) -> None:
+        stages = [Stage('filter', _is_even), Stage('map', _double), Stage('enumerate', enumerate)]
+        self.assertSequenceEqual(list(build(iter(range(5)), stages)), [(0, 0), (1, 4), (2, 8)])
+
+    def test_compiled_plans_do_not_keep_stages_alive(self) -> None:
+        def predicate(item: Any) -> Any:
+            return item
+
+        reference = weakref.ref(predicate)
+        list(build(iter(range(3)), [Stage('map', _double), Stage('filter', predicate)]))
+        del predicate
+        self.assertIsNone(reference())
+
+    def test_stages_with_unhashable_predicates_are_compiled(self) -> None:
+        class Unhashable(object):
+            __hash__ = None  # type: ignore
+
+            def __call__(self, item: Any) -> Any:
+                return item + 1
+
+        stages = [Stage('map', Unhashable()), Stage('filter', _is_even)]
+        self.assertSequenceEqual(list(build(iter(range(4)), stages)), [2, 4])
+
+
+class ExplainTest(unittest.TestCase):
+
+    def test_explain_lists_fused_and_standalone_stages(self) -> None:
+        stages = [Stage('map', _double), Stage('filter', _is_even), Stage('enumerate', enumerate)]
+        self.assertEqual(explain([], stages), 'source(list)\nfused[map(_double) -> filter(_is_even)]\nenumerate')
+
+    def test_explain_names_composed_predicates(self) -> None:
+        self.assertEqual(explain([], [Stage('map', compose(abs, str))]), 'source(list)\nmap(compose(abs, str))')
@@ -0,0 +1,97 @@
+import time
+import tracemalloc
+
+import mock
+import unittest
+
+from pyfluent.iterator import FluentIterator
+from pyfluent.profiling import Profiler, StageStats
+
+
+def _slow(item: int) -> int:
+    time.sleep(0.002)
+    return item
+
+
+class ProfilerTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.callback = mock.Mock()
+        self.profiler = Profiler(self.callback)
+
+    def test_counts_items_in_and_out(self) -> None:
+        result = self.profiler.instrument('filter', lambda it: filter(None, it), iter([0, 1, 2]))
+        self.assertSequenceEqual(list(result), [1, 2])
+        self.assertEqual(self.profiler.stats[0].items_in, 3)
+        self.assertEqual(self.profiler.stats[0].items_out, 2)
+
+    def test_callback_is_called_when_stage_is_finished(self) -> None:
+        list(self.profiler.instrument('map', lambda it: map(str, it), iter([1])))
+        self.callback.assert_called_once_with(self.profiler.stats[0])
+        self.assertTrue(self.profiler.stats[0].finished)
+
+    def test_upstream_time_is_not_attributed_to_downstream_stage(self) -> None:
+        slow = self.profiler.instrument('slow', lambda it: map(_slow, it), iter(range(5)))
+        fast = self.profiler.instrument('fast', lambda it: map(str, it), slow)
+        list(fast)
+        self.assertGreater(self.profiler.stats[0].wall_time, 0.01)
+        self.assertLess(self.profiler.stats[1].wall_time, self.profiler.stats[0].wall_time)
+
+    def test_report_is_list_of_dicts(self) -> None:
+        list(self.profiler.instrument('map', lambda it: map(str, it), iter([1])))
+        report = self.profiler.report()
+        self.assertEqual(report[0]['name'], 'map')
+        self.assertEqual(report[0]['items_out'], 1)
+        self.assertIsNone(report[0]['allocated'])
+
+    def test_format_contains_stage_names(self) -> None:
+        self.profiler.stats.append(StageStats('map(str)'))
+        self.assertIn('map(str)', self.profiler.format())
+
+    def test_allocations_are_tracked_with_tracemalloc(self) -> None:
+        profiler = Profiler(allocations=True)
+        stage = profiler.instrument('map', lambda it: map(lambda item: [item] * 100, it), iter(range(10)))
+        self.assertTrue(tracemalloc.is_tracing())
+        list(stage)
+        self.assertGreater(profiler.stats[0].allocated, 0)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_tracing_started_elsewhere_is_left_running(self) -> None:
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+        list(Profiler(allocations=True).instrument('map', lambda it: map(str, it), iter(range(10))))
+        self.assertTrue(tracemalloc.is_tracing())
+
+
+class FluentIteratorInstrumentTest(unittest.TestCase):
+
+    def test_profiler_is_none_when_not_instrumented(self) -> None:
+        itr = FluentIterator([1]).map(str).filter(bool)
+        self.assertIsNone(itr.profiler)
+
+    def test_stats_are_recorded_for_each_stage(self) -> None:
+        itr = FluentIterator(range(10)).instrument()
+        self.assertSequenceEqual(itr.map(lambda item: item * 2).filter(lambda item: item % 4).enumerate().collect(),
+                                 [(0, 2), (1, 6), (2, 10), (3, 14), (4, 18)])
+        report = itr.profiler.report()
+        self.assertSequenceEqual([stats['items_in'] for stats in report], [10, 10, 5])
+        self.assertSequenceEqual([stats['items_out'] for stats in report], [10, 5, 5])
+
+    def test_callback_receives_stats(self) -> None:
+        callback = mock.Mock()
+        FluentIterator([1, 2]).instrument(callback).map(str).collect()
+        self.assertEqual(callback.call_args[0][0].items_out, 2)
+
+    def test_tracing_stops_when_iterator_is_exhausted_or_closed(self) -> None:
+        itr = FluentIterator(range(10)).instrument(allocations=True).map(str).filter(bool).enumerate()
+        itr.collect()
+        self.assertFalse(tracemalloc.is_tracing())
+        itr = FluentIterator(range(10)).instrument(allocations=True).map(str).enumerate()
+        next(itr)
+        self.assertTrue(tracemalloc.is_tracing())
+        itr.close()
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_profiler_is_shared_by_derived_iterators(self) -> None:
+        itr = FluentIterator([1]).instrument()
+        self.assertIs(itr.map(str).skip(0).profiler, itr.profiler)
@@ -0,0 +1,84 @@
+import csv
+import gzip
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+
+import mock
+
+from pyfluent.iterator import FluentIterator
+from pyfluent.sinks import check_sink, write_file, write_sink
+
+
+class SinksTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, 'out')
+
+    def read(self) -> str:
+        with open(self.path, newline='') as handle:
+            return handle.read()
+
+    def test_writes_lines(self) -> None:
+        self.assertEqual(write_file(self.path, 'lines', None, 'utf-8', 2, iter(['a', 'b', 3])), 3)
+        self.assertEqual(self.read(), 'a\nb\n3\n')
+
+    def test_writes_nothing_for_empty_input(self) -> None:
+        self.assertEqual(write_file(self.path, 'lines', None, 'utf-8', 2, iter([])), 0)
+        self.assertEqual(self.read(), '')
+
+    def test_writes_jsonl(self) -> None:
+        records = [{'a': 1}, {'a': [2, 3]}]
+        write_file(self.path, 'jsonl', None, 'utf-8', 10, iter(records))
+        self.assertSequenceEqual([json.loads(line) for line in self.read().splitlines()], records)
+
+    def test_writes_csv_rows(self) -> None:
+        write_file(self.path, 'csv', None, 'utf-8', 1, iter([(1, 'a,b'), (2, 'c')]))
+        self.assertEqual(self.read(), '1,"a,b"\r\n2,c\r\n')
+
+    def test_writes_csv_mappings_with_header(self) -> None:
+        write_file(self.path, 'csv', None, 'utf-8', 1, iter([{'x': 1, 'y': 2}, {'x': 3, 'y': 4}]), delimiter=';')
+        with open(self.path, newline='') as handle:
+            self.assertSequenceEqual(list(csv.reader(handle, delimiter=';')), [['x', 'y'], ['1', '2'], ['3', '4']])
+
+    def test_writes_compressed(self) -> None:
+        write_file(self.path, 'lines', 'gzip', 'utf-8', 2, iter(['ż', 'b']))
+        with gzip.open(self.path, 'rt', encoding='utf-8') as handle:
+            self.assertEqual(handle.read(), 'ż\nb\n')
+
+    def test_sink_receives_batches(self) -> None:
+        write_batch = mock.Mock()
+        self.assertEqual(write_sink(write_batch, 2, iter(range(5))), 5)
+        self.assertSequenceEqual(write_batch.call_args_list,
+                                 [mock.call([0, 1]), mock.call([2, 3]), mock.call([4])])
+
+    def test_checks(self) -> None:
+        with self.assertRaises(ValueError):
+            check_sink('parquet', None, 1)
+        with self.assertRaises(ValueError):
+            check_sink('lines', 'zip', 1)
+        with self.assertRaisesRegex(ValueError, 'written per batch'):
+            check_sink('lines', None, 0)
+        with self.assertRaisesRegex(ValueError, 'written per batch'):
+            FluentIterator([]).toSink(print, 0)
+
+
+class FluentIteratorSinksTest(unittest.TestCase):
+
+    def test_to_file(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'out.jsonl')
+            self.assertEqual(FluentIterator(range(3)).map(lambda x: {'x': x}).toFile(path, 'jsonl'), 3)
+            self.assertSequenceEqual(FluentIterator.fromJsonl(path).collect(), [{'x': 0}, {'x': 1}, {'x': 2}])
+
+    def test_to_sink_with_sqlite(self) -> None:
+        connection = sqlite3.connect(':memory:')
+        connection.execute('CREATE TABLE items (id INTEGER, name TEXT)')
+        FluentIterator(range(10)).map(lambda x: (x, str(x))).toSink(
+            lambda rows: connection.executemany('INSERT INTO items VALUES (?, ?)', rows), batchSize=4)
+        self.assertEqual(connection.execute('SELECT COUNT(*), SUM(id) FROM items').fetchone(), (10, 45))
+        connection.close()
@@ -0,0 +1,163 @@
+from collections import Counter
+import random
+
+import unittest
+
+from pyfluent.iterator import FluentIterator
+from pyfluent.sketch import (BloomFilter, HyperLogLog, KllSketch, hash64, mix64, reservoir_sample,
+                             stable_hash64)
+
+
+class HashTest(unittest.TestCase):
+
+    def test_mix_spreads_small_integers(self) -> None:
+        self.assertNotEqual(mix64(1) >> 32, 0)
+        self.assertGreater(len({mix64(value) >> 56 for value in range(1000)}), 200)
+
+    def test_hash_is_stable_within_process(self) -> None:
+        self.assertEqual(hash64('abc'), hash64('abc'))
+
+
+class BloomFilterTest(unittest.TestCase):
+
+    def test_added_items_are_always_present(self) -> None:
+        bloom = BloomFilter(1000, 0.01)
+        for item in range(1000):
+            bloom.add(item)
+        self.assertTrue(all(item in bloom for item in range(1000)))
+
+    def test_add_reports_whether_item_was_new(self) -> None:
+        bloom = BloomFilter(10)
+        self.assertTrue(bloom.add('a'))
+        self.assertFalse(bloom.add('a'))
+
+    def test_false_positive_rate_is_close_to_requested(self) -> None:
+        bloom = BloomFilter(5000, 0.01)
+        for item in range(5000):
+            bloom.add(item)
+        false_positives = sum(item in bloom for item in range(5000, 25000))
+        self.assertLess(false_positives / 20000, 0.03)
+
+    def test_size_follows_capacity_and_error_rate(self) -> None:
+        self.assertGreater(BloomFilter(1000, 0.001).size, BloomFilter(1000, 0.01).size)
+        self.assertEqual(BloomFilter(1000, 0.01).hashes, 7)
+
+    def test_invalid_parameters(self) -> None:
+        with self.assertRaises(ValueError):
+            BloomFilter(0)
+        with self.assertRaises(ValueError):
+            BloomFilter(10, 1.5)
+
+
+class StableHashTest(unittest.TestCase):
+
+    def test_strings_are_hashed_by_their_utf8_bytes(self) -> None:
+        self.assertEqual(stable_hash64('abc'), stable_hash64(b'abc'))
+
+    def test_other_types_are_hashed_by_repr(self) -> None:
+        self.assertEqual(stable_hash64(('a', 1)), stable_hash64(repr(('a', 1))))
+
+
+class HyperLogLogTest(unittest.TestCase):
+
+    def test_estimate_is_within_error_bound(self) -> None:
+        sketch = HyperLogLog(12)
+        for item in range(50000):
+            sketch.add(item)
+            sketch.add(item)
+        self.assertAlmostEqual(sketch.count(), 50000, delta=50000 * 3 * 1.04 / 64)
+
+    def test_small_cardinalities_are_nearly_exact(self) -> None:
+        sketch = HyperLogLog(14)
+        for item in 'abcdefghij':
+            sketch.add(item)
+        self.assertEqual(sketch.count(), 10)
+
+    def test_merged_sketch_equals_sketch_of_union(self) -> None:
+        left, right, union = HyperLogLog(10), HyperLogLog(10), HyperLogLog(10)
+        for item in range(3000):
+            (left if item % 2 else right).add(item)
+            union.add(item)
+        self.assertEqual(left.merge(right).count(), union.count())
+
+    def test_invalid_precision(self) -> None:
+        with self.assertRaises(ValueError):
+            HyperLogLog(2)
+        with self.assertRaises(ValueError):
+            HyperLogLog(10).merge(HyperLogLog(11))
+
+
+class KllSketchTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.values = list(range(20000))
+        random.Random(3).shuffle(self.values)
+
+    def test_quantiles_are_within_rank_error(self) -> None:
+        sketch = KllSketch(200, seed=1)
+        for item in self.values:
+            sketch.add(item)
+        for q, estimate in zip((0.1, 0.5, 0.9), sketch.quantiles([0.1, 0.5, 0.9])):
+            self.assertAlmostEqual(estimate, q * 20000, delta=20000 * 0.02)
+
+    def test_memory_stays_bounded(self) -> None:
+        sketch = KllSketch(100, seed=1)
+        for item in self.values:
+            sketch.add(item)
+        self.assertLess(sum(map(len, sketch._compactors)), 400)
+        self.assertEqual(sketch.count, 20000)
+
+    def test_merged_sketches_estimate_union(self) -> None:
+        left, right = KllSketch(200, seed=1), KllSketch(200, seed=2)
+        for item in self.values:
+            (left if item % 3 else right).add(item)
+        merged = left.merge(right)
+        self.assertEqual(merged.count, 20000)
+        self.assertAlmostEqual(merged.quantiles([0.5])[0], 10000, delta=20000 * 0.02)
+
+    def test_empty_sketch_returns_none(self) -> None:
+        self.assertSequenceEqual(KllSketch().quantiles([0.5]), [None])
+
+    def test_invalid_arguments(self) -> None:
+        with self.assertRaises(ValueError):
+            KllSketch(2)
+        with self.assertRaises(ValueError):
+            KllSketch().quantiles([1.5])
+
+
+class ReservoirSampleTest(unittest.TestCase):
+
+    def test_short_input_is_returned_whole(self) -> None:
+        self.assertSequenceEqual(reservoir_sample(5, 1, iter([1, 2])), [1, 2])
+
+    def test_sample_has_requested_size_and_is_reproducible(self) -> None:
+        sample = reservoir_sample(10, 7, iter(range(10000)))
+        self.assertEqual(len(set(sample)), 10)
+        self.assertSequenceEqual(sample, reservoir_sample(10, 7, iter(range(10000))))
+
+    def test_sample_is_roughly_uniform(self) -> None:
+        counts = Counter()
+        for seed in range(2000):
+            counts.update(reservoir_sample(2, seed, iter(range(10))))
+        self.assertTrue(all(300 < count < 500 for count in counts.values()))
+
+    def test_invalid_size(self) -> None:
+        with self.assertRaises(ValueError):
+            reservoir_sample(-1, None, iter([]))
+
+
+class FluentIteratorSketchTest(unittest.TestCase):
+
+    def test_approx_count_distinct(self) -> None:
+        self.assertEqual(FluentIterator(['a', 'b', 'A']).approxCountDistinct(key=str.lower), 2)
+
+    def test_approx_quantiles(self) -> None:
+        self.assertSequenceEqual(FluentIterator(range(101)).approxQuantiles([0.5]), [50])
+
+    def test_sample(self) -> None:
+        self.assertEqual(len(FluentIterator(range(100)).sample(3, seed=1)), 3)
+
+    def test_sketches_work_with_parallel_reduce(self) -> None:
+        sketch = FluentIterator(map(str, range(5000))).parallelReduce(
+            HyperLogLog.add, combiner=HyperLogLog.merge, zero=HyperLogLog(12), workers=2, chunksize=500)
+        self.assertAlmostEqual(sketch.count(), 5000, delta=5000 * 0.1)
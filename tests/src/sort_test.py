@@ -0,0 +1,81 @@
+import random
+import tempfile
+
+import mock
+import unittest
+
+from pyfluent import sort
+from pyfluent.iterator import FluentIterator
+from pyfluent.pipeline import Pipeline
+from pyfluent.sort import check_k, check_memory_limit, external_sort
+
+
+class ExternalSortTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        generator = random.Random(7)
+        self.values = [generator.randrange(100) for _ in range(500)]
+
+    def test_sorts_in_memory_without_limit(self) -> None:
+        self.assertSequenceEqual(list(external_sort(None, False, None, iter(self.values))), sorted(self.values))
+
+    def test_single_run_is_not_spilled(self) -> None:
+        with mock.patch.object(sort, '_spill') as spill:
+            self.assertSequenceEqual(list(external_sort(None, True, 1000, iter(self.values))),
+                                     sorted(self.values, reverse=True))
+        spill.assert_not_called()
+
+    def test_runs_are_spilled_and_merged(self) -> None:
+        with mock.patch.object(sort, 'FRAME_SIZE', 7), mock.patch.object(sort, '_spill', wraps=sort._spill) as spill:
+            result = list(external_sort(lambda item: -item, False, 60, iter(self.values)))
+        self.assertSequenceEqual(result, sorted(self.values, reverse=True))
+        self.assertEqual(spill.call_count, 9)
+
+    def test_sort_is_stable_across_runs(self) -> None:
+        pairs = [(item % 3, index) for index, item in enumerate(self.values)]
+        result = list(external_sort(lambda pair: pair[0], False, 25, iter(pairs)))
+        self.assertSequenceEqual(result, sorted(pairs, key=lambda pair: pair[0]))
+
+    def test_spill_files_are_closed(self) -> None:
+        files = []
+        original = tempfile.TemporaryFile
+
+        def tracked():
+            files.append(original())
+            return files[-1]
+
+        with mock.patch.object(tempfile, 'TemporaryFile', tracked):
+            result = external_sort(None, False, 10, iter(self.values))
+            next(result)
+            result.close()
+        self.assertTrue(files)
+        self.assertTrue(all(spill.closed for spill in files))
+
+    def test_checks(self) -> None:
+        with self.assertRaises(ValueError):
+            check_memory_limit(0)
+        with self.assertRaises(ValueError):
+            check_k(-1)
+
+
+class FluentIteratorSortTest(unittest.TestCase):
+
+    def test_sorted_is_non_terminal(self) -> None:
+        key = mock.Mock()
+        FluentIterator([1, 2]).sorted(key=key)
+        key.assert_not_called()
+
+    def test_sorted_with_memory_limit(self) -> None:
+        result = FluentIterator([5, 3, 9, 1, 7, 2]).sorted(reverse=True, memoryLimit=2).collect()
+        self.assertSequenceEqual(result, [9, 7, 5, 3, 2, 1])
+
+    def test_sorted_in_pipeline(self) -> None:
+        self.assertSequenceEqual(Pipeline().sorted(key=len).run(['ccc', 'a', 'bb']).collect(), ['a', 'bb', 'ccc'])
+
+    def test_top_k(self) -> None:
+        self.assertSequenceEqual(FluentIterator(range(100)).topK(3), [99, 98, 97])
+        self.assertSequenceEqual(FluentIterator(['a', 'ccc', 'bb']).topK(1, key=len), ['ccc'])
+
+    def test_bottom_k(self) -> None:
+        self.assertSequenceEqual(FluentIterator([5, 3, 9, 1]).bottomK(2), [1, 3])
+        self.assertSequenceEqual(FluentIterator([5, 3]).bottomK(0), [])
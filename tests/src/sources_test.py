@@ -0,0 +1,187 @@
+import bz2
+import csv
+import gzip
+import io
+import json
+import lzma
+import os
+import tempfile
+from typing import Callable, List
+import unittest
+
+import mock
+
+from pyfluent import sources
+from pyfluent.iterator import FluentIterator
+from pyfluent.sources import (byte_range, check_compression, check_partition, infer_compression, read_blocks, read_csv,
+                              read_jsonl, read_lines)
+
+
+class SourcesTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write(self, content: bytes) -> str:
+        path = os.path.join(self.directory.name, 'data')
+        with open(path, 'wb') as handle:
+            handle.write(content)
+        return path
+
+    def test_reads_text_lines(self) -> None:
+        path = self.write('zażółć\ngęślą\n\njaźń\n'.encode())
+        self.assertSequenceEqual(list(read_lines(path, block_size=3)), ['zażółć', 'gęślą', '', 'jaźń'])
+
+    def test_translates_line_endings_in_text_mode(self) -> None:
+        path = self.write(b'a\r\nb\rc\n')
+        self.assertSequenceEqual(list(read_lines(path, block_size=2)), ['a', 'b', 'c'])
+        self.assertSequenceEqual(list(read_lines(path, True)), [b'a\r', b'b\rc'])
+
+    def test_reads_binary_lines_without_trailing_newline(self) -> None:
+        path = self.write(b'a\nbb\nccc')
+        self.assertSequenceEqual(list(read_lines(path, True, block_size=2)), [b'a', b'bb', b'ccc'])
+
+    def test_reads_empty_file(self) -> None:
+        self.assertSequenceEqual(list(read_lines(self.write(b''))), [])
+
+    def test_partitions_cover_each_line_once(self) -> None:
+        lines = [str(i) * (i % 7) for i in range(500)]
+        path = self.write('\n'.join(lines).encode())
+        for partitions in (1, 2, 3, 7, 64):
+            for block_size in (1, 5, 4096):
+                result = []
+                for partition in range(partitions):
+                    result.extend(read_lines(path, partition=partition, partitions=partitions,
+                                             block_size=block_size))
+                self.assertSequenceEqual(result, lines)
+
+    def test_byte_range(self) -> None:
+        self.assertEqual([byte_range(10, p, 3) for p in range(3)], [(0, 3), (3, 6), (6, 10)])
+
+    def test_checks(self) -> None:
+        with self.assertRaises(ValueError):
+            check_partition(0, 0)
+        with self.assertRaises(ValueError):
+            check_partition(2, 2)
+        with self.assertRaises(ValueError):
+            list(read_blocks(self.write(b'a'), block_size=0))
+
+    def test_reads_jsonl(self) -> None:
+        records = [{'id': i, 'name': 'n%d' % i} for i in range(100)]
+        path = self.write(b'\n'.join(json.dumps(record).encode() for record in records) + b'\n\n')
+        self.assertSequenceEqual(list(read_jsonl(path)), records)
+        halves = [list(read_jsonl(path, partition=p, partitions=2)) for p in range(2)]
+        self.assertTrue(all(halves))
+        self.assertSequenceEqual(halves[0] + halves[1], records)
+
+    def test_reads_csv(self) -> None:
+        path = self.write(b'a,b\n1,2\n3,"4,5"\n')
+        self.assertSequenceEqual(list(read_csv(path)), [{'a': '1', 'b': '2'}, {'a': '3', 'b': '4,5'}])
+        self.assertSequenceEqual(list(read_csv(path, header=False)), [['a', 'b'], ['1', '2'], ['3', '4,5']])
+        self.assertSequenceEqual(list(read_csv(path, partition=1, partitions=2)), [{'a': '3', 'b': '4,5'}])
+
+    def test_reads_csv_with_newlines_in_quoted_fields(self) -> None:
+        content = 'a,b\r\n"x\ny","1\r\n2"\r\n\r\nz,3\r\n'
+        path = self.write(content.encode())
+        for block_size in (1, 4096):
+            self.assertSequenceEqual(list(read_csv(path, block_size=block_size)),
+                                     list(csv.DictReader(io.StringIO(content, newline=''))))
+
+
+class FluentIteratorSourcesTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        handle = tempfile.NamedTemporaryFile('w', delete=False)
+        handle.write('{"x": 1}\n{"x": 2}\n')
+        handle.close()
+        self.path = handle.name
+        self.addCleanup(os.unlink, self.path)
+
+    def test_from_lines(self) -> None:
+        self.assertSequenceEqual(FluentIterator.fromLines(self.path, binary=True).collect(),
+                                 [b'{"x": 1}', b'{"x": 2}'])
+
+    def test_from_jsonl(self) -> None:
+        self.assertSequenceEqual(FluentIterator.fromJsonl(self.path).map(lambda r: r['x']).collect(), [1, 2])
+
+    def test_from_csv(self) -> None:
+        self.assertSequenceEqual(FluentIterator.fromCsv(self.path, header=False, delimiter=':').collect(),
+                                 [['{"x"', ' 1}'], ['{"x"', ' 2}']])
+
+    def test_checks_partition_eagerly(self) -> None:
+        with self.assertRaises(ValueError):
+            FluentIterator.fromJsonl(self.path, partition=3, partitions=2)
+
+
+class CompressedSourcesTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.lines = ['line %d %s' % (i, 'x' * (i % 13)) for i in range(2000)]
+
+    def write(self, name: str, members: List[bytes]) -> str:
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'wb') as handle:
+            handle.writelines(members)
+        return path
+
+    def members(self, compress: Callable[[bytes], bytes], count: int) -> List[bytes]:
+        size = -(-len(self.lines) // count)
+        parts = [self.lines[i:i + size] for i in range(0, len(self.lines), size)]
+        return [compress(''.join(line + '\n' for line in part).encode()) for part in parts]
+
+    def test_reads_each_format_sequentially_and_in_parallel(self) -> None:
+        for name, compress in (('gz', gzip.compress), ('bz2', bz2.compress), ('xz', lzma.compress)):
+            for count in (1, 7):
+                path = self.write('data.' + name, self.members(compress, count))
+                for workers in (1, 3):
+                    self.assertSequenceEqual(list(read_lines(path, block_size=100, compression='infer',
+                                                             workers=workers)), self.lines)
+
+    def test_false_member_headers_are_decoded_sequentially(self) -> None:
+        stored = gzip.compress(b'a\n\x1f\x8b\x08 inside\nb\n', compresslevel=0)
+        path = self.write('data.gz', [gzip.compress(b'first\n'), stored, gzip.compress(b'last\n')])
+        expected = [b'first', b'a', b'\x1f\x8b\x08 inside', b'b', b'last']
+        self.assertSequenceEqual(list(read_lines(path, True, compression='gzip', workers=4)), expected)
+
+    def test_members_over_the_limit_are_decoded_sequentially(self) -> None:
+        path = self.write('data.gz', self.members(gzip.compress, 4))
+        with mock.patch.object(sources, 'MEMBER_LIMIT', 1000), mock.patch.object(sources, 'SEGMENT_STEP', 64):
+            small, large = gzip.compress(b'x' * 1000), gzip.compress(b'x' * 1001)
+            self.assertEqual(sources._decode_segment('gzip', memoryview(small), (0, len(small))), b'x' * 1000)
+            self.assertIsNone(sources._decode_segment('gzip', memoryview(large), (0, len(large))))
+            self.assertSequenceEqual(list(read_lines(path, compression='gzip', workers=2)), self.lines)
+
+    def test_truncated_file_is_reported(self) -> None:
+        path = self.write('data.gz', self.members(gzip.compress, 2))
+        with open(path, 'r+b') as handle:
+            handle.truncate(os.path.getsize(path) - 10)
+        for workers in (1, 2):
+            with self.assertRaises(EOFError):
+                list(read_lines(path, compression='gzip', workers=workers))
+
+    def test_reads_compressed_csv_with_header(self) -> None:
+        path = self.write('data.csv.gz', [gzip.compress(b'a,b\n1,2\n')])
+        self.assertSequenceEqual(list(read_csv(path, compression='infer')), [{'a': '1', 'b': '2'}])
+
+    def test_checks(self) -> None:
+        with self.assertRaises(ValueError):
+            check_compression('zip', 1, 1)
+        with self.assertRaises(ValueError):
+            check_compression('gzip', 2, 1)
+        with self.assertRaises(ValueError):
+            check_compression('gzip', 1, 0)
+        with mock.patch.object(sources, 'zstandard', None):
+            with self.assertRaises(ImportError):
+                check_compression('zstd', 1, 1)
+
+    def test_infers_compression_from_extension(self) -> None:
+        self.assertEqual(infer_compression('logs.jsonl.xz'), 'xz')
+        self.assertIsNone(infer_compression('logs.jsonl'))
+
+    def test_from_jsonl_with_compression(self) -> None:
+        path = self.write('data.jsonl.gz', [gzip.compress(b'{"x": 1}\n'), gzip.compress(b'{"x": 2}\n')])
+        result = FluentIterator.fromJsonl(path, compression='gzip', workers=2).map(lambda r: r['x']).collect()
+        self.assertSequenceEqual(result, [1, 2])
@@ -0,0 +1,94 @@
+from collections import deque
+from itertools import islice
+import unittest
+
+import mock
+
+from pyfluent import views
+from pyfluent.iterator import FluentIterator
+from pyfluent.views import SequenceView, Slicer, check_slice, slice_source, sliceable
+
+requires_numpy = unittest.skipIf(views.numpy is None, 'numpy is not installed')
+
+
+class SequenceViewTest(unittest.TestCase):
+
+    def test_view_reads_through_to_sequence(self) -> None:
+        data = list('abcdefgh')
+        view = SequenceView(data, range(2, 8, 2))
+        self.assertEqual(len(view), 3)
+        self.assertSequenceEqual(list(view), ['c', 'e', 'g'])
+        self.assertEqual(view[-1], 'g')
+
+    def test_slicing_a_view_composes_indices(self) -> None:
+        view = SequenceView(list(range(100)), range(10, 90))[5:20:5]
+        self.assertIsInstance(view, SequenceView)
+        self.assertSequenceEqual(list(view), [15, 20, 25])
+
+
+class SliceSourceTest(unittest.TestCase):
+
+    def test_recognizes_sliceable_sources(self) -> None:
+        self.assertTrue(sliceable([1]))
+        self.assertTrue(sliceable(range(1)))
+        self.assertTrue(sliceable(memoryview(b'a')))
+        self.assertFalse(sliceable(iter([1])))
+        self.assertFalse(sliceable({1}))
+        self.assertFalse(sliceable(deque([1])))
+
+    def test_lists_are_not_copied(self) -> None:
+        self.assertIsInstance(slice_source([1, 2, 3], slice(1, None)), SequenceView)
+
+    def test_native_slicing(self) -> None:
+        self.assertEqual(slice_source(range(10), slice(2, 5)), range(2, 5))
+        self.assertEqual(slice_source(memoryview(b'abcd'), slice(1, 3)).tobytes(), b'bc')
+
+    @requires_numpy
+    def test_numpy_arrays_are_sliced_as_views(self) -> None:
+        array = views.numpy.arange(10)
+        self.assertIs(slice_source(array, slice(2, None)).base, array)
+
+    def test_slicer(self) -> None:
+        slicer = Slicer(1, 7, 2)
+        self.assertSequenceEqual(list(slicer(iter(range(10)))), [1, 3, 5])
+        self.assertEqual(slicer.length(10), 3)
+        self.assertEqual(slicer.length(4), 2)
+
+    def test_checks(self) -> None:
+        with self.assertRaises(ValueError):
+            check_slice(-1, None, 1)
+        with self.assertRaises(ValueError):
+            check_slice(0, -1, 1)
+        with self.assertRaises(ValueError):
+            check_slice(0, None, 0)
+
+
+class FluentIteratorViewsTest(unittest.TestCase):
+
+    def test_positional_stages_slice_sequence_sources(self) -> None:
+        with mock.patch('pyfluent.views.islice', side_effect=islice) as sliced:
+            itr = FluentIterator(list(range(100))).skip(10).take(50).slice(0, None, 10)
+            self.assertSequenceEqual(itr.collect(), [10, 20, 30, 40, 50])
+        sliced.assert_not_called()
+
+    def test_sequences_with_slow_indexing_are_iterated(self) -> None:
+        with mock.patch('pyfluent.views.islice', side_effect=islice) as sliced:
+            self.assertSequenceEqual(FluentIterator(deque(range(10))).skip(7).collect(), [7, 8, 9])
+        sliced.assert_called_once()
+
+    def test_positional_stages_after_other_stages_iterate(self) -> None:
+        itr = FluentIterator(range(10)).map(str).skip(7)
+        self.assertEqual(itr.explain(), 'source(range)\nmap(str)\nskip(7)')
+        self.assertSequenceEqual(itr.collect(), ['7', '8', '9'])
+
+    def test_limit_is_take(self) -> None:
+        self.assertSequenceEqual(FluentIterator(iter('abc')).limit(2).collect(), ['a', 'b'])
+
+    def test_last(self) -> None:
+        self.assertEqual(FluentIterator(range(10 ** 12)).skip(1).last(), 10 ** 12 - 1)
+        self.assertEqual(FluentIterator(iter('abc')).last(), 'c')
+        self.assertIsNone(FluentIterator([]).last())
+        self.assertIsNone(FluentIterator(iter([])).last())
+
+    def test_count_of_large_range_is_immediate(self) -> None:
+        self.assertEqual(FluentIterator(range(10 ** 12)).slice(5, None, 5).count(), 2 * 10 ** 11 - 1)
@@ -0,0 +1,118 @@
+from collections import deque
+from statistics import mean
+
+import mock
+import unittest
+
+from pyfluent.iterator import FluentIterator
+from pyfluent.window import WindowView, check_aggregate, check_window, rolling, windows
+
+
+class WindowViewTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.buffer = deque([1, 2, 3])
+        self.view = WindowView(self.buffer)
+
+    def test_view_reflects_buffer_without_copying(self) -> None:
+        self.buffer.append(4)
+        self.assertSequenceEqual(list(self.view), [1, 2, 3, 4])
+
+    def test_view_supports_sequence_protocol(self) -> None:
+        self.assertEqual(len(self.view), 3)
+        self.assertEqual(self.view[-1], 3)
+        self.assertEqual(self.view[1:], [2, 3])
+        self.assertIn(2, self.view)
+        self.assertEqual(self.view, (1, 2, 3))
+
+    def test_view_is_read_only(self) -> None:
+        with self.assertRaises(TypeError):
+            self.view[0] = 5
+
+
+class WindowsTest(unittest.TestCase):
+
+    def collect(self, size, step, incomplete, values):
+        return [tuple(window) for window in windows(size, step, incomplete, True, iter(values))]
+
+    def test_tumbling_windows(self) -> None:
+        self.assertSequenceEqual(self.collect(2, 2, False, range(5)), [(0, 1), (2, 3)])
+
+    def test_tumbling_windows_with_incomplete_tail(self) -> None:
+        self.assertSequenceEqual(self.collect(2, 2, True, range(5)), [(0, 1), (2, 3), (4,)])
+
+    def test_sliding_windows(self) -> None:
+        self.assertSequenceEqual(self.collect(3, 1, False, range(5)), [(0, 1, 2), (1, 2, 3), (2, 3, 4)])
+
+    def test_hopping_windows_skip_items(self) -> None:
+        self.assertSequenceEqual(self.collect(2, 3, True, range(8)), [(0, 1), (3, 4), (6, 7)])
+
+    def test_no_windows_for_short_input(self) -> None:
+        self.assertSequenceEqual(self.collect(3, 1, False, range(2)), [])
+        self.assertSequenceEqual(self.collect(3, 1, True, []), [])
+
+    def test_windows_are_snapshots_by_default(self) -> None:
+        self.assertSequenceEqual(list(windows(2, 1, True, False, iter(range(4)))), [(0, 1), (1, 2), (2, 3), (3,)])
+
+    def test_same_view_is_reused_on_request(self) -> None:
+        result = list(windows(2, 1, False, True, iter(range(4))))
+        self.assertIs(result[0], result[1])
+
+    def test_checks(self) -> None:
+        with self.assertRaises(ValueError):
+            check_window(0, 1)
+        with self.assertRaises(ValueError):
+            check_window(1, 0)
+        with self.assertRaises(ValueError):
+            check_aggregate('median')
+
+
+class RollingTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.values = [5, 1, 4, 2, 8, 3, 3, 9, 0]
+
+    def expected(self, size, function):
+        return [function(self.values[index - size + 1:index + 1]) for index in range(size - 1, len(self.values))]
+
+    def test_incremental_aggregates_match_naive(self) -> None:
+        for name, function in (('sum', sum), ('mean', mean), ('min', min), ('max', max)):
+            for size in (1, 2, 3, 5):
+                self.assertSequenceEqual(list(rolling(size, name, False, iter(self.values))),
+                                         self.expected(size, function), '%s/%d' % (name, size))
+
+    def test_incomplete_windows_are_aggregated(self) -> None:
+        self.assertSequenceEqual(list(rolling(2, 'max', True, iter([1, 3, 2]))), [1, 3, 3])
+        self.assertSequenceEqual(list(rolling(3, 'mean', True, iter([2, 4]))), [2, 3])
+
+    def test_callable_aggregate_receives_window_view(self) -> None:
+        aggregate = mock.Mock(side_effect=len)
+        self.assertSequenceEqual(list(rolling(2, aggregate, False, iter(range(3)))), [2, 2])
+        self.assertIsInstance(aggregate.call_args[0][0], WindowView)
+
+
+class FluentIteratorWindowTest(unittest.TestCase):
+
+    def test_window(self) -> None:
+        result = FluentIterator(range(6)).window(3, 2).map(tuple).collect()
+        self.assertSequenceEqual(result, [(0, 1, 2), (2, 3, 4)])
+
+    def test_windows_can_be_collected_and_prefetched(self) -> None:
+        self.assertSequenceEqual(FluentIterator(range(5)).window(2, 1).collect(), [(0, 1), (1, 2), (2, 3), (3, 4)])
+        result = FluentIterator(range(10)).window(3, 1).prefetch(4).map(sum).collect()
+        self.assertSequenceEqual(result, [sum(range(start, start + 3)) for start in range(8)])
+
+    def test_window_view_is_opt_in(self) -> None:
+        result = FluentIterator(range(6)).window(3, 1, view=True).map(sum).collect()
+        self.assertSequenceEqual(result, [3, 6, 9, 12])
+
+    def test_window_rejects_invalid_size(self) -> None:
+        with self.assertRaises(ValueError):
+            FluentIterator([]).window(0)
+
+    def test_rolling(self) -> None:
+        self.assertSequenceEqual(FluentIterator([1, 2, 3, 4]).rolling(2, 'sum').collect(), [3, 5, 7])
+
+    def test_rolling_rejects_unknown_aggregate(self) -> None:
+        with self.assertRaises(ValueError):
+            FluentIterator([]).rolling(2, 'median')